@@ -1,12 +1,8 @@
 #!/bin/bash
 set -e
 
-run_and_sample() {
-  local module="$1"
-  local path="$2"
-
-  echo "Running $module..."
-  python -m "$module"
+sample() {
+  local path="$1"
 
   echo "Sample from $path"
   local file
@@ -23,8 +19,11 @@ run_and_sample() {
   echo "-----"
 }
 
-run_and_sample src.crawlers.academic_calendar "data/raw/academic_calendar/*/data.json"
-run_and_sample src.crawlers.shuttle_bus data/raw/shuttle_bus/data.json
-run_and_sample src.crawlers.graduation_req data/raw/graduation_req/data.csv
-run_and_sample src.crawlers.meals "data/raw/meals/*.json"
-run_and_sample src.crawlers.notices "data/raw/notices/*.csv"
+echo "Running crawlers..."
+python -m src.offline_crawl
+
+sample "data/raw/academic_calendar/*/data.json"
+sample data/raw/shuttle_bus/data.json
+sample data/raw/graduation_req/data.csv
+sample "data/raw/meals/*.json"
+sample "data/raw/notices/*.csv"
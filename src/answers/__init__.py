@@ -1,16 +1,158 @@
 from __future__ import annotations
 
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterator
 
 from importlib import import_module
 from src.utils.config import settings
 
 
-def ensure_offline_db(days: int = 7) -> None:
-    """Run offline crawler when ``data/raw`` is empty."""
-    root = settings.data_dir / "raw"
-    if not root.exists() or not any(root.iterdir()):
-        year = datetime.now().year
-        build_offline_db = import_module("src.offline_crawl").build_offline_db
-        build_offline_db(year - 1, year, days)
+def _scheduler():
+    return import_module("src.scheduler").get_scheduler()
+
+
+@dataclass
+class AnswerBudget:
+    """Deadline of one question and the sources it answered from stale data."""
+
+    deadline: float
+    stale: set[str] = field(default_factory=set)
+
+    def remaining(self) -> float:
+        return self.deadline - time.monotonic()
+
+    @property
+    def fresh(self) -> bool:
+        return not self.stale
+
+
+_budget: ContextVar[AnswerBudget | None] = ContextVar("answer_budget", default=None)
+
+# questions answered per freshness, plus stale answers per source
+_freshness = {"fresh": 0, "stale": 0}
+_stale_sources: dict[str, int] = {}
+_freshness_lock = threading.Lock()
+
+
+@contextmanager
+def answer_budget(seconds: float | None = None) -> Iterator[AnswerBudget]:
+    """Run the answer handlers called in this block under a deadline.
+
+    Handlers wait for a background refresh only while the budget allows and
+    otherwise answer from the local data they have, marking it stale.
+    """
+    seconds = settings.answer_deadline if seconds is None else seconds
+    budget = AnswerBudget(time.monotonic() + seconds)
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget.reset(token)
+        with _freshness_lock:
+            _freshness["fresh" if budget.fresh else "stale"] += 1
+            for source in budget.stale:
+                _stale_sources[source] = _stale_sources.get(source, 0) + 1
+
+
+def freshness_stats() -> dict:
+    """Counts of fresh and stale answers since start-up."""
+    with _freshness_lock:
+        total = _freshness["fresh"] + _freshness["stale"]
+        return {
+            **_freshness,
+            "stale_rate": _freshness["stale"] / total if total else 0.0,
+            "stale_sources": dict(_stale_sources),
+        }
+
+
+def mark_stale(source: str) -> None:
+    """Record that the current answer uses stale or incomplete ``source`` data."""
+    budget = _budget.get()
+    if budget is not None:
+        budget.stale.add(source)
+
+
+def _wait(key: str, source: str) -> bool:
+    """Wait for job ``key`` within the current budget, keeping time to answer."""
+    budget = _budget.get()
+    if budget is not None:
+        timeout = budget.remaining() - settings.answer_reserve
+        if timeout > 0 and _scheduler().wait(key, timeout):
+            return True
+    mark_stale(source)
+    return False
+
+
+def recent_changes(source: str, scope: str | None = None) -> list[dict]:
+    """Records of ``source`` added or removed within ``settings.change_window``.
+
+    Read from the store's change log (newest first) instead of re-crawling
+    and diffing snapshots; each record carries ``change`` (``added`` or
+    ``removed``) and ``changed_at``.
+    """
+    store = import_module("src.crawlers.store").get_store()
+    since = int(time.time() - settings.change_window)
+    return store.changes(source, since=since, scope=scope, limit=settings.change_limit)
+
+
+def describe_changes(changes: list[dict], describe: Callable[[dict], str]) -> str:
+    """Answer text listing ``changes``, each rendered by ``describe``."""
+    if not changes:
+        return "최근 변동 사항이 없습니다."
+    lines = []
+    for c in changes:
+        when = datetime.fromtimestamp(c["changed_at"]).strftime("%m-%d %H:%M")
+        label = "추가" if c["change"] == "added" else "삭제"
+        lines.append(f"- [{label}] {describe(c)} ({when})")
+    return "최근 변동 사항입니다.\n" + "\n".join(lines)
+
+
+def ensure_offline_db(source: str | None = None) -> None:
+    """Make sure the start-up readiness check ran and the scheduler is up.
+
+    The check (see :mod:`src.readiness`) runs once per process; sources
+    missing locally are refreshed in the background. While that runs, an
+    answer from ``source`` is marked stale only if ``source`` is one of the
+    missing ones (any answer when ``source`` is not given).
+    """
+    readiness = import_module("src.readiness").get_readiness()
+    if not readiness.checked:
+        readiness.check()
+    if readiness.building and (source is None or not readiness.is_ready(source)):
+        mark_stale("cold_start")
+    _scheduler()
+
+
+def request_refresh(
+    key: str,
+    fn: Callable[[], object],
+    wait: bool = False,
+    source: str | None = None,
+) -> bool:
+    """Run ``fn`` in the background; concurrent requests for ``key`` share one run.
+
+    With ``wait`` the caller blocks until the job finishes or the request
+    deadline is near. Returns True when the job has finished; otherwise the
+    answer is marked stale for ``source`` (default: ``key``).
+    """
+    _scheduler().submit(key, fn)
+    if not wait:
+        return False
+    return _wait(key, source or key)
+
+
+def trigger_refresh(source: str) -> None:
+    """Refresh a scheduled source (``meals``, ``notices``, ...) in the background.
+
+    A whole-source crawl (the notice boards take minutes) is never awaited
+    inside a request; the current answer is marked stale instead. Use
+    :func:`request_refresh` with a narrow key (one date, one year) to wait.
+    """
+    _scheduler().trigger(source)
+    mark_stale(source)
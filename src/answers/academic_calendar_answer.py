@@ -1,10 +1,11 @@
 from pathlib import Path
-import json
 import re
 from datetime import datetime, date
-from ..crawlers.academic_calendar import AcademicCalendarCrawler
+from ..crawlers.registry import get_crawler
+from ..crawlers.store import get_store
 from ..retrieval.rag_pipeline import HybridRetriever
-from . import ensure_offline_db
+from . import describe_changes, ensure_offline_db, mark_stale, recent_changes, request_refresh
+from src.utils.loader_cache import get_loader_cache
 from src.utils.time_parser import TimeParser, is_holiday
 
 OUT_DIR = Path('data/raw/academic_calendar')
@@ -12,14 +13,18 @@ OUT_DIR = Path('data/raw/academic_calendar')
 
 def _load_items(path: Path):
     """Return list of events or ``None`` when JSON decoding fails."""
-    if not path.exists():
-        return []
-    with path.open(encoding='utf-8') as f:
-        try:
-            return json.load(f).get('items', [])
-        except json.JSONDecodeError:
-            # Invalid JSON indicates an outdated cache. Trigger a recrawl.
-            return None
+    # Invalid JSON indicates an outdated cache; the caller triggers a recrawl.
+    return get_loader_cache().load_items(path, default=None)
+
+
+def _stored_events(year: int, month: int | None = None, day: int | None = None) -> list[dict]:
+    """Indexed store query, memoized until the events table changes."""
+    store = get_store()
+    return get_loader_cache().get(
+        ('events', year, month, day),
+        store.version('events'),
+        lambda: store.events(year, month, day),
+    )
 
 
 def _parse_year_month_day(q: str):
@@ -50,33 +55,43 @@ def _search_fallback(question: str) -> str | None:
 def get_context(question: str) -> tuple[list[dict], tuple[int|None,int|None,int|None], str]:
     """Return matching academic calendar events as context.
 
-    If cached JSON data is missing or corrupted, the crawler will attempt
-    to fetch and rebuild the cache before continuing.
+    Events are queried from the local store by year and month. When the
+    store has no rows for the year, the exported JSON is used instead; if
+    that is missing, empty or corrupted, a crawl is started in the background
+    and awaited within the request deadline. Past the deadline the question
+    is answered from what is available now and marked stale.
+
+    Update questions get the logged changes (of the asked year, if any)
+    with status ``"changes"``.
     """
-    ensure_offline_db()
+    ensure_offline_db("academic_calendar")
     year, month, day, status = _parse_year_month_day(question)
-    year = year or datetime.now().year
-    path = OUT_DIR / str(year) / 'data.json'
-    if not path.exists():
-        crawler = AcademicCalendarCrawler(OUT_DIR, year)
-        crawler.run()
-    items = _load_items(path)
-    if items is None or not items:
-        crawler = AcademicCalendarCrawler(OUT_DIR, year)
-        if crawler.run():
-            items = _load_items(path) or []
-        else:
-            items = []
-
     if _has_update_request(question):
-        prev_set = {json.dumps(it, ensure_ascii=False, sort_keys=True) for it in items}
-        crawler = AcademicCalendarCrawler(OUT_DIR, year)
-        if crawler.run():
-            new_items = _load_items(path)
-            new_set = {json.dumps(it, ensure_ascii=False, sort_keys=True) for it in new_items}
-            diff = [json.loads(s) for s in new_set - prev_set]
-            return diff, (year, month, day), "exact"
-        return [], (year, month, day), "exact"
+        scope = str(year) if year else None
+        return recent_changes('academic_calendar', scope), (year, month, day), "changes"
+    year = year or datetime.now().year
+    items = None
+    if not _stored_events(year):
+        path = OUT_DIR / str(year) / 'data.json'
+        items = _load_items(path)
+        if not items:
+            # a corrupted cache must be rewritten even if the page is unchanged
+            force = items is None
+            AcademicCalendarCrawler = get_crawler('academic_calendar')
+            crawled = request_refresh(
+                f'academic_calendar:{year}',
+                lambda: AcademicCalendarCrawler(OUT_DIR, year).run(force=force),
+                wait=True,
+                source='academic_calendar',
+            )
+            if crawled and _stored_events(year):
+                items = None
+            else:
+                mark_stale('academic_calendar')
+                items = items or []
+
+    if items is None:
+        return _stored_events(year, month, day), (year, month, day), status
 
     def _filter(records: list[dict]) -> list[dict]:
         if month is None:
@@ -88,21 +103,17 @@ def get_context(question: str) -> tuple[list[dict], tuple[int|None,int|None,int|
                     matched.append(it)
         return matched
 
-    matches = _filter(items)
-    if not matches:
-        crawler = AcademicCalendarCrawler(OUT_DIR, year)
-        if crawler.run():
-            items = _load_items(path)
-            matches = _filter(items)
-    return matches, (year, month, day), status
+    return _filter(items), (year, month, day), status
 
 
 def generate_answer(question: str) -> str:
     context, (year, month, day), status = get_context(question)
+    if status == "changes":
+        return describe_changes(context, lambda c: f"{c.get('date')} {c.get('event')}")
     if month and day:
-        dt = date(year, month, day)
-        if is_holiday(dt):
-            return f"{is_holiday(dt)}은 공휴일입니다."
+        holiday = is_holiday(date(year, month, day))
+        if holiday:
+            return f"{holiday}은 공휴일입니다."
 
     if not context:
         fb = _search_fallback(question)
@@ -0,0 +1,122 @@
+"""Cache of rule-based answers, invalidated by the store's data versions."""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Hashable
+
+from src.utils.config import settings
+from src.utils.time_parser import TimeParser
+from ..crawlers.store import get_store
+from . import _budget
+
+# classifier label -> store table the handler answers from
+LABEL_TABLES = {
+    0: "requirements",
+    1: "notices",
+    2: "events",
+    3: "meals",
+    4: "shuttle",
+}
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """Question text with case, spacing and trailing punctuation folded."""
+    return _SPACE_RE.sub(" ", question).strip().rstrip("?!.~ ").lower()
+
+
+class AnswerCache:
+    """LRU cache of answers with a time-to-live.
+
+    Keys include the data version of the source a handler reads, so a crawl
+    that saves new records makes the old answers unreachable; the TTL bounds
+    answers that depend on the clock (e.g. the change-log window).
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, answer: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def answer_key(label: int, question: str) -> tuple:
+    """(label, normalized question, resolved date, data version) of a question."""
+    base = datetime.now().date()
+    resolved, _ = TimeParser(question).parse(base)
+    table = LABEL_TABLES.get(label)
+    version = get_store().version(table) if table else 0
+    return label, normalize_question(question), resolved.isoformat(), version
+
+
+def cached_answer(label: int, question: str, handler: Callable[[str], str]) -> str:
+    """Return ``handler(question)``, reusing a cached answer for the same key.
+
+    Only answers built from fresh data are cached; a stale answer is
+    recomputed by the next question so it can pick up the refresh.
+    Freshness is only tracked inside :func:`answer_budget`, so answers of
+    direct calls outside one are never stored.
+    """
+    cache = get_answer_cache()
+    key = answer_key(label, question)
+    answer = cache.get(key)
+    if answer is not None:
+        return answer
+    answer = handler(question)
+    budget = _budget.get()
+    if budget is not None and budget.fresh:
+        cache.put(key, answer)
+    return answer
+
+
+_cache: AnswerCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_answer_cache() -> AnswerCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = AnswerCache(settings.answer_cache_entries, settings.answer_cache_ttl)
+    return _cache
@@ -0,0 +1,217 @@
+"""Department name resolution shared by the notice and graduation answers."""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from typing import Collection, Iterable
+
+from src.utils.config import settings
+from ..crawlers.registry import crawler_attr
+from ..crawlers.store import get_store
+
+LINKS_FILE = settings.data_dir / "links.txt"
+
+# common abbreviations and former names -> official department name
+ALIASES = {
+    "컴공": "컴퓨터융합학부",
+    "컴퓨터공학과": "컴퓨터융합학부",
+    "컴퓨터학과": "컴퓨터융합학부",
+    "컴융": "컴퓨터융합학부",
+    "인공지능과": "인공지능학과",
+    "국문과": "국어국문학과",
+    "영문과": "영어영문학과",
+    "독문과": "독어독문학과",
+    "불문과": "불어불문학과",
+    "중문과": "중어중문학과",
+    "일문과": "일어일문학과",
+    "정외과": "정치외교학과",
+    "신방과": "언론정보학과",
+    "사복과": "사회복지학과",
+    "문정과": "문헌정보학과",
+    "통계학과": "정보통계학과",
+    "정통과": "정보통계학과",
+    "경영과": "경영학부",
+    "경영학과": "경영학부",
+    "경제과": "경제학과",
+    "행정학과": "행정학부",
+    "기계과": "기계공학부",
+    "기계공학과": "기계공학부",
+    "전기과": "전기공학과",
+    "전자과": "전자공학과",
+    "화공과": "응용화학공학과",
+    "신소재과": "신소재공학과",
+    "항공우주과": "항공우주공학과",
+    "건축과": "건축학과",
+    "토목과": "토목공학과",
+    "환경과": "환경공학과",
+    "수교과": "수학교육과",
+    "영교과": "영어교육과",
+    "국교과": "국어교육과",
+    "체교과": "체육교육과",
+    "간호과": "간호학과",
+    "약대": "약학대학",
+    "의대": "의과대학",
+    "공대": "공과대학",
+}
+
+# score (Dice coefficient of character bigrams) needed for a fuzzy match
+MIN_SCORE = 0.5
+
+# particle trailing a Korean word ("컴퓨터공학과의" -> "컴퓨터공학과")
+PARTICLE_RE = re.compile(r"(으로|에서|에게|은|는|이|가|을|를|에|의|와|과|도|만|로)$")
+
+# seconds between checks of links.txt and the store versions
+STAMP_INTERVAL = 5.0
+
+
+def normalize_dept(name: str) -> str:
+    """Department key: whitespace and punctuation removed."""
+    return re.sub(r"[^\w가-힣]", "", name or "")
+
+
+def _grams(key: str) -> set[str]:
+    if len(key) < 2:
+        return {key} if key else set()
+    return {key[i:i + 2] for i in range(len(key) - 1)}
+
+
+class DeptResolver:
+    """Map free-form department mentions to official department names.
+
+    Names are de-duplicated by :func:`normalize_dept`. A query resolves to
+    the exact name or alias when there is one; otherwise names sharing
+    character bigrams with it are scored by Dice coefficient using a
+    precomputed bigram index. Results are memoized per query.
+    """
+
+    def __init__(self, names: Iterable[str], aliases: dict[str, str] | None = None, stamp=None):
+        self.stamp = stamp
+        self.names: dict[str, str] = {}
+        for name in names:
+            key = normalize_dept(name)
+            if key:
+                self.names.setdefault(key, name)
+        self.aliases = {
+            normalize_dept(alias): normalize_dept(target)
+            for alias, target in (ALIASES if aliases is None else aliases).items()
+            if normalize_dept(target) in self.names
+        }
+        self._gram_sizes: dict[str, int] = {}
+        self._index: dict[str, list[str]] = {}
+        for key in self.names:
+            grams = _grams(key)
+            self._gram_sizes[key] = len(grams)
+            for g in grams:
+                self._index.setdefault(g, []).append(key)
+        self._memo: dict[str, list[tuple[str, float]]] = {}
+        self._lock = threading.Lock()
+
+    def _ranked(self, key: str) -> list[tuple[str, float]]:
+        """All candidate keys for ``key`` with their score, best first."""
+        ranked = self._memo.get(key)
+        if ranked is not None:
+            return ranked
+        target = self.aliases.get(key, key)
+        if target in self.names:
+            ranked = [(target, 1.0)]
+        else:
+            grams = _grams(key)
+            common: dict[str, int] = {}
+            for g in grams:
+                for name in self._index.get(g, ()):
+                    common[name] = common.get(name, 0) + 1
+            ranked = sorted(
+                (
+                    (name, 2 * n / (len(grams) + self._gram_sizes[name]))
+                    for name, n in common.items()
+                ),
+                key=lambda item: (-item[1], len(item[0])),
+            )
+        with self._lock:
+            if len(self._memo) > 4096:
+                self._memo.clear()
+            self._memo[key] = ranked
+        return ranked
+
+    def resolve(
+        self,
+        query: str,
+        among: Collection[str] | None = None,
+        limit: int = 3,
+    ) -> list[str]:
+        """Return up to ``limit`` department keys for ``query``.
+
+        ``among`` restricts the result to the given normalized keys (e.g. the
+        departments that have notices or a table for the asked year).
+        """
+        key = normalize_dept(query)
+        if not key:
+            return []
+        matches = []
+        for name, score in self._ranked(key):
+            if score < MIN_SCORE:
+                break
+            if among is None or name in among:
+                matches.append(name)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+    def display(self, key: str) -> str:
+        return self.names.get(key, key)
+
+    def mention(self, text: str) -> str | None:
+        """Return the word of ``text`` naming a department or an alias exactly."""
+        for token in re.findall(r"[\w가-힣]+", text):
+            for word in (token, PARTICLE_RE.sub("", token)):
+                key = normalize_dept(word)
+                if key in self.names or key in self.aliases:
+                    return word
+        return None
+
+
+def _stamp() -> tuple:
+    store = get_store()
+    try:
+        links = os.stat(LINKS_FILE).st_mtime_ns
+    except FileNotFoundError:
+        links = None
+    return links, store.version("notices"), store.version("requirements")
+
+
+_resolver: DeptResolver | None = None
+_resolver_lock = threading.Lock()
+_checked_at = 0.0
+
+
+def get_resolver() -> DeptResolver:
+    """Return the shared resolver, rebuilt when links.txt or the store change.
+
+    Names come from ``data/links.txt`` (departments and colleges), every
+    year of the graduation tables
+    and the departments of stored notices. The sources are checked at most
+    every :data:`STAMP_INTERVAL` seconds.
+    """
+    global _resolver, _checked_at
+    resolver = _resolver
+    now = time.monotonic()
+    if resolver is not None and now - _checked_at < STAMP_INTERVAL:
+        return resolver
+    stamp = _stamp()
+    _checked_at = now
+    if resolver is not None and resolver.stamp == stamp:
+        return resolver
+    with _resolver_lock:
+        if _resolver is None or _resolver.stamp != stamp:
+            store = get_store()
+            names: list[str] = []
+            if LINKS_FILE.exists():
+                for college, dept, _ in crawler_attr("notices", "load_links")(LINKS_FILE):
+                    names.extend((dept, college))
+            names.extend(store.requirement_depts())
+            names.extend(store.notice_depts())
+            _resolver = DeptResolver(names, stamp=stamp)
+        return _resolver
@@ -1,87 +1,131 @@
 from pathlib import Path
-from thefuzz import process
 import pandas as pd
 import re
+import threading
 
-from ..crawlers.graduation_req import GraduationRequirementCrawler
-from . import ensure_offline_db
-
-OUT_DIR = Path("data/raw/graduation_req")
-
-
-COLS = [
-    "대학명",
-    "학과명",
-    "구분",
-    "기초(필수)",
-    "균형(인문학)",
-    "균형(사회과학)",
-    "균형(자연과학)",
-    "균형(필수)",
-    "소양(선택)",
-    "소양(필수)",
-    "교양 소계",
-    "전공 기초",
-    "전공 핵심",
-    "전공 심화",
-    "전공 소계",
-    "일반 선택",
-    "졸업 학점(총계)",
-    "비고",
-    "year",
-]
+from src.utils.config import settings
+from ..crawlers.registry import crawler_attr, get_crawler
+from ..crawlers.store import get_store
+from . import ensure_offline_db, mark_stale, request_refresh
+from .dept_resolver import get_resolver, normalize_dept
+
+OUT_DIR = settings.data_dir / "raw/graduation_req"
+
+
+def _parse_years(q: str) -> list[int]:
+    """Return every admission year in ``q`` ("2021학년도", "21학번"), in order."""
+    years = []
+    for m in re.finditer(r"(20\d{2})|(?<!\d)(\d{2})\s*학번", q):
+        year = int(m.group(1)) if m.group(1) else 2000 + int(m.group(2))
+        if year not in years:
+            years.append(year)
+    return years
 
 
 def _parse_year(q: str) -> int | None:
-    m = re.search(r"(20\d{2})", q)
-    return int(m.group(1)) if m else None
+    years = _parse_years(q)
+    return years[0] if years else None
 
 
 def _parse_dept(q: str) -> str | None:
     m = re.search(r"([\w가-힣]+(?:학과|학부|대학원|대학))", q)
-    return m.group(1) if m else None
+    if m:
+        return m.group(1)
+    # abbreviations such as "컴공" have no suffix to match on
+    return get_resolver().mention(q)
 
 
-def _find_best_dept(df: pd.DataFrame, query: str) -> list[str]:
-    """Return up to three department names most similar to ``query``."""
-    names = df["학과명"].dropna().unique().tolist()
-    if not names:
+def _load_year_rows(year: int) -> list[dict]:
+    """Return cleaned requirement rows for the given year from its CSV export."""
+    csv_path = OUT_DIR / f"{year}.csv"
+    try:
+        df = pd.read_csv(csv_path)
+    except Exception:
         return []
-    results = process.extract(query, names, limit=3)
-    return [name for name, score in results if score >= 80]
+    return crawler_attr("graduation_req", "clean_requirements")(df)
+
+
+class RequirementIndex:
+    """Requirement rows of every year keyed by (year, normalized department)."""
+
+    def __init__(self, rows_by_year: dict[int, list[dict]], version: int = 0):
+        self.version = version
+        self.rows: dict[tuple[int, str], list[dict]] = {}
+        self.depts: dict[int, list[str]] = {}
+        for year, rows in rows_by_year.items():
+            for row in rows:
+                key = normalize_dept(row.get("학과명") or "")
+                if not key:
+                    continue
+                if (year, key) not in self.rows:
+                    self.depts.setdefault(year, []).append(key)
+                self.rows.setdefault((year, key), []).append(row)
+        self._dept_sets = {year: frozenset(keys) for year, keys in self.depts.items()}
+        self._matches: dict[tuple[int, str], list[str]] = {}
+
+    @property
+    def years(self) -> list[int]:
+        return sorted(self.depts)
+
+    def match(self, year: int, query: str) -> list[str]:
+        """Department keys of ``year`` matching ``query`` (exact key first)."""
+        key = normalize_dept(query)
+        cached = self._matches.get((year, key))
+        if cached is None:
+            if (year, key) in self.rows:
+                cached = [key]
+            else:
+                cached = get_resolver().resolve(key, among=self._dept_sets.get(year, ()))
+            self._matches[(year, key)] = cached
+        return cached
+
+    def lookup(self, year: int, query: str) -> list[dict]:
+        return [row for key in self.match(year, query) for row in self.rows[(year, key)]]
+
 
+_INDEX: RequirementIndex | None = None
+_INDEX_LOCK = threading.Lock()
 
-def _load_year_df(year: int) -> pd.DataFrame:
-    """Return cleaned DataFrame for the given year.
 
-    The function first looks for a cached CSV file under ``OUT_DIR``. If the
-    file is missing, the PDF for the requested year is parsed and the result is
-    cached for future use.
+def _pdf_years() -> list[int]:
+    pdf_dir = get_crawler("graduation_req").PDF_DIR
+    return sorted(int(p.stem) for p in pdf_dir.glob("*.pdf") if p.stem.isdigit())
+
+
+def _current_index() -> RequirementIndex | None:
+    """The loaded index when it matches the store, else ``None``."""
+    index = _INDEX
+    if index is not None and index.version == get_store().version("requirements"):
+        return index
+    return None
+
+
+def get_index() -> RequirementIndex:
+    """Return the process-wide index, rebuilt only when the store changes.
+
+    Years with a PDF but no stored rows are cleaned first: from the CSV export
+    when present, otherwise by parsing the PDFs in one batch.
     """
-    csv_path = OUT_DIR / f"{year}.csv"
-    if csv_path.exists():
-        try:
-            df = pd.read_csv(csv_path)
-        except Exception:
-            df = pd.DataFrame()
-    else:
-        crawler = GraduationRequirementCrawler(OUT_DIR, year=year)
-        try:
-            df = crawler.parse(crawler.fetch())
-        except FileNotFoundError:
-            return pd.DataFrame()
-        if not df.empty:
-            OUT_DIR.mkdir(parents=True, exist_ok=True)
-            df.to_csv(csv_path, index=False, encoding="utf-8-sig")
-
-    if df.empty or len(df.columns) < len(COLS):
-        return pd.DataFrame()
-
-    df = df.iloc[3:].reset_index(drop=True)
-    df.columns = COLS
-    df["대학명"] = df["대학명"].ffill()
-    df["학과명"] = df["학과명"].ffill()
-    return df
+    global _INDEX
+    index = _current_index()
+    if index is not None:
+        return index
+    store = get_store()
+    with _INDEX_LOCK:
+        if _INDEX is not None and _INDEX.version == store.version("requirements"):
+            return _INDEX
+        stored = set(store.requirement_years())
+        missing = [y for y in _pdf_years() if y not in stored]
+        unparsed = [y for y in missing if not (OUT_DIR / f"{y}.csv").exists()]
+        if unparsed:
+            crawler_attr("graduation_req", "parse_all_years")(OUT_DIR, unparsed)
+        for year in missing:
+            if year not in unparsed:
+                store.replace_requirements(year, _load_year_rows(year))
+        version = store.version("requirements")
+        rows = {y: store.requirements(y) for y in store.requirement_years()}
+        _INDEX = RequirementIndex(rows, version)
+        return _INDEX
 
 
 def _has_update_request(q: str) -> bool:
@@ -101,24 +145,35 @@ def _is_credit_request(q: str) -> bool:
 
 
 def get_context(question: str):
-    """Return graduation requirement table rows matching the question."""
-    ensure_offline_db()
-    year = _parse_year(question)
+    """Return graduation requirement table rows matching the question.
+
+    Rows of every year named in the question are returned in question order
+    (the latest year when none is given), so years can be compared.
+    """
+    ensure_offline_db("graduation_req")
     dept_q = _parse_dept(question)
     if not dept_q:
         return []
 
-    target_year = year if year is not None else 2025
-    df = _load_year_df(target_year)
-    if df.empty:
-        return []
+    index = _current_index()
+    if index is None:
+        # building may parse PDFs; do it in the background within the deadline
+        request_refresh("graduation_index", get_index, wait=True, source="graduation_req")
+        index = _current_index() or _INDEX
+        if index is None:
+            return []
+        if index is not _current_index():
+            mark_stale("graduation_req")
+    years = _parse_years(question) or [max(index.years, default=2025)]
+    return [row for year in years for row in index.lookup(year, dept_q)]
 
-    best_depts = _find_best_dept(df, dept_q)
-    if not best_depts:
-        return []
 
-    major_df = df[df["학과명"].isin(best_depts)]
-    return major_df.to_dict("records")
+def _total(rows: list[dict]) -> str:
+    """Graduation credits of the single-major row, else the first row."""
+    for row in rows:
+        if row.get("구분") == "단수전공자":
+            return row.get("졸업 학점(총계)") or "-"
+    return rows[0].get("졸업 학점(총계)") or "-"
 
 
 def generate_answer(question: str) -> str:
@@ -133,4 +188,11 @@ def generate_answer(question: str) -> str:
     prefix = ""
     if _has_detail_request(question):
         prefix = "세부사항은 해당 학과 공지사항을 직접 확인하셔야 합니다.\n"
+
+    by_year: dict[int, list[dict]] = {}
+    for row in context:
+        by_year.setdefault(row["year"], []).append(row)
+    if len(by_year) > 1:
+        lines = [f"- {y}학년도: {_total(rows)}학점" for y, rows in by_year.items()]
+        return f"{prefix}{dept} 졸업 학점 비교\n" + "\n".join(lines)
     return f"{prefix}{year}학년도 {dept} 졸업요건"
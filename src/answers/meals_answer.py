@@ -1,10 +1,8 @@
 from pathlib import Path
-import json
 import re
 from datetime import datetime, timedelta
-from importlib import util
-import sys, types
 
+from src.utils.loader_cache import get_loader_cache
 from src.utils.logger import get_logger
 from src.utils.time_parser import TimeParser, is_holiday
 from src.utils.config import settings
@@ -80,28 +78,10 @@ CAFETERIA1_MENU = [
 # avoiding words like "1학기" or "1학년".
 CAFE_RE = re.compile(r"(\d+)\s*(?:학생\s*회관|학(?:관)?(?!년|기)|학식(?:당)?|학\b)")
 
-def _load_meals_crawler():
-    """Dynamically load ``MealsCrawler`` without importing other crawlers."""
-    # Use fully qualified package names so that relative imports inside the
-    # crawler modules work correctly when loaded dynamically.
-    pkg = types.ModuleType("src.crawlers")
-    base_dir = Path(__file__).resolve().parent.parent
-    base_path = base_dir / "crawlers" / "base.py"
-    meals_path = base_dir / "crawlers" / "meals.py"
-
-    base_spec = util.spec_from_file_location("src.crawlers.base", base_path)
-    base_mod = util.module_from_spec(base_spec)
-    base_spec.loader.exec_module(base_mod)
-
-    sys.modules.setdefault("src.crawlers", pkg)
-    sys.modules["src.crawlers.base"] = base_mod
-
-    spec = util.spec_from_file_location("src.crawlers.meals", meals_path)
-    mod = util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod.MealsCrawler
+from ..crawlers.registry import crawler_attr, get_crawler
+from ..crawlers.store import get_store
 from ..retrieval.rag_pipeline import HybridRetriever
-from . import ensure_offline_db
+from . import describe_changes, ensure_offline_db, recent_changes, request_refresh
 
 
 def _is_weekend(date_str: str) -> bool:
@@ -112,13 +92,7 @@ OUT_DIR = settings.data_dir / 'raw/meals'
 
 
 def _load_items(path: Path):
-    if not path.exists():
-        return []
-    with path.open(encoding='utf-8') as f:
-        try:
-            return json.load(f).get('items', [])
-        except json.JSONDecodeError:
-            return []
+    return get_loader_cache().load_items(path, default=[])
 
 
 def _parse_date(question: str) -> tuple[str, bool]:
@@ -161,10 +135,100 @@ def _search_fallback(question: str) -> str | None:
     return docs[0] if docs else None
 
 
+def _filter_items(records: list[dict], cafeteria: int | None, meal_type: str | None) -> list[dict]:
+    filtered = [it for it in records if it.get("menu") != "메뉴운영내역"]
+    if cafeteria is not None:
+        code = settings.meal_cafeteria_codes[0]
+        filtered = [
+            it for it in filtered
+            if it.get("cafeteria") == cafeteria and it.get("code", code) == code
+        ]
+    if meal_type is not None:
+        filtered = [it for it in filtered if it.get("meal") == meal_type]
+    return filtered
+
+
+def _stored_meals(date: str, cafeteria: int | None = None, meal_type: str | None = None) -> list[dict]:
+    """Indexed store query, memoized until the meals table changes.
+
+    A cafeteria number is a column of the first configured cafeteria code's
+    page, so other codes' columns with the same number are excluded.
+    """
+    store = get_store()
+    code = settings.meal_cafeteria_codes[0] if cafeteria is not None else None
+    return get_loader_cache().get(
+        ("meals", date, cafeteria, meal_type),
+        store.version("meals"),
+        lambda: store.meals(date, cafeteria, meal_type, code),
+    )
+
+
+def _has_meals(date: str) -> bool:
+    return bool(_stored_meals(date)) or (OUT_DIR / f"{date}.json").exists()
+
+
+def _meals_for(date: str, cafeteria: int | None, meal_type: str | None) -> list[dict]:
+    """Query the local store for ``date``; fall back to the exported JSON."""
+    if _stored_meals(date):
+        return _stored_meals(date, cafeteria, meal_type)
+    return _filter_items(_load_items(OUT_DIR / f"{date}.json"), cafeteria, meal_type)
+
+
+def _request_crawl(date: str, wait: bool = False) -> bool:
+    """Crawl ``date`` in the background.
+
+    With ``wait`` the crawl is awaited within the request deadline; returns
+    True when it finished in time.
+    """
+    MealsCrawler = get_crawler("meals")
+    return request_refresh(
+        f"meals:{date}",
+        lambda: MealsCrawler(OUT_DIR, date).run(),
+        wait=wait,
+        source="meals",
+    )
+
+
+def get_week_context(question: str) -> dict[str, list[dict]] | None:
+    """Return ``{date: records}`` for the weekdays of a week-range question.
+
+    Returns ``None`` when the question does not mention a week. Dates that are
+    not stored locally are fetched in one background batch, awaited within the
+    request deadline and reported as missing if it has not finished.
+    """
+    week = TimeParser(question).parse_week()
+    if week is None:
+        return None
+    ensure_offline_db("meals")
+    start, _ = week
+    dates = [(start + timedelta(days=i)).strftime("%Y%m%d") for i in range(5)]
+
+    missing = [d for d in dates if not _has_meals(d)]
+    if missing:
+        logger.info(f"{len(missing)}일치 식단 정보가 로컬에 없어 백그라운드에서 수집합니다.")
+        crawl_meals = crawler_attr("meals", "crawl_meals")
+        request_refresh(
+            f"meals:{missing[0]}-{missing[-1]}",
+            lambda: crawl_meals(OUT_DIR, missing),
+            wait=True,
+            source="meals",
+        )
+
+    cafeteria = _parse_cafeteria(question)
+    meal_type = _parse_meal(question)
+    return {d: _meals_for(d, cafeteria, meal_type) for d in dates}
+
+
 def get_context(question: str) -> tuple[list[dict], str, bool]:
-    """Return filtered meal records as context, parsed date string and accuracy."""
-    ensure_offline_db()
+    """Return filtered meal records as context, parsed date string and accuracy.
+
+    Update questions get the logged menu changes (of the date, when one is
+    given) instead.
+    """
+    ensure_offline_db("meals")
     date, exact = _parse_date(question)
+    if _has_update_request(question):
+        return recent_changes("meals", date if exact else None), date, exact
     cafeteria = _parse_cafeteria(question)
 
     if cafeteria == 1:
@@ -172,57 +236,63 @@ def get_context(question: str) -> tuple[list[dict], str, bool]:
             return [{"message": "주말에는 운영하지 않습니다."}], date, True
         return CAFETERIA1_MENU, date, True
 
-    path = OUT_DIR / f"{date}.json"
-    prev_items = _load_items(path)
-
-    if not path.exists():
-        logger.info(f"{date} 날짜의 식단 정보가 로컬에 없어 새로 수집합니다.", date)
-        MealsCrawler = _load_meals_crawler()
-        crawler = MealsCrawler(OUT_DIR, date)
-        crawler.run()
+    if not _has_meals(date):
+        logger.info(f"{date} 날짜의 식단 정보가 로컬에 없어 백그라운드에서 수집합니다.")
+        _request_crawl(date, wait=True)
     else:
-        logger.info(f"{date} 날짜의 로컬 식단 정보를 사용합니다.", date)
-
-    items = _load_items(path)
+        logger.info(f"{date} 날짜의 로컬 식단 정보를 사용합니다.")
 
     if _is_weekend(date):
         return [{"message": "주말에는 운영하지 않습니다."}], date, True
 
-    if _has_update_request(question):
-        prev_set = {json.dumps(it, ensure_ascii=False, sort_keys=True) for it in prev_items}
-        new_set = {json.dumps(it, ensure_ascii=False, sort_keys=True) for it in items}
-        diff = [json.loads(s) for s in new_set - prev_set]
-        return diff, date, True
-
     meal_type = _parse_meal(question)
 
-    def _filter(records: list[dict]) -> list[dict]:
-        filtered = [it for it in records if it.get("menu") != "메뉴운영내역"]
-        if cafeteria is not None:
-            filtered = [it for it in filtered if it.get("cafeteria") == cafeteria]
-        if meal_type is not None:
-            filtered = [it for it in filtered if it.get("meal") == meal_type]
-        return filtered
-
-    filtered = _filter(items)
+    filtered = _meals_for(date, cafeteria, meal_type)
     if meal_type is None and not _is_weekend(date):
         filtered = sorted(filtered, key=lambda x: x.get("menu") == "운영안함")
     if not filtered or all(it.get("menu") == "운영안함" for it in filtered):
         prev_year = str(int(date[:4]) - 1) + date[4:]
-        path_prev = OUT_DIR / f"{prev_year}.json"
-        if not path_prev.exists():
-            MealsCrawler = _load_meals_crawler()
-            crawler = MealsCrawler(OUT_DIR, prev_year)
-            crawler.run()
-        items = _load_items(path_prev)
-        filtered = _filter(items)
+        if not _has_meals(prev_year):
+            _request_crawl(prev_year, wait=True)
+        filtered = _meals_for(prev_year, cafeteria, meal_type)
     return filtered, date, exact
 
 
+WEEKDAYS = "월화수목금토일"
+
+
+def _week_answer(week: dict[str, list[dict]]) -> str:
+    lines = []
+    for d, records in week.items():
+        dt = datetime.strptime(d, "%Y%m%d").date()
+        label = f"{dt.strftime('%m-%d')}({WEEKDAYS[dt.weekday()]})"
+        holiday = is_holiday(dt)
+        if holiday:
+            lines.append(f"- {label}: {holiday} 휴무")
+            continue
+        menus = [it.get("menu", "") for it in records if it.get("menu") != "운영안함"]
+        lines.append(f"- {label}: {', '.join(menus[:3]) if menus else '식단 정보 없음'}")
+    return "주간 식단 정보입니다.\n" + "\n".join(lines)
+
+
+def _describe_change(change: dict) -> str:
+    dt = datetime.strptime(change["scope"], "%Y%m%d").strftime("%m-%d")
+    return f"{dt} {change.get('meal', '')} {change.get('menu', '')}".strip()
+
+
 def generate_answer(question: str) -> str:
+    if _has_update_request(question):
+        context, _, _ = get_context(question)
+        return describe_changes(context, _describe_change)
+
+    if _parse_cafeteria(question) != 1:
+        week = get_week_context(question)
+        if week is not None:
+            return _week_answer(week)
+
     context, date, exact = get_context(question)
-    if is_holiday(datetime.strptime(date, "%Y%m%d").date()):
-        holiday = is_holiday(datetime.strptime(date, "%Y%m%d").date())
+    holiday = is_holiday(datetime.strptime(date, "%Y%m%d").date())
+    if holiday:
         return f"{holiday}은 공휴일입니다."
 
     if not context:
@@ -1,52 +1,198 @@
+from bisect import bisect_left
 from pathlib import Path
-import csv
-import json
+from datetime import date, datetime
 import re
-from thefuzz import process
+import threading
 
-from importlib import util
-import sys, types
 from src.utils.config import settings
+from src.utils.time_parser import TimeParser
+from ..crawlers.store import get_store
+from ..retrieval.rag_pipeline import HybridRetriever
+from . import describe_changes, ensure_offline_db, mark_stale, recent_changes, request_refresh
+from .dept_resolver import PARTICLE_RE, get_resolver, normalize_dept
 
-def _load_notice_crawler():
-    pkg = types.ModuleType("src.crawlers")
-    base_dir = Path(__file__).resolve().parent.parent
-    base_path = base_dir / "crawlers" / "base.py"
-    notice_path = base_dir / "crawlers" / "notices.py"
+OUT_DIR = settings.data_dir / 'raw/notices'
 
-    base_spec = util.spec_from_file_location("src.crawlers.base", base_path)
-    base_mod = util.module_from_spec(base_spec)
-    base_spec.loader.exec_module(base_mod)
+# rows returned by ``get_context``
+TOP_K = 10
 
-    sys.modules.setdefault("src.crawlers", pkg)
-    sys.modules["src.crawlers.base"] = base_mod
+# words that describe the request rather than the notice
+STOPWORDS = {
+    '공지', '공지사항', '게시글', '게시물', '소식', '알림', '안내', '관련', '최근', '최신',
+    '이번', '지난', '오늘', '어제', '일주일', '한달', '알려줘', '알려주세요', '보여줘',
+    '있어', '있나요', '있는지', '있습니까', '뭐야', '뭐있어', '어떤', '확인', '여부',
+}
+_WINDOW_RE = re.compile(r'(?:최근|지난)\s*(\d+|한|두|세|일)?\s*(주일|개월|일|주|달)')
 
-    spec = util.spec_from_file_location("src.crawlers.notices", notice_path)
-    mod = util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod.NoticeCrawler
-from ..retrieval.rag_pipeline import HybridRetriever
-from . import ensure_offline_db
 
-# Cache for notice rows and crawler status
-_CRAWLED_ONCE = False
-_ROWS_CACHE: list[dict] | None = None
+def _normalize(text: str) -> str:
+    return re.sub(r'[^\w가-힣]', '', text or '').lower()
+
+
+def _grams(text: str) -> set[str]:
+    """Character bigrams of ``text`` (the whole text when shorter)."""
+    s = _normalize(text)
+    if len(s) < 2:
+        return {s} if s else set()
+    return {s[i:i + 2] for i in range(len(s) - 1)}
+
+
+class NoticeIndex:
+    """Inverted bigram index over notice titles plus per-department lists.
+
+    Rows are kept newest first, so every posting list (sorted positions) is
+    also in recency order and a ``posted_at`` window is a contiguous range of
+    positions. Queries intersect the posting lists and stop after ``k`` hits.
+    """
+
+    def __init__(self, rows: list[dict], version: int = 0):
+        self.version = version
+        self.rows = sorted(rows, key=lambda r: r.get('posted_at') or '', reverse=True)
+        self.posted = [r.get('posted_at') or '' for r in self.rows]
+        self.titles = [_normalize(r.get('title', '')) for r in self.rows]
+        self.grams: dict[str, list[int]] = {}
+        self.depts: dict[str, list[int]] = {}
+        for pos, row in enumerate(self.rows):
+            for g in _grams(row.get('title', '')):
+                self.grams.setdefault(g, []).append(pos)
+            self.depts.setdefault(row.get('dept', ''), []).append(pos)
+        # normalized department key -> stored department name
+        self.dept_keys = {normalize_dept(d): d for d in self.depts}
+        self._sets: dict[tuple[str, str], frozenset[int]] = {}
+
+    def _first(self, pred) -> int:
+        """First position whose ``posted_at`` satisfies monotone ``pred``."""
+        lo, hi = 0, len(self.posted)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if pred(self.posted[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def _set(self, kind: str, key: str, positions: list[int]) -> frozenset[int]:
+        cached = self._sets.get((kind, key))
+        if cached is None:
+            cached = self._sets[(kind, key)] = frozenset(positions)
+        return cached
+
+    def search(
+        self,
+        keywords: list[str] | tuple[str, ...] = (),
+        dept: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        k: int = TOP_K,
+    ) -> list[dict]:
+        """Newest ``k`` notices matching every keyword, ``dept`` and the window."""
+        # rows without a date sort last and only match an open window
+        lo = self._first(lambda p: p <= until) if until else 0
+        hi = self._first(lambda p: p < since) if since else len(self.rows)
+
+        lists: list[tuple[str, str, list[int]]] = []
+        if dept is not None:
+            lists.append(('dept', dept, self.depts.get(dept, [])))
+        needles = [_normalize(kw) for kw in keywords if _normalize(kw)]
+        for needle in needles:
+            for g in _grams(needle):
+                lists.append(('gram', g, self.grams.get(g, [])))
+
+        if len(lists) > 1:
+            lists.sort(key=lambda item: len(item[2]))
+            sets = [self._set(kind, key, positions) for kind, key, positions in lists]
+            matched = sorted(sets[0].intersection(*sets[1:]))
+            candidates = matched[bisect_left(matched, lo):]
+        elif lists:
+            first = lists[0][2]
+            candidates = first[bisect_left(first, lo):]
+        else:
+            candidates = range(lo, hi)
+
+        hits: list[dict] = []
+        for pos in candidates:
+            if pos >= hi:
+                break
+            # bigrams may match out of order; confirm the keyword itself
+            if all(n in self.titles[pos] for n in needles):
+                hits.append(self.rows[pos])
+                if len(hits) >= k:
+                    break
+        return hits
+
+
+_INDEX: NoticeIndex | None = None
+_INDEX_LOCK = threading.Lock()
 
-OUT_DIR = settings.data_dir / 'raw/notices'
 
+def _build_index() -> NoticeIndex:
+    global _INDEX
+    store = get_store()
+    with _INDEX_LOCK:
+        version = store.version('notices')
+        if _INDEX is None or _INDEX.version != version:
+            _INDEX = NoticeIndex(store.notices(), version)
+        return _INDEX
 
-def _load_rows() -> list[dict]:
-    rows: list[dict] = []
-    for path in OUT_DIR.glob('*.csv'):
-        with path.open(encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows.extend(list(reader))
-    return rows
+
+def get_index() -> NoticeIndex | None:
+    """Return the notice index, rebuilding it in the background after a crawl.
+
+    While a rebuild runs the previous index keeps serving (and the answer is
+    marked stale); only the very first build is awaited (within the request
+    deadline).
+    """
+    index = _INDEX
+    if index is not None and index.version == get_store().version('notices'):
+        return index
+    request_refresh('notice_index', _build_index, wait=index is None, source='notices')
+    index = _INDEX
+    if index is not None and index.version != get_store().version('notices'):
+        mark_stale('notices')
+    return index
 
 
 def _parse_dept(q: str) -> str | None:
     m = re.search(r'([\w가-힣]+(?:학과|학부|대학원|대학))', q)
-    return m.group(1) if m else None
+    if m:
+        return m.group(1)
+    # abbreviations such as "컴공" have no suffix to match on
+    return get_resolver().mention(q)
+
+
+def _parse_window(q: str, base: date | None = None) -> tuple[str, str] | None:
+    """Return the ``posted_at`` window (ISO dates) a question asks about.
+
+    A week ("이번 주"), a "최근/지난 N일/주/달" window, a month or an explicit
+    range wins over a single day ("오늘", "3일 전"). Expressions starting
+    after ``base`` ("내일 휴강 공지") say when the event is, not when the
+    notice was posted, and are ignored.
+    """
+    base = base or datetime.now().date()
+    exprs = TimeParser(q).expressions(base)
+    for kinds in (('week', 'weekend'), ('window',), ('range', 'rel_month', 'ym', 'm'), ('day', 'ymd', 'md', 'rel_days', 'weekday')):
+        for expr in exprs:
+            if expr.kind in kinds and expr.start <= base:
+                return expr.start.isoformat(), expr.end.isoformat()
+    return None
+
+
+def _parse_keywords(q: str, dept: str | None = None) -> list[str]:
+    """Title keywords: words left after removing department, dates and request words."""
+    if dept:
+        q = q.replace(dept, ' ')
+    q = _WINDOW_RE.sub(' ', q)
+    words = []
+    for token in re.findall(r'[\w가-힣]+', q):
+        if len(token) > 2:
+            token = PARTICLE_RE.sub('', token)
+        if len(token) < 2 or token.isdigit() or token in STOPWORDS:
+            continue
+        if re.fullmatch(r'(이번|지난|다음)주|\d+(일|월|년)', token):
+            continue
+        words.append(token)
+    return words
+
 
 def _has_update_request(q: str) -> bool:
     keywords = ['변동', '업데이트', '바뀐', '변경']
@@ -65,51 +211,36 @@ def _search_fallback(question: str) -> str | None:
 
 
 def get_context(question: str) -> list[dict]:
-    """Return notice rows related to the question."""
-    global _CRAWLED_ONCE, _ROWS_CACHE
-    ensure_offline_db()
-
-    # Load cached rows if not already loaded
-    if _ROWS_CACHE is None:
-        _ROWS_CACHE = _load_rows()
+    """Return up to :data:`TOP_K` notices related to the question, newest first.
 
-    prev_rows = _ROWS_CACHE
-
-    # Perform crawling only once per runtime to refresh the cache
-    if not _CRAWLED_ONCE:
-        NoticeCrawler = _load_notice_crawler()
-        crawler = NoticeCrawler(OUT_DIR)
-        crawler.run()
-        _CRAWLED_ONCE = True
-        _ROWS_CACHE = _load_rows()
-
-    rows = _ROWS_CACHE
-
-    if _has_update_request(question):
-        prev_set = {json.dumps(r, ensure_ascii=False, sort_keys=True) for r in prev_rows}
-        new_set = {json.dumps(r, ensure_ascii=False, sort_keys=True) for r in rows}
-        diff = [json.loads(s) for s in new_set - prev_set]
-        return diff
+    Title keywords, the department (resolved by the shared
+    :mod:`~src.answers.dept_resolver` among the stored departments) and a date window ("최근 일주일", "이번 주") are looked up in the
+    in-memory :class:`NoticeIndex`. Update questions list the notices the
+    change log recorded as added (for the department, when one is given).
+    """
+    ensure_offline_db("notices")
 
+    index = get_index()
+    if index is None:
+        return []
     dept = _parse_dept(question)
-
-    def _filter(records: list[dict]) -> list[dict]:
-        if not dept:
-            return records
-        names = [r.get('dept', '') for r in records]
-        if not names:
-            return []
-        best = process.extractOne(dept, names)
+    best_name = None
+    if dept:
+        best = get_resolver().resolve(dept, among=index.dept_keys, limit=1)
         if not best:
             return []
-        best_name, _ = best
-        return [r for r in records if r.get('dept', '') == best_name]
-
-    return _filter(rows)
+        best_name = index.dept_keys[best[0]]
+    if _has_update_request(question):
+        return recent_changes('notices', best_name)
+    window = _parse_window(question)
+    since, until = window if window else (None, None)
+    return index.search(_parse_keywords(question, dept), best_name, since, until)
 
 
 def generate_answer(question: str) -> str:
     context = get_context(question)
+    if _has_update_request(question):
+        return describe_changes(context, lambda c: f"{c['dept']} {c['title']}")
     dept = _parse_dept(question) or ''
     prefix = f"{dept} 최신 공지사항입니다" if dept else "최신 공지사항입니다"
     head = ""
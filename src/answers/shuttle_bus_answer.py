@@ -1,20 +1,24 @@
 from pathlib import Path
-import json
-from ..crawlers.shuttle_bus import ShuttleBusCrawler
+from src.utils.loader_cache import get_loader_cache
+from ..crawlers.store import get_store
 from ..retrieval.rag_pipeline import HybridRetriever
-from . import ensure_offline_db
+from . import describe_changes, ensure_offline_db, recent_changes, trigger_refresh
 
 OUT_DIR = Path('data/raw/shuttle_bus')
 
 
 def _load_items(path: Path):
-    if not path.exists():
-        return []
-    with path.open(encoding='utf-8') as f:
-        try:
-            return json.load(f).get('items', [])
-        except json.JSONDecodeError:
-            return []
+    return get_loader_cache().load_items(path, default=[])
+
+
+def _stored_rows(bus_type: str | None = None) -> list[dict]:
+    """Indexed store query, memoized until the shuttle table changes."""
+    store = get_store()
+    return get_loader_cache().get(
+        ('shuttle', bus_type),
+        store.version('shuttle'),
+        lambda: store.shuttle(bus_type),
+    )
 
 
 def _parse_type(q: str) -> str | None:
@@ -37,22 +41,17 @@ def _search_fallback(question: str) -> str | None:
 
 
 def get_context(question: str) -> list[dict]:
-    """Return shuttle bus info records as context."""
-    ensure_offline_db()
-    path = OUT_DIR / 'data.json'
-    items = _load_items(path)
+    """Return shuttle bus info records as context.
 
+    Rows come from the local store (or the exported JSON before the first
+    store write); missing data is refreshed in the background
+    and the answer is marked stale. Update questions get the logged changes.
+    """
+    ensure_offline_db("shuttle_bus")
     if _has_update_request(question):
-        prev_set = {json.dumps(it, ensure_ascii=False, sort_keys=True) for it in items}
-        crawler = ShuttleBusCrawler(OUT_DIR)
-        if crawler.run():
-            new_items = _load_items(path)
-            new_set = {json.dumps(it, ensure_ascii=False, sort_keys=True) for it in new_items}
-            diff = [json.loads(s) for s in new_set - prev_set]
-            if diff:
-                return diff
-            return new_items
-        return items
+        return recent_changes('shuttle_bus')
+
+    items = None if _stored_rows() else _load_items(OUT_DIR / 'data.json')
 
     bus_type = _parse_type(question)
 
@@ -61,17 +60,16 @@ def get_context(question: str) -> list[dict]:
             return [it for it in records if it.get('type') == bus_type]
         return records
 
-    filtered = _filter(items)
+    filtered = _stored_rows(bus_type) if items is None else _filter(items)
     if not filtered:
-        crawler = ShuttleBusCrawler(OUT_DIR)
-        if crawler.run():
-            items = _load_items(path)
-            filtered = _filter(items)
+        trigger_refresh('shuttle_bus')
     return filtered
 
 
 def generate_answer(question: str) -> str:
     context = get_context(question)
+    if _has_update_request(question):
+        return describe_changes(context, lambda c: ' '.join(c.get('row', [])))
     if not context:
         fb = _search_fallback(question)
         if fb:
@@ -0,0 +1,166 @@
+"""Question classifiers and their CPU inference backends.
+
+``settings.classifier_backend`` selects how the fine-tuned model runs:
+
+- ``torch``: the full-precision model.
+- ``int8``: the same model with ``nn.Linear`` layers dynamically quantized
+  to int8.
+- ``onnx``: the model exported once to an ONNX graph and run by
+  onnxruntime with all graph optimizations.
+
+Every backend caches the token ids of recent questions, so a repeated
+question is only padded into its batch.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+from .utils.config import settings
+from .utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SimpleClassifier:
+    """Very naive rule based classifier returning label 0-4."""
+
+    KEYWORDS = {
+        0: ["졸업", "졸업요건", "졸업 요건"],
+        1: ["공지", "notice"],
+        2: ["학사일정", "academic", "캘린더"],
+        3: ["식단", "학식", "메뉴"],
+        4: ["셔틀", "버스", "통학"],
+    }
+
+    def predict(self, text: str) -> int:
+        text = text.lower()
+        for label, words in self.KEYWORDS.items():
+            for w in words:
+                if w.lower() in text:
+                    return label
+        return 1
+
+
+class LLMClassifier:
+    """Load fine-tuned sequence classification model to predict labels."""
+
+    def __init__(self, model_path: str | Path = "./models/classifier"):
+        self.model_path = Path(model_path)
+        self.model = AutoModelForSequenceClassification.from_pretrained(model_path)
+        self.model.eval()
+        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
+        self.id2label = self.model.config.id2label
+        # the model's own limit unless a shorter one is configured; tokenizers
+        # saved without a limit report a huge sentinel value
+        limit = self.tokenizer.model_max_length
+        if limit > 1_000_000:
+            limit = getattr(self.model.config, "max_position_embeddings", None)
+        self.max_length = settings.classifier_max_length or limit
+        if settings.classifier_threads:
+            torch.set_num_threads(settings.classifier_threads)
+        self.encode = lru_cache(maxsize=4096)(self._encode)
+
+    def _encode(self, text: str) -> tuple[int, ...]:
+        ids = self.tokenizer(
+            text, truncation=self.max_length is not None, max_length=self.max_length
+        )["input_ids"]
+        return tuple(ids)
+
+    def _inputs(self, texts: list[str]) -> dict[str, torch.Tensor]:
+        """Padded batch from the cached token ids of ``texts``."""
+        features = [{"input_ids": list(self.encode(t))} for t in texts]
+        return self.tokenizer.pad(features, padding=True, return_tensors="pt")
+
+    def _logits(self, inputs: dict[str, torch.Tensor]) -> torch.Tensor:
+        with torch.inference_mode():
+            return self.model(**inputs).logits
+
+    def predict(self, text: str) -> int:
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: list[str]) -> list[int]:
+        """Labels of ``texts`` from one padded forward pass."""
+        logits = self._logits(self._inputs(texts))
+        return [int(self.id2label[i].split("_")[-1]) for i in logits.argmax(dim=-1).tolist()]
+
+
+class QuantizedClassifier(LLMClassifier):
+    """:class:`LLMClassifier` with dynamically int8-quantized linear layers."""
+
+    def __init__(self, model_path: str | Path = "./models/classifier"):
+        super().__init__(model_path)
+        self.model = torch.ao.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+
+class OnnxClassifier(LLMClassifier):
+    """:class:`LLMClassifier` exported to ONNX and run by onnxruntime.
+
+    The graph is exported next to the model (``model.onnx``) on first use
+    and reused while it is newer than the model weights.
+    """
+
+    def __init__(self, model_path: str | Path = "./models/classifier"):
+        super().__init__(model_path)
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ImportError("classifier_backend='onnx' requires the onnxruntime package") from e
+
+        onnx_path = self.model_path / "model.onnx"
+        weights = [p for p in self.model_path.iterdir() if p.suffix in (".bin", ".safetensors")]
+        if not onnx_path.exists() or any(p.stat().st_mtime > onnx_path.stat().st_mtime for p in weights):
+            self._export(onnx_path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if settings.classifier_threads:
+            options.intra_op_num_threads = settings.classifier_threads
+        self.session = ort.InferenceSession(
+            str(onnx_path), options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = [i.name for i in self.session.get_inputs()]
+        # the graph replaces the torch model; drop its weights
+        self.model = None
+
+    def _export(self, path: Path) -> None:
+        logger.info(f"exporting classifier to {path}")
+        sample = self.tokenizer(["예시 질문"], return_tensors="pt")
+        names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in sample]
+        axes = {n: {0: "batch", 1: "sequence"} for n in names}
+        with torch.no_grad():
+            torch.onnx.export(
+                self.model,
+                tuple(sample[n] for n in names),
+                str(path),
+                input_names=names,
+                output_names=["logits"],
+                dynamic_axes={**axes, "logits": {0: "batch"}},
+                opset_version=17,
+                dynamo=False,
+            )
+
+    def _logits(self, inputs: dict[str, torch.Tensor]) -> torch.Tensor:
+        feed = {n: inputs[n].numpy() for n in self.input_names if n in inputs}
+        if "token_type_ids" in self.input_names and "token_type_ids" not in feed:
+            feed["token_type_ids"] = torch.zeros_like(inputs["input_ids"]).numpy()
+        return torch.from_numpy(self.session.run(["logits"], feed)[0])
+
+
+BACKENDS = {
+    "torch": LLMClassifier,
+    "int8": QuantizedClassifier,
+    "onnx": OnnxClassifier,
+}
+
+
+def load_classifier(backend: str | None = None, model_path: str | Path | None = None) -> LLMClassifier:
+    """Return the classifier for ``backend`` (default ``settings.classifier_backend``)."""
+    backend = backend or settings.classifier_backend
+    return BACKENDS[backend](model_path or settings.classifier_path)
@@ -1,8 +1,10 @@
-from .academic_calendar import AcademicCalendarCrawler
-from .notices import NoticeCrawler
-from .shuttle_bus import ShuttleBusCrawler
-from .graduation_req import GraduationRequirementCrawler
-from .meals import MealsCrawler
+"""Crawlers of the university sites.
+
+The crawler classes are imported on first access (see :mod:`.registry`),
+so importing this package does not load every crawler module.
+"""
+
+from .registry import CRAWLERS, get_crawler
 
 __all__ = [
     'AcademicCalendarCrawler',
@@ -11,3 +13,11 @@ __all__ = [
     'GraduationRequirementCrawler',
     'MealsCrawler',
 ]
+
+_CLASSES = {cls: name for name, (_, cls) in CRAWLERS.items()}
+
+
+def __getattr__(attr: str):
+    if attr in _CLASSES:
+        return get_crawler(_CLASSES[attr])
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
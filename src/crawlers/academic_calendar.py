@@ -1,6 +1,5 @@
 from pathlib import Path
 from datetime import datetime
-import requests
 from bs4 import BeautifulSoup
 
 from ..utils.config import settings
@@ -15,14 +14,16 @@ class AcademicCalendarCrawler(BaseCrawler):
         out_dir = Path(out_dir) / str(self.year)
         super().__init__(out_dir)
 
+    def archive_context(self) -> dict:
+        return {'year': self.year}
+
     def fetch(self) -> str:
         params = {
             'site_dvs_cd': 'kr',
             'menu_dvs_cd': '05020101',
             'year': str(self.year),
         }
-        resp = requests.get(self.BASE_URL, params=params, timeout=10)
-        resp.raise_for_status()
+        resp = self.conditional_get(self.BASE_URL, params=params)
         resp.encoding = resp.apparent_encoding or 'utf-8'
         return resp.text
 
@@ -40,6 +41,9 @@ class AcademicCalendarCrawler(BaseCrawler):
                 results.append({'month': month_txt, 'date': date_text, 'event': desc})
         return results
 
+    def store_records(self, items: list[dict], crawled_at: str) -> None:
+        self.store.replace_events(self.year, items, crawled_at)
+
 if __name__ == '__main__':
     crawler = AcademicCalendarCrawler(settings.data_dir / 'raw/academic_calendar')
     crawler.run()
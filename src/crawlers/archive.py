@@ -0,0 +1,193 @@
+"""Append-only compressed archive of raw crawler responses."""
+
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ..utils.config import settings
+from .http_cache import ValidatorCache
+
+ARCHIVE_DIR = settings.data_dir / "archive"
+
+# segment holding the newest record of every request from pruned days
+BASE_SEGMENT = "base.jsonl.gz"
+
+# response headers kept with each record
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class ResponseArchive:
+    """Store every fetched response as a gzip JSON-lines record.
+
+    Records are appended to one segment per day and process
+    (``YYYYMMDD-<pid>.jsonl.gz``), so the server, the web UI and a
+    standalone scheduler never write to the same file; each append adds a
+    gzip member so existing data is never rewritten. Segments older than
+    ``settings.archive_retention_days`` are pruned when a process opens a
+    new day's segment: the newest record of each request in them is kept in
+    :data:`BASE_SEGMENT`, which is never pruned, so a page that has not
+    changed for longer than the window can still be re-parsed. A record
+    holds the crawler name and constructor context, the request URL and
+    params, the fetch time, status, selected headers and the body.
+    """
+
+    def __init__(self, root: Path = ARCHIVE_DIR, retention_days: int | None = None):
+        self.root = Path(root)
+        self.retention_days = settings.archive_retention_days if retention_days is None else retention_days
+        self._lock = threading.Lock()
+        self._day: str | None = None
+
+    def append(
+        self,
+        crawler: str,
+        context: dict,
+        url: str,
+        params: dict | None,
+        resp: requests.Response,
+    ) -> None:
+        now = datetime.now()
+        record = {
+            "crawler": crawler,
+            "context": context,
+            "request_url": url,
+            "params": params or {},
+            "url": resp.url,
+            "fetched_at": now.isoformat(timespec="seconds"),
+            "status": resp.status_code,
+            "headers": {h: resp.headers[h] for h in KEPT_HEADERS if h in resp.headers},
+            "body": base64.b64encode(resp.content).decode("ascii"),
+        }
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        day = f"{now:%Y%m%d}"
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            if day != self._day:
+                self._day = day
+                self.prune(now)
+            with gzip.open(self.root / f"{day}-{os.getpid()}.jsonl.gz", "at", encoding="utf-8") as f:
+                f.write(line)
+
+    def _segments(self) -> list[Path]:
+        """Day segments (without the base), oldest first."""
+        return sorted(p for p in self.root.glob("*.jsonl.gz") if p.name != BASE_SEGMENT)
+
+    def prune(self, now: datetime | None = None) -> list[Path]:
+        """Fold segments older than the retention window into the base segment.
+
+        Only the newest record per request survives; older duplicates are
+        dropped with their segments. Returns the deleted segments.
+        """
+        if not self.retention_days:
+            return []
+        cutoff = f"{(now or datetime.now()) - timedelta(days=self.retention_days):%Y%m%d}"
+        if not any(p.name[:8] < cutoff for p in self._segments()):
+            return []
+        with _file_lock(self.root / ".prune.lock"):
+            expired = [p for p in self._segments() if p.name[:8] < cutoff]
+            base = self.root / BASE_SEGMENT
+            newest: dict[tuple, dict] = {}
+            for rec in _read_segments([base, *expired]):
+                key = _record_key(rec)
+                if key not in newest or rec["fetched_at"] >= newest[key]["fetched_at"]:
+                    newest[key] = rec
+            tmp = self.root / f"{BASE_SEGMENT}.{os.getpid()}.tmp"
+            with gzip.open(tmp, "wt", encoding="utf-8") as f:
+                for rec in newest.values():
+                    f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            os.replace(tmp, base)
+            for segment in expired:
+                segment.unlink(missing_ok=True)
+        return expired
+
+    def iter_records(self) -> Iterator[dict]:
+        """Yield the base records, then every record day by day (per process within a day)."""
+        yield from _read_segments([self.root / BASE_SEGMENT, *self._segments()])
+
+    def latest(self) -> dict[tuple[str, str], dict[str, dict]]:
+        """Group the newest record per request by crawler and context.
+
+        Returns ``{(crawler, context_json): {request_key: record}}`` where
+        ``request_key`` is :meth:`ValidatorCache.key` of URL and params.
+        """
+        groups: dict[tuple[str, str], dict[str, dict]] = {}
+        for rec in self.iter_records():
+            crawler, context, key = _record_key(rec)
+            records = groups.setdefault((crawler, context), {})
+            if key not in records or rec["fetched_at"] >= records[key]["fetched_at"]:
+                records[key] = rec
+        return groups
+
+
+def _record_key(rec: dict) -> tuple[str, str, str]:
+    """(crawler, context JSON, request key) identifying what ``rec`` answers."""
+    return (
+        rec["crawler"],
+        json.dumps(rec["context"], sort_keys=True),
+        ValidatorCache.key(rec["request_url"], rec["params"]),
+    )
+
+
+def _read_segments(segments: list[Path]) -> Iterator[dict]:
+    for segment in segments:
+        try:
+            with gzip.open(segment, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+        except FileNotFoundError:
+            continue
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive lock between processes (no-op where ``fcntl`` is missing)."""
+    with open(path, "a") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def to_response(record: dict) -> requests.Response:
+    """Rebuild a ``requests.Response`` from an archived record."""
+    resp = requests.Response()
+    resp._content = base64.b64decode(record["body"])
+    resp.status_code = record["status"]
+    resp.headers = CaseInsensitiveDict(record.get("headers") or {})
+    resp.url = record["url"]
+    resp.encoding = get_encoding_from_headers(resp.headers)
+    return resp
+
+
+_archive: ResponseArchive | None = None
+_archive_lock = threading.Lock()
+
+
+def get_archive() -> ResponseArchive:
+    """Return the process-wide response archive."""
+    global _archive
+    if _archive is None:
+        with _archive_lock:
+            if _archive is None:
+                _archive = ResponseArchive()
+    return _archive
@@ -1,14 +1,194 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+import hashlib
 from pathlib import Path
+import threading
 from typing import Any, Iterable
 import requests
 
+from ..utils.config import settings
+from .archive import get_archive
+from .http_cache import NotModified, ValidatorCache, get_validator_cache
+from .session import get_session
+from .store import LocalStore, get_store
+
+
+@dataclass
+class CrawlStats:
+    """Counters collected while a crawler runs."""
+
+    fetched: int = 0        # responses that were downloaded and parsed
+    not_modified: int = 0   # fetches short-circuited by the validator cache
+    bytes: int = 0          # response body bytes received
+    records: int = 0        # records produced by ``parse``
+    failed: int = 0         # fetches that raised a network error
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def __getstate__(self) -> dict:
+        # picklable for process pools; the lock is recreated on load
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def merge(self, other: 'CrawlStats') -> None:
+        self.add(
+            fetched=other.fetched,
+            not_modified=other.not_modified,
+            bytes=other.bytes,
+            records=other.records,
+            failed=other.failed,
+        )
+
+
 class BaseCrawler(ABC):
     """Abstract base class for all crawlers."""
 
-    def __init__(self, out_dir: Path):
+    def __init__(self, out_dir: Path, force: bool = False):
         self.out_dir = Path(out_dir)
         self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.stats = CrawlStats()
+        self._validators: dict[str, dict] = {}
+        self._validators_lock = threading.Lock()
+        # ignore stored validators and refetch everything (see ``run``)
+        self.force = force
+        # archived responses served instead of the network (see ``offline_crawl --reparse``)
+        self.replay: dict[str, requests.Response] | None = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session shared by every crawler in the process."""
+        return get_session()
+
+    @property
+    def validator_cache(self) -> ValidatorCache:
+        return get_validator_cache()
+
+    @property
+    def store(self) -> LocalStore:
+        """Indexed local store the answer handlers query."""
+        return get_store()
+
+    @property
+    def output_path(self) -> Path:
+        """File written by :meth:`save`."""
+        return self.out_dir / 'data.json'
+
+    def has_output(self) -> bool:
+        """Return True when previously saved data exists locally."""
+        return self.output_path.exists()
+
+    def archive_context(self) -> dict:
+        """Constructor arguments needed to re-run this crawler from the archive."""
+        return {}
+
+    def get(
+        self,
+        url: str,
+        params: dict | None = None,
+        archive: bool = True,
+        **kwargs,
+    ) -> requests.Response:
+        """GET ``url`` through the shared session with the default timeout.
+
+        Responses are appended to the raw response archive unless ``archive``
+        is off. In replay mode the archived response is returned instead.
+        """
+        if self.replay is not None:
+            key = ValidatorCache.key(url, params)
+            if key not in self.replay:
+                raise requests.ConnectionError(f'{key} is not archived')
+            return self.replay[key]
+
+        kwargs.setdefault('timeout', settings.http_timeout)
+        resp = self.session.get(url, params=params, **kwargs)
+        if archive and settings.archive_responses and resp.status_code != 304:
+            self._archive(url, params, resp)
+        return resp
+
+    def _archive(self, url: str, params: dict | None, resp: requests.Response) -> None:
+        get_archive().append(type(self).__name__, self.archive_context(), url, params, resp)
+
+    def conditional_get(
+        self,
+        url: str,
+        params: dict | None = None,
+        revalidate: bool | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """GET ``url`` and raise :class:`NotModified` when it is unchanged.
+
+        Stored ``ETag``/``Last-Modified`` values are sent as
+        ``If-None-Match``/``If-Modified-Since``. A ``304`` response or a body
+        whose hash equals the previous one raises ``NotModified``. Validation
+        only happens when ``revalidate`` is true (default: :meth:`has_output`
+        unless :attr:`force` is set) so a missing output file always triggers a
+        full crawl. New validators are recorded by :meth:`commit_validators`
+        after a successful save unless :meth:`discard_validators` dropped them.
+        Only bodies that differ from the last saved one are archived.
+        """
+        if revalidate is None:
+            revalidate = not self.force and self.has_output()
+        key = ValidatorCache.key(url, params)
+        cached = self.validator_cache.get(key) if revalidate else None
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        resp = self.get(url, params=params, archive=False, headers=headers, **kwargs)
+        if cached and resp.status_code == 304:
+            self.stats.add(not_modified=1)
+            raise NotModified(url)
+        resp.raise_for_status()
+
+        digest = hashlib.sha256(resp.content).hexdigest()
+        self.stats.add(bytes=len(resp.content))
+        if cached and cached.get('sha256') == digest:
+            self.stats.add(not_modified=1)
+            raise NotModified(url)
+        if settings.archive_responses and self.replay is None:
+            previous = cached or self.validator_cache.get(key) or {}
+            if previous.get('sha256') != digest:
+                self._archive(url, params, resp)
+
+        self.stats.add(fetched=1)
+        with self._validators_lock:
+            self._validators[key] = {
+                'etag': resp.headers.get('ETag'),
+                'last_modified': resp.headers.get('Last-Modified'),
+                'sha256': digest,
+                'checked_at': datetime.now().isoformat(timespec='seconds'),
+            }
+        return resp
+
+    def commit_validators(self) -> None:
+        """Persist validators collected since the last commit."""
+        with self._validators_lock:
+            entries, self._validators = self._validators, {}
+        self.validator_cache.update(entries)
+
+    def discard_validators(self, keys: Iterable[str]) -> None:
+        """Drop uncommitted validators of responses that could not be parsed.
+
+        The next crawl then downloads them again instead of treating them as
+        unchanged.
+        """
+        with self._validators_lock:
+            for key in keys:
+                self._validators.pop(key, None)
 
     @abstractmethod
     def fetch(self) -> Any:
@@ -18,27 +198,41 @@ class BaseCrawler(ABC):
     def parse(self, raw: Any) -> Iterable[dict]:
         """Parse raw data into structured records."""
 
+    def store_records(self, items: list[dict], crawled_at: str) -> None:
+        """Write saved records to the local store; crawlers with a table override this."""
+
     def save(self, items: Iterable[dict]) -> None:
-        """Save items to ``data.json`` with crawl timestamp."""
-        from datetime import datetime
+        """Save items to ``data.json`` with crawl timestamp and update the store."""
         import json
 
-        path = self.out_dir / 'data.json'
+        path = self.output_path
+        items = list(items)
+        crawled_at = datetime.now().strftime('%Y-%m-%d')
         payload = {
-            'crawled_at': datetime.now().strftime('%Y-%m-%d'),
-            'items': list(items),
+            'crawled_at': crawled_at,
+            'items': items,
         }
         with open(path, 'w', encoding='utf-8') as f:
             json.dump(payload, f, ensure_ascii=False, indent=2)
+        self.store_records(items, crawled_at)
 
-    def run(self) -> bool:
+    def run(self, force: bool = False) -> bool:
         """Fetch, parse and save records.
 
-        Returns ``True`` when network calls succeed, ``False`` otherwise."""
+        Returns ``True`` when network calls succeed, ``False`` otherwise.
+        Unchanged resources (see :meth:`conditional_get`) skip ``parse`` and
+        ``save`` entirely unless ``force`` is set here or on the crawler."""
+        self.force = self.force or force
         try:
             raw = self.fetch()
+        except NotModified:
+            return True
         except requests.RequestException:
+            self.stats.add(failed=1)
             return False
         records = self.parse(raw)
+        self.stats.add(records=len(records))
         self.save(records)
+        if self.replay is None:
+            self.commit_validators()
         return True
@@ -1,13 +1,221 @@
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
 from datetime import datetime
+import hashlib
 import io
+import json
+import os
 import re
+from typing import Hashable, Iterable
 import pdfplumber
 import pandas as pd
 
-from .base import BaseCrawler
+from .base import BaseCrawler, CrawlStats
+from .store import get_store
 from ..utils.config import settings
 
+TABLE_CACHE_DIR = settings.data_dir / "cache" / "graduation_tables"
+
+Rows = list[list[str | None]]
+
+
+def pdf_digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def _extract_pages(task: tuple[bytes, int, int]) -> Rows:
+    """Worker: return the table rows found on pages ``start:stop`` of one PDF."""
+    raw, start, stop = task
+    rows: Rows = []
+    with pdfplumber.open(io.BytesIO(raw)) as pdf:
+        for page in pdf.pages[start:stop]:
+            rows.extend(page.extract_table() or [])
+    return rows
+
+
+def _page_count(raw: bytes) -> int:
+    with pdfplumber.open(io.BytesIO(raw)) as pdf:
+        return len(pdf.pages)
+
+
+def _load_cached(digest: str) -> Rows | None:
+    path = TABLE_CACHE_DIR / f"{digest}.json"
+    try:
+        with path.open(encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _store_cached(digest: str, rows: Rows) -> None:
+    TABLE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = TABLE_CACHE_DIR / f"{digest}.tmp"
+    with tmp.open("w", encoding="utf-8") as f:
+        json.dump(rows, f, ensure_ascii=False)
+    os.replace(tmp, TABLE_CACHE_DIR / f"{digest}.json")
+
+
+def extract_tables(pdfs: dict[Hashable, bytes], workers: int | None = None) -> dict[Hashable, Rows]:
+    """Extract table rows from several PDFs at once.
+
+    Results are cached under the SHA-256 of each PDF so an unchanged file is
+    never parsed twice. The pages of each uncached PDF are split into at
+    most ``workers`` contiguous ranges, so a document is sent to (and
+    opened by) each worker once; all ranges share one process pool and rows
+    keep the page order of each document. The pool uses the ``spawn``
+    start method because it is created from crawler and scheduler threads.
+    """
+    results: dict[Hashable, Rows] = {}
+    pending: dict[Hashable, tuple[bytes, str]] = {}
+    for key, raw in pdfs.items():
+        digest = pdf_digest(raw)
+        cached = _load_cached(digest)
+        if cached is not None:
+            results[key] = cached
+        else:
+            pending[key] = (raw, digest)
+    if not pending:
+        return results
+
+    workers = workers or settings.pdf_workers or os.cpu_count() or 1
+    tasks: list[Hashable] = []
+    args: list[tuple[bytes, int, int]] = []
+    for key, (raw, _) in pending.items():
+        pages = _page_count(raw)
+        chunks = max(1, min(workers, pages))
+        bounds = [pages * i // chunks for i in range(chunks + 1)]
+        for start, stop in zip(bounds, bounds[1:]):
+            tasks.append(key)
+            args.append((raw, start, stop))
+    workers = min(workers, len(args))
+    if workers <= 1:
+        tables = [_extract_pages(a) for a in args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as pool:
+            tables = list(pool.map(_extract_pages, args))
+
+    for key in pending:
+        results[key] = []
+    for key, table in zip(tasks, tables):
+        results[key].extend(table)
+    for key, (_, digest) in pending.items():
+        _store_cached(digest, results[key])
+    return results
+
+
+def _to_frame(rows: Rows, year: int) -> pd.DataFrame:
+    if not rows:
+        return pd.DataFrame()
+    df = pd.DataFrame(rows)
+    df['year'] = year
+    return df
+
+
+# column names of the requirement tables (2025 layout) plus the PDF year
+REQUIREMENT_COLS = [
+    "대학명",
+    "학과명",
+    "구분",
+    "기초(필수)",
+    "균형(인문학)",
+    "균형(사회과학)",
+    "균형(자연과학)",
+    "균형(필수)",
+    "소양(선택)",
+    "소양(필수)",
+    "교양 소계",
+    "전공 기초",
+    "전공 핵심",
+    "전공 심화",
+    "전공 소계",
+    "일반 선택",
+    "졸업 학점(총계)",
+    "비고",
+    "year",
+]
+
+_OLD_LIBERAL_ARTS = ["공통기초교양", "핵심교양", "전문기초교양", "일반교양"]
+_MAJOR_COLS = ["교양 소계", "전공 기초", "전공 핵심", "전공 심화", "전공 소계", "일반 선택"]
+
+# table layouts of the yearly PDFs, keyed by column count (including ``year``)
+LAYOUTS = {
+    # 2020-2021: no college or total column
+    14: ["학과명", "구분", *_OLD_LIBERAL_ARTS, *_MAJOR_COLS, "비고", "year"],
+    # 2022-2024
+    16: ["대학명", "학과명", "구분", *_OLD_LIBERAL_ARTS, *_MAJOR_COLS, "졸업 학점(총계)", "비고", "year"],
+    19: REQUIREMENT_COLS,
+}
+
+_HEADER_CELLS = {"대학명", "학과명", "구분", "학위명"}
+
+
+def _compact(value) -> str | None:
+    if value is None or value != value:  # NaN
+        return None
+    text = re.sub(r"\s+", "", str(value))
+    return text or None
+
+
+def _merged(value) -> str | None:
+    """Compact text of a merged cell.
+
+    pdfplumber repeats the label of a vertically merged cell on each line
+    it spans ("공과대학\n공과대학"); repeated lines are kept once.
+    """
+    if not isinstance(value, str):
+        return _compact(value)
+    lines = (_compact(line) for line in value.splitlines())
+    return "".join(dict.fromkeys(line for line in lines if line)) or None
+
+
+def _credits(value) -> int | None:
+    text = _compact(value)
+    return int(text) if text and text.isdigit() else None
+
+
+def clean_requirements(df: pd.DataFrame) -> list[dict]:
+    """Return one record per requirement row of a yearly table.
+
+    The layout is picked from :data:`LAYOUTS` by column count. Repeated page
+    headers are dropped, merged college/department cells are filled down and
+    rows stop at the degree table that closes the older PDFs. Records always
+    carry ``대학명``, ``학과명``, ``구분`` and ``졸업 학점(총계)`` (summed when
+    the table has no total column). Unknown layouts yield no records.
+    """
+    df = df.drop(columns=['crawled_at'], errors='ignore')
+    cols = LAYOUTS.get(len(df.columns))
+    if df.empty or cols is None:
+        return []
+    df = df.astype(object).where(df.notna(), None)
+    kind_at = cols.index("구분")
+
+    records: list[dict] = []
+    college = dept = None
+    for values in df.values.tolist():
+        if _compact(values[0]) == "학위명":
+            break
+        if values[kind_at] is None and "전공" in (_compact(values[kind_at + 1]) or ""):
+            # some pages carry an empty column before 구분; realign the row
+            values = values[:kind_at] + values[kind_at + 1:-1] + [None, values[-1]]
+        row = dict(zip(cols, values))
+        for name in ("대학명", "학과명"):
+            if name in row and _compact(row[name]) in _HEADER_CELLS:
+                row[name] = None
+        college = _merged(row.get("대학명")) or college
+        dept = _merged(row["학과명"]) or dept
+        kind = _compact(row["구분"])
+        if not kind or "전공" not in kind:
+            continue
+        row.update({"대학명": college, "학과명": dept, "구분": kind})
+        if row.get("졸업 학점(총계)") is None:
+            parts = [_credits(row[c]) for c in ("교양 소계", "전공 소계", "일반 선택")]
+            if all(p is not None for p in parts):
+                row["졸업 학점(총계)"] = str(sum(parts))
+        row["year"] = int(row["year"])
+        records.append(row)
+    return records
+
 
 class GraduationRequirementCrawler(BaseCrawler):
     """Parse graduation requirement PDFs located under ``data/pdf/``."""
@@ -18,6 +226,10 @@ class GraduationRequirementCrawler(BaseCrawler):
         super().__init__(out_dir)
         self.year = year
 
+    @property
+    def output_path(self) -> Path:
+        return self.out_dir / 'data.csv'
+
     def _select_pdf(self) -> Path:
         if self.year is not None:
             return self.PDF_DIR / f"{self.year}.pdf"
@@ -31,30 +243,22 @@ class GraduationRequirementCrawler(BaseCrawler):
         if not pdf_path.exists():
             raise FileNotFoundError(str(pdf_path))
         with open(pdf_path, "rb") as f:
-            return f.read()
+            raw = f.read()
+        self.stats.add(fetched=1, bytes=len(raw))
+        return raw
 
     def parse(self, raw: bytes | None):
         if raw is None:
             return pd.DataFrame()
 
-        rows: list[list[str | None]] = []
-        with pdfplumber.open(io.BytesIO(raw)) as pdf:
-            for page in pdf.pages:
-                table = page.extract_table()
-                if table:
-                    rows.extend(table)
-        if not rows:
-            return pd.DataFrame()
-
-        df = pd.DataFrame(rows)
+        rows = extract_tables({0: raw})[0]
         # try to infer year from selected file name
         if self.year is not None:
             yr = self.year
         else:
             match = re.search(r"(\d{4})", self._select_pdf().stem)
             yr = int(match.group(1)) if match else datetime.now().year
-        df['year'] = yr
-        return df
+        return _to_frame(rows, yr)
 
     def save(self, df: pd.DataFrame) -> None:  # type: ignore[override]
         self.out_dir.mkdir(parents=True, exist_ok=True)
@@ -65,10 +269,61 @@ class GraduationRequirementCrawler(BaseCrawler):
                 df.to_csv(path, index=False, encoding='utf-8-sig')
             return
 
+        self.store.replace_requirements(int(df['year'].iloc[0]), clean_requirements(df))
         df['crawled_at'] = datetime.now().strftime('%Y-%m-%d')
         path = self.out_dir / 'data.csv'
         df.to_csv(path, index=False, encoding='utf-8-sig')
 
+
+def parse_all_years(
+    out_dir: Path,
+    years: Iterable[int] | None = None,
+    workers: int | None = None,
+    stats: CrawlStats | None = None,
+) -> dict[int, Path]:
+    """Parse every ``<year>.pdf`` in one pass and write ``<year>.csv`` files.
+
+    The CSVs keep the raw table layout; cleaned rows are also written to the
+    local store. PDF bytes read and rows written are added to ``stats`` when
+    given.
+    """
+    pdfs = {
+        int(p.stem): p
+        for p in sorted(GraduationRequirementCrawler.PDF_DIR.glob("*.pdf"))
+        if p.stem.isdigit()
+    }
+    if years is not None:
+        wanted = set(years)
+        pdfs = {y: p for y, p in pdfs.items() if y in wanted}
+
+    raws = {y: p.read_bytes() for y, p in pdfs.items()}
+    tables = extract_tables(raws, workers)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written: dict[int, Path] = {}
+    store = get_store()
+    for year, rows in tables.items():
+        df = _to_frame(rows, year)
+        if df.empty:
+            continue
+        path = out_dir / f"{year}.csv"
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+        store.replace_requirements(year, clean_requirements(df))
+        written[year] = path
+        if stats is not None:
+            stats.add(fetched=1, bytes=len(raws[year]), records=len(df))
+    return written
+
+
 if __name__ == '__main__':
-    crawler = GraduationRequirementCrawler(settings.data_dir / 'raw/graduation_req')
+    import argparse
+
+    ap = argparse.ArgumentParser(description='Parse graduation requirement PDFs')
+    ap.add_argument('--all', action='store_true', help='write <year>.csv for every PDF')
+    args = ap.parse_args()
+
+    out = settings.data_dir / 'raw/graduation_req'
+    if args.all:
+        parse_all_years(out)
+    crawler = GraduationRequirementCrawler(out)
     crawler.run()
@@ -0,0 +1,89 @@
+"""On-disk validator cache for conditional GET requests."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from urllib.parse import urlencode
+
+from ..utils.config import settings
+
+CACHE_PATH = settings.data_dir / "cache" / "http_validators.json"
+
+
+class NotModified(Exception):
+    """Raised when a fetched resource is unchanged since the last crawl."""
+
+    def __init__(self, url: str):
+        super().__init__(url)
+        self.url = url
+
+
+class JsonCache:
+    """Thread-safe ``dict`` persisted as a single JSON object.
+
+    The file stays human readable and is replaced atomically on update.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._data: dict[str, dict] | None = None
+
+    def _load(self) -> dict[str, dict]:
+        if self._data is None:
+            try:
+                with self.path.open(encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self._data = {}
+        return self._data
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            return self._load().get(key)
+
+    def update(self, entries: dict[str, dict]) -> None:
+        """Merge ``entries`` into the cache and write it atomically."""
+        if not entries:
+            return
+        with self._lock:
+            data = self._load()
+            data.update(entries)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.path)
+
+
+class ValidatorCache(JsonCache):
+    """Persist ``ETag``/``Last-Modified`` and body hashes per request.
+
+    Entries are keyed by URL plus sorted query parameters.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH):
+        super().__init__(path)
+
+    @staticmethod
+    def key(url: str, params: dict | None = None) -> str:
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+
+_cache: ValidatorCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_validator_cache() -> ValidatorCache:
+    """Return the process-wide validator cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ValidatorCache()
+    return _cache
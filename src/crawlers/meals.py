@@ -1,43 +1,76 @@
 from pathlib import Path
-from datetime import datetime
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date as date_cls, datetime, timedelta
+from typing import Iterable, Sequence
 from lxml import html
 
 from ..utils.config import settings
 
-from .base import BaseCrawler
+from .base import BaseCrawler, CrawlStats
+from .http_cache import NotModified
 
 class MealsCrawler(BaseCrawler):
     BASE_URL = 'https://mobileadmin.cnu.ac.kr/food/index.jsp'
 
-    def __init__(self, out_dir: Path, date: str | None = None):
+    def __init__(
+        self,
+        out_dir: Path,
+        date: str | None = None,
+        cafeterias: Sequence[str] | None = None,
+    ):
         super().__init__(out_dir)
         self.date = date or datetime.now().strftime('%Y%m%d')
+        self.cafeterias = list(dict.fromkeys(cafeterias or settings.meal_cafeteria_codes))
+
+    @property
+    def output_path(self) -> Path:
+        return self.out_dir / f'{self.date}.json'
+
+    def archive_context(self) -> dict:
+        return {'date': self.date, 'cafeterias': self.cafeterias}
 
     def _is_weekend(self) -> bool:
         dt = datetime.strptime(self.date, '%Y%m%d')
         return dt.weekday() >= 5
 
-    def fetch(self) -> str:
-        if self._is_weekend():
-            return ''
+    def _fetch_code(self, code: str, revalidate: bool | None = None) -> str:
         d = datetime.strptime(self.date, '%Y%m%d').strftime('%Y.%m.%d')
         params = {
             'searchYmd': d,
             'searchLang': 'OCL04.10',
             'searchView': 'cafeteria',
-            'searchCafeteria': 'OCL03.02',
+            'searchCafeteria': code,
             'Language_gb': 'OCL04.10#tmp',
         }
-        resp = requests.get(self.BASE_URL, params=params, timeout=10)
-        resp.raise_for_status()
+        resp = self.conditional_get(self.BASE_URL, params=params, revalidate=revalidate)
         resp.encoding = resp.apparent_encoding or 'utf-8'
         return resp.text
 
-    def parse(self, raw: str):
+    def _fetch_changed(self, code: str) -> str | None:
+        try:
+            return self._fetch_code(code)
+        except NotModified:
+            return None
+
+    def fetch(self) -> list[tuple[str, str]]:
+        """Return ``(code, page)`` for every cafeteria code.
+
+        The codes are fetched concurrently. Raises ``NotModified`` only when
+        every page is unchanged; otherwise the unchanged pages are downloaded
+        again so the saved file stays complete.
+        """
         if self._is_weekend():
-            return [{'menu': '주말'}]
+            return []
+        with ThreadPoolExecutor(max_workers=len(self.cafeterias)) as pool:
+            pages = dict(zip(self.cafeterias, pool.map(self._fetch_changed, self.cafeterias)))
+            unchanged = [code for code, page in pages.items() if page is None]
+            if len(unchanged) == len(pages):
+                raise NotModified(self.BASE_URL)
+            refetched = pool.map(lambda code: self._fetch_code(code, revalidate=False), unchanged)
+            pages.update(zip(unchanged, refetched))
+        return list(pages.items())
 
+    def _parse_page(self, raw: str, code: str) -> list[dict]:
         tree = html.fromstring(raw)
         table = tree.xpath("//table[contains(@class,'menu-tbl')]")
         if not table:
@@ -58,6 +91,7 @@ class MealsCrawler(BaseCrawler):
             for caf_idx, cell in enumerate(tds[offset:], start=1):
                 menu = cell.text_content().strip()
                 results.append({
+                    'code': code,
                     'meal': meal,
                     'who': who,
                     'cafeteria': caf_idx + 1,
@@ -65,20 +99,87 @@ class MealsCrawler(BaseCrawler):
                 })
         return results
 
+    def parse(self, raw: str | list[tuple[str, str]]):
+        """Merge the pages of every cafeteria code.
+
+        A cell repeated for the same (code, meal, who, column) is kept once;
+        rows beyond the known meal layout are always kept.
+        """
+        if self._is_weekend():
+            return [{'menu': '주말'}]
+
+        pages = [(self.cafeterias[0], raw)] if isinstance(raw, str) else raw
+        results = []
+        seen = set()
+        for code, page in pages:
+            for item in self._parse_page(page, code):
+                if item['meal'] is not None:
+                    key = (code, item['meal'], item['who'], item['cafeteria'])
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                results.append(item)
+        return results
+
     def save(self, items):  # type: ignore[override]
         """Save results as <date>.json with crawl timestamp."""
         from datetime import datetime
         import json
 
-        path = self.out_dir / f'{self.date}.json'
+        path = self.output_path
+        items = list(items)
+        crawled_at = datetime.now().strftime('%Y-%m-%d')
         payload = {
             'date': self.date,
-            'crawled_at': datetime.now().strftime('%Y-%m-%d'),
-            'items': list(items),
+            'crawled_at': crawled_at,
+            'items': items,
         }
         with open(path, 'w', encoding='utf-8') as f:
             json.dump(payload, f, ensure_ascii=False, indent=2)
+        self.store.replace_meals(self.date, items, crawled_at)
+
+
+def date_range(start: date_cls, end: date_cls) -> list[str]:
+    """Return ``YYYYMMDD`` strings from ``start`` to ``end`` inclusive."""
+    days = (end - start).days
+    return [(start + timedelta(days=i)).strftime('%Y%m%d') for i in range(days + 1)]
+
+
+def crawl_meals(
+    out_dir: Path,
+    dates: Iterable[str],
+    cafeterias: Sequence[str] | None = None,
+    max_workers: int | None = None,
+    stats: CrawlStats | None = None,
+) -> dict[str, bool]:
+    """Crawl several dates concurrently over the shared connection pool.
+
+    Each date is written to its own ``<date>.json`` exactly like a single
+    ``MealsCrawler.run``. Returns ``{date: success}``; per-date counters are
+    merged into ``stats`` when given.
+    """
+    dates = list(dict.fromkeys(dates))
+    workers = max_workers or settings.meal_max_workers
+
+    def task(day: str) -> bool:
+        crawler = MealsCrawler(out_dir, day, cafeterias)
+        ok = crawler.run()
+        if stats is not None:
+            stats.merge(crawler.stats)
+        return ok
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return dict(zip(dates, pool.map(task, dates)))
+
 
 if __name__ == '__main__':
-    crawler = MealsCrawler(settings.data_dir / 'raw/meals')
-    crawler.run()
+    import argparse
+
+    ap = argparse.ArgumentParser(description='Crawl cafeteria menus')
+    ap.add_argument('--start', help='first date (YYYYMMDD), default today')
+    ap.add_argument('--days', type=int, default=1, help='number of days from --start')
+    args = ap.parse_args()
+
+    start = datetime.strptime(args.start, '%Y%m%d').date() if args.start else datetime.now().date()
+    dates = date_range(start, start + timedelta(days=args.days - 1))
+    crawl_meals(settings.data_dir / 'raw/meals', dates)
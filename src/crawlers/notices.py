@@ -3,33 +3,50 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import os
 import re
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Iterable, List, Tuple
-from urllib.parse import urljoin
+from typing import Callable, Iterable, Iterator, List, Tuple
+from urllib.parse import urljoin, urlparse
 
 from ..utils.config import settings
 
 import requests
 from bs4 import BeautifulSoup, Tag
+from lxml import etree
+from lxml import html as lxml_html
 
 from .base import BaseCrawler
+from .http_cache import JsonCache, NotModified, ValidatorCache
+from .session import get_session
+from .store import normalize_posted
 
 
 # ---------------------------------------------------------------------------
 # Utility helpers (adapted from TODO_dir/cnu_crawler project)
 
 ENCODING_FALLBACKS = ["utf-8", "euc-kr", "cp949"]
-DEFAULT_HEADERS = {
-    "User-Agent": "Mozilla/5.0 (compatible; CNUNoticeBot/1.0)"
-}
 
 
-def resilient_get(url: str, timeout: int = 10) -> requests.Response:
-    """HTTP GET with naive encoding fallback."""
-    resp = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
+def resilient_get(
+    url: str,
+    timeout: float | None = None,
+    getter: Callable[..., requests.Response] | None = None,
+) -> requests.Response:
+    """HTTP GET through the shared crawler session with naive encoding fallback.
+
+    ``getter`` replaces the plain session GET, e.g. with
+    :meth:`BaseCrawler.conditional_get`.
+    """
+    if getter is None:
+        resp = get_session().get(url, timeout=timeout or settings.http_timeout)
+    else:
+        resp = getter(url, timeout=timeout or settings.http_timeout)
     if resp.encoding is None or "charset" not in resp.headers.get("content-type", ""):
         for enc in ENCODING_FALLBACKS:
             try:
@@ -73,47 +90,146 @@ CANDIDATE_ROWS = [
     ("div.card", "a"),
 ]
 
+_HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+
+# XPath equivalents of ``CANDIDATE_ROWS`` used by the lxml parse path
+CANDIDATE_XPATHS = [
+    ("//table//tbody//tr", ".//td//a"),
+    (f"//div[{_HAS_CLASS.format('board_list')}]//tbody//tr", ".//td//a"),
+    ("//ul//li", ".//a"),
+    (f"//div[{_HAS_CLASS.format('list')}]//li", ".//a"),
+    (f"//div[{_HAS_CLASS.format('card')}]", ".//a"),
+]
+
+PROFILES_PATH = settings.data_dir / "cache" / "notice_profiles.json"
+
+# matches the YYYYMMDD suffix of daily snapshot CSVs
+_DAY_GLOB = "[0-9]" * 8
+_SNAPSHOT_RE = re.compile(r"^(?P<name>.+)_(?P<day>\d{8})\.csv$")
+
 _DATE_RE = re.compile(r"(20\d{2}[./-]\d{1,2}[./-]\d{1,2})|(\d{4}\.\d{2}\.\d{2})|(\d{4}-\d{2}-\d{2})")
 
+_profiles: JsonCache | None = None
+_profiles_lock = threading.Lock()
+
+
+def get_profile_cache() -> JsonCache:
+    """Return the per-URL cache of selector strategies that matched before."""
+    global _profiles
+    if _profiles is None:
+        with _profiles_lock:
+            if _profiles is None:
+                _profiles = JsonCache(PROFILES_PATH)
+    return _profiles
+
 
-def _extract_date(node: Tag) -> str:
-    text = normalize_whitespace(node.get_text(" "))
-    m = _DATE_RE.search(text)
+def _profile_index(profile: dict | None) -> int | None:
+    if not profile:
+        return None
+    pair = (profile.get("row"), profile.get("link"))
+    return CANDIDATE_ROWS.index(pair) if pair in CANDIDATE_ROWS else None
+
+
+def _extract_date(node: Tag | lxml_html.HtmlElement) -> str:
+    if isinstance(node, Tag):
+        raw = node.get_text(" ")
+    else:
+        raw = " ".join(node.itertext())
+    m = _DATE_RE.search(normalize_whitespace(raw))
     return m.group(0) if m else ""
 
 
-def _make_id(url: str) -> str:
-    return re.sub(r"\W+", "_", url) + "_" + str(int(time.time()))
+def _make_id(url: str, title: str) -> str:
+    """Return a stable id derived from the notice URL and title."""
+    digest = hashlib.sha1(f"{url}\n{title}".encode("utf-8")).hexdigest()
+    return digest[:16]
 
 
-def scrape_generic(college: str, dept: str, url: str) -> List[dict]:
-    """Scrape a single notice list page."""
-    try:
-        resp = resilient_get(url, timeout=10)
-    except requests.HTTPError as e:
-        if e.response.status_code == 404 and "mode=list" not in url:
-            fallback = url + ("?mode=list" if "?" not in url else "&mode=list")
-            resp = resilient_get(fallback, timeout=10)
-        else:
-            raise
+def _iter_soup(soup: BeautifulSoup, idx: int) -> Iterator[Tuple[str, str, Tag]]:
+    row_sel, a_sel = CANDIDATE_ROWS[idx]
+    for row in soup.select(row_sel):
+        a_tag = row.select_one(a_sel) if a_sel else row
+        if not a_tag or not a_tag.get("href"):
+            continue
+        title = normalize_whitespace(a_tag.get_text())
+        if title:
+            yield title, a_tag["href"].strip(), row
+
 
-    base = resp.url
-    soup = BeautifulSoup(resp.text, "html.parser")
+def _iter_lxml(tree: lxml_html.HtmlElement, idx: int) -> Iterator[Tuple[str, str, lxml_html.HtmlElement]]:
+    row_xp, a_xp = CANDIDATE_XPATHS[idx]
+    for row in tree.xpath(row_xp):
+        links = row.xpath(a_xp)
+        if not links or not links[0].get("href"):
+            continue
+        title = normalize_whitespace(links[0].text_content())
+        if title:
+            yield title, links[0].get("href").strip(), row
 
-    rows: List[dict] = []
-    for row_sel, a_sel in CANDIDATE_ROWS:
+
+def _lxml_tree(text: str) -> lxml_html.HtmlElement | None:
+    try:
+        return lxml_html.fromstring(text)
+    except ValueError:
+        # str input with an XML encoding declaration
+        return lxml_html.fromstring(text.encode("utf-8"))
+    except etree.ParserError:
+        return None
+
+
+def extract_rows(
+    text: str,
+    base: str,
+    college: str,
+    dept: str,
+    known: set[str] | None = None,
+    stop_after: int | None = None,
+    preferred: int | None = None,
+    parser: str = "lxml",
+) -> Tuple[int | None, List[dict]]:
+    """Parse a notice list page into rows.
+
+    Returns the index of the ``CANDIDATE_ROWS`` strategy that matched (or
+    ``None``) and the parsed rows. ``preferred`` is tried first and the other
+    strategies are probed only when it no longer matches. ``parser`` selects
+    the lxml path or the original BeautifulSoup ``html.parser`` path.
+
+    When ``known`` ids are given only unseen notices are returned, and the
+    scan stops after ``stop_after`` consecutive known rows. Boards list the
+    newest posts first, so this stops at the already crawled part while
+    still looking past a few pinned notices at the top.
+    """
+    if parser == "lxml":
+        doc = _lxml_tree(text)
+        if doc is None:
+            return None, []
+        iterate = _iter_lxml
+    else:
+        doc = BeautifulSoup(text, "html.parser")
+        iterate = _iter_soup
+
+    order = list(range(len(CANDIDATE_ROWS)))
+    if preferred is not None:
+        order.remove(preferred)
+        order.insert(0, preferred)
+
+    for idx in order:
         parsed: List[dict] = []
-        for row in soup.select(row_sel):
-            a_tag = row.select_one(a_sel) if a_sel else row
-            if not a_tag or not a_tag.get("href"):
+        matched = False
+        streak = 0
+        for title, href, row in iterate(doc, idx):
+            matched = True
+            href = urljoin(base, href)
+            notice_id = _make_id(href, title)
+            if known is not None and notice_id in known:
+                streak += 1
+                if stop_after and streak >= stop_after:
+                    break
                 continue
-            title = normalize_whitespace(a_tag.get_text())
-            if not title:
-                continue
-            href = urljoin(base, a_tag["href"].strip())
+            streak = 0
             parsed.append(
                 {
-                    "id": _make_id(href),
+                    "id": notice_id,
                     "title": title,
                     "url": href,
                     "posted_at": _extract_date(row),
@@ -122,25 +238,174 @@ def scrape_generic(college: str, dept: str, url: str) -> List[dict]:
                     "crawled_at": int(time.time()),
                 }
             )
-        if parsed:
-            rows = parsed
-            break
+        if matched:
+            return idx, parsed
+    return None, []
+
+
+def scrape_generic(
+    college: str,
+    dept: str,
+    url: str,
+    getter: Callable[..., requests.Response] | None = None,
+    known: set[str] | None = None,
+    stop_after: int | None = None,
+    profiles: JsonCache | None = None,
+) -> List[dict]:
+    """Scrape a single notice list page.
+
+    ``profiles`` remembers which selector strategy matched ``url`` so later
+    crawls go straight to it. See :func:`extract_rows` for ``known`` and
+    ``stop_after``.
+    """
+    try:
+        resp = resilient_get(url, getter=getter)
+    except requests.HTTPError as e:
+        if e.response.status_code == 404 and "mode=list" not in url:
+            fallback = url + ("?mode=list" if "?" not in url else "&mode=list")
+            resp = resilient_get(fallback, getter=getter)
+        else:
+            raise
 
-    if not rows:
+    preferred = _profile_index(profiles.get(url)) if profiles is not None else None
+    idx, rows = extract_rows(
+        resp.text,
+        resp.url,
+        college,
+        dept,
+        known=known,
+        stop_after=stop_after,
+        preferred=preferred,
+    )
+    if idx is None:
         raise RuntimeError(f"No rows parsed for {url}")
+    if profiles is not None and idx != preferred:
+        row_sel, a_sel = CANDIDATE_ROWS[idx]
+        profiles.update({url: {"row": row_sel, "link": a_sel}})
 
     return rows
 
 
+# ---------------------------------------------------------------------------
+# Storage compaction
+
+FIELDNAMES = ["id", "title", "url", "posted_at", "college", "dept", "crawled_at"]
+
+
+def is_snapshot(path: Path) -> bool:
+    """Return True for a daily ``<college>_<dept>_<YYYYMMDD>.csv`` snapshot."""
+    return _SNAPSHOT_RE.match(path.name) is not None
+
+
+def snapshot_target(path: Path) -> Path:
+    """Compacted ``<college>_<dept>.csv`` that snapshot ``path`` merges into."""
+    return path.with_name(f"{_SNAPSHOT_RE.match(path.name).group('name')}.csv")
+
+
+def _read_csv(path: Path) -> List[dict]:
+    try:
+        with path.open(encoding="utf-8-sig", newline="") as f:
+            return list(csv.DictReader(f))
+    except FileNotFoundError:
+        return []
+
+
+def compact_notices(
+    out_dir: Path,
+    keep_days: int | None = None,
+    names: Iterable[str] | None = None,
+) -> dict[str, int]:
+    """Merge daily snapshots into one CSV per department.
+
+    Rows of ``<college>_<dept>_<YYYYMMDD>.csv`` are merged into
+    ``<college>_<dept>.csv``, de-duplicated by notice id (keeping the first
+    ``crawled_at``) and sorted newest first. Snapshots older than
+    ``keep_days`` are deleted afterwards. ``names`` limits the run to the
+    given compacted file names. Returns the row count per compacted file.
+    """
+    out_dir = Path(out_dir)
+    keep_days = settings.notice_snapshot_days if keep_days is None else keep_days
+    wanted = set(names) if names is not None else None
+    cutoff = (datetime.now() - timedelta(days=keep_days)).strftime("%Y%m%d")
+
+    groups: dict[str, List[Path]] = {}
+    for path in sorted(out_dir.glob(f"*_{_DAY_GLOB}.csv")):
+        m = _SNAPSHOT_RE.match(path.name)
+        name = f"{m.group('name')}.csv"
+        if wanted is None or name in wanted:
+            groups.setdefault(name, []).append(path)
+
+    counts: dict[str, int] = {}
+    for name, snapshots in groups.items():
+        target = out_dir / name
+        merged: dict[str, dict] = {}
+        for path in [target, *snapshots]:
+            for row in _read_csv(path):
+                row["id"] = _make_id(row.get("url", ""), row.get("title", ""))
+                merged.setdefault(row["id"], row)
+        rows = sorted(
+            merged.values(),
+            key=lambda r: (normalize_posted(r.get("posted_at")), r.get("crawled_at") or ""),
+            reverse=True,
+        )
+        tmp = target.with_suffix(".tmp")
+        with tmp.open("w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES, extrasaction="ignore")
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp, target)
+        counts[name] = len(rows)
+
+        for path in snapshots:
+            if _SNAPSHOT_RE.match(path.name).group("day") < cutoff:
+                path.unlink()
+    return counts
+
+
 # ---------------------------------------------------------------------------
 # Crawler implementation
 
 
+class HostLimiter:
+    """Bound the number of in-flight requests per host."""
+
+    def __init__(self, per_host: int):
+        self.per_host = max(1, per_host)
+        self._lock = threading.Lock()
+        self._sems: dict[str, threading.BoundedSemaphore] = {}
+
+    def get(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            sem = self._sems.get(host)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.per_host)
+                self._sems[host] = sem
+            return sem
+
+
 class NoticeCrawler(BaseCrawler):
     """Crawl department notice boards listed in links.txt."""
 
     LINKS_FILE = settings.data_dir / "links.txt"
 
+    FIELDNAMES = FIELDNAMES
+
+    def __init__(
+        self,
+        out_dir: Path,
+        max_workers: int | None = None,
+        per_host: int | None = None,
+        incremental: bool | None = None,
+        force: bool = False,
+    ):
+        super().__init__(out_dir, force)
+        self.max_workers = max_workers if max_workers is not None else settings.notice_max_workers
+        self.per_host = per_host if per_host is not None else settings.notice_per_host
+        self.incremental = incremental if incremental is not None else settings.notice_incremental
+        # wall time of the last ``parse`` call in seconds
+        self.elapsed = 0.0
+
     def fetch(self) -> List[Tuple[str, str, str]]:
         """Load department link list.
 
@@ -154,18 +419,90 @@ class NoticeCrawler(BaseCrawler):
             return []
         return load_links(self.LINKS_FILE)
 
+    def _compact_name(self, college: str, dept: str) -> str:
+        safe = lambda s: re.sub(r"[^\w가-힣]", "_", s)
+        return f"{safe(college)}_{safe(dept)}.csv"
+
+    def _csv_name(self, college: str, dept: str, day: str) -> str:
+        return f"{self._compact_name(college, dept)[:-4]}_{day}.csv"
+
+    def has_output(self) -> bool:
+        return any(self.out_dir.glob("*.csv"))
+
+    def known_ids(self, college: str, dept: str) -> set[str]:
+        """Return ids of notices already stored for ``dept``.
+
+        Only the compacted file is read. Ids are recomputed from URL and title
+        so files written before ids were stable are recognised as well.
+        """
+        return {
+            _make_id(row.get("url", ""), row.get("title", ""))
+            for row in _read_csv(self.out_dir / self._compact_name(college, dept))
+        }
+
+    def _scrape(self, link: Tuple[str, str, str]) -> List[dict]:
+        college, dept, url = link
+        known = self.known_ids(college, dept) if self.incremental and not self.force else None
+        # only revalidate boards whose notices are already stored locally
+        revalidate = not self.force and (self.out_dir / self._compact_name(college, dept)).exists()
+
+        fetched: List[str] = []
+
+        def getter(u: str, **kwargs) -> requests.Response:
+            fetched.append(ValidatorCache.key(u, kwargs.get("params")))
+            return self.conditional_get(u, revalidate=revalidate, **kwargs)
+
+        try:
+            return scrape_generic(
+                college,
+                dept,
+                url,
+                getter=getter,
+                known=known,
+                stop_after=settings.notice_known_streak,
+                profiles=get_profile_cache(),
+            )
+        except NotModified:
+            return []
+        except Exception:
+            # Skip failures silently, but fetch the board again next time
+            self.discard_validators(fetched)
+            self.stats.add(failed=1)
+            return []
+
     def parse(self, links: Iterable[Tuple[str, str, str]]) -> List[dict]:
+        """Scrape every board, concurrently when ``max_workers > 1``.
+
+        Results keep the order of ``links`` so the saved CSVs are identical to
+        the serial crawl.
+        """
+        links = list(links)
+        start = time.perf_counter()
         results: List[dict] = []
-        for college, dept, url in links:
-            try:
-                rows = scrape_generic(college, dept, url)
-                results.extend(rows)
-            except Exception:
-                # Skip failures silently
-                continue
+        if self.max_workers <= 1:
+            for link in links:
+                results.extend(self._scrape(link))
+        else:
+            limiter = HostLimiter(self.per_host)
+
+            def task(link: Tuple[str, str, str]) -> List[dict]:
+                with limiter.get(link[2]):
+                    return self._scrape(link)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for rows in pool.map(task, links):
+                    results.extend(rows)
+        self.elapsed = time.perf_counter() - start
         return results
 
     def save(self, items: Iterable[dict]) -> None:  # type: ignore[override]
+        """Write one CSV per department for today's crawl and compact it.
+
+        In incremental mode ``items`` only holds new notices, which are
+        appended to today's file instead of replacing it. The touched
+        departments are then merged into their compacted files (see
+        :func:`compact_notices`).
+        """
         groups: dict[Tuple[str, str], List[dict]] = {}
         for row in items:
             key = (row["college"], row["dept"])
@@ -174,16 +511,67 @@ class NoticeCrawler(BaseCrawler):
         for (college, dept), rows in groups.items():
             if not rows:
                 continue
-            safe = lambda s: re.sub(r"[^\w가-힣]", "_", s)
-            fname = f"{safe(college)}_{safe(dept)}_{datetime.now().strftime('%Y%m%d')}.csv"
+            fname = self._csv_name(college, dept, datetime.now().strftime('%Y%m%d'))
             path = self.out_dir / fname
-            fieldnames = ["id", "title", "url", "posted_at", "college", "dept", "crawled_at"]
-            with open(path, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
+            append = self.incremental and not self.force and path.exists()
+            mode = "a" if append else "w"
+            # no BOM in the middle of an appended file
+            encoding = "utf-8" if append else "utf-8-sig"
+            with open(path, mode, newline="", encoding=encoding) as f:
+                writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES)
+                if not append:
+                    writer.writeheader()
                 writer.writerows(rows)
+        self.store.upsert_notices(row for rows in groups.values() for row in rows)
+        compact_notices(
+            self.out_dir,
+            names=[self._compact_name(college, dept) for college, dept in groups],
+        )
 
 
 if __name__ == "__main__":
-    crawler = NoticeCrawler(settings.data_dir / "raw/notices")
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Crawl department notice boards")
+    ap.add_argument("--workers", type=int, default=settings.notice_max_workers)
+    ap.add_argument("--per-host", type=int, default=settings.notice_per_host)
+    ap.add_argument("--force", action="store_true", help="ignore the conditional-GET cache")
+    ap.add_argument(
+        "--full",
+        action="store_true",
+        help="rewrite every notice instead of appending only new ones",
+    )
+    ap.add_argument(
+        "--compact",
+        action="store_true",
+        help="only merge daily snapshots into per-department files and prune old ones",
+    )
+    ap.add_argument(
+        "--compare",
+        action="store_true",
+        help="also run the serial crawl (without saving) and report both wall times",
+    )
+    args = ap.parse_args()
+
+    if args.compact:
+        counts = compact_notices(settings.data_dir / "raw/notices")
+        print(f"compacted {len(counts)} departments, {sum(counts.values())} notices")
+        raise SystemExit(0)
+
+    crawler = NoticeCrawler(
+        settings.data_dir / "raw/notices",
+        args.workers,
+        args.per_host,
+        incremental=not args.full,
+        force=args.force or args.compare,
+    )
     crawler.run()
+    print(f"concurrent crawl ({args.workers} workers, {args.per_host}/host): {crawler.elapsed:.1f}s")
+    print(
+        f"fetched {crawler.stats.fetched} boards, "
+        f"{crawler.stats.not_modified} unchanged (skipped), {crawler.stats.bytes} bytes"
+    )
+    if args.compare:
+        serial = NoticeCrawler(crawler.out_dir, max_workers=1, force=True)
+        serial.parse(serial.fetch())
+        print(f"serial crawl: {serial.elapsed:.1f}s")
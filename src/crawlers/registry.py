@@ -0,0 +1,48 @@
+"""Lazy, process-wide lookup of crawler classes and helpers.
+
+Answer handlers and the scheduler resolve crawlers through :func:`get_crawler` /
+:func:`crawler_attr` instead of loading crawler modules from source, so
+each module is imported (and its code executed) at most once per process.
+"""
+
+from __future__ import annotations
+
+import threading
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+# source name -> (module under src.crawlers, crawler class)
+CRAWLERS = {
+    "meals": ("meals", "MealsCrawler"),
+    "notices": ("notices", "NoticeCrawler"),
+    "academic_calendar": ("academic_calendar", "AcademicCalendarCrawler"),
+    "shuttle_bus": ("shuttle_bus", "ShuttleBusCrawler"),
+    "graduation_req": ("graduation_req", "GraduationRequirementCrawler"),
+}
+
+_modules: dict[str, ModuleType] = {}
+_lock = threading.Lock()
+
+
+def crawler_module(name: str) -> ModuleType:
+    """Return the module of crawler ``name``, importing it on first use."""
+    module = _modules.get(name)
+    if module is not None:
+        return module
+    with _lock:
+        module = _modules.get(name)
+        if module is None:
+            module = import_module(f"{__package__}.{CRAWLERS[name][0]}")
+            _modules[name] = module
+    return module
+
+
+def crawler_attr(name: str, attr: str) -> Any:
+    """Return ``attr`` (e.g. a batch helper) of crawler ``name``'s module."""
+    return getattr(crawler_module(name), attr)
+
+
+def get_crawler(name: str) -> type:
+    """Return the crawler class registered as ``name``."""
+    return crawler_attr(name, CRAWLERS[name][1])
@@ -0,0 +1,62 @@
+"""Shared HTTP client with keep-alive pooling for all crawlers."""
+
+from __future__ import annotations
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..utils.config import settings
+
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+_session: requests.Session | None = None
+_lock = threading.Lock()
+
+
+def build_session(
+    pool_connections: int | None = None,
+    pool_maxsize: int | None = None,
+    retries: int | None = None,
+    backoff: float | None = None,
+) -> requests.Session:
+    """Return a new ``requests.Session`` configured from ``settings``.
+
+    Connections are pooled per host so repeated requests to the same server
+    (notice boards on ``cem.cnu.ac.kr``, meals over several days, ...) reuse
+    the TCP/TLS connection. Idempotent requests are retried with exponential
+    backoff on connection errors and transient 5xx/429 responses.
+    """
+    retries = settings.http_retries if retries is None else retries
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=settings.http_backoff if backoff is None else backoff,
+        status_forcelist=RETRY_STATUS,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections or settings.http_pool_connections,
+        pool_maxsize=pool_maxsize or settings.http_pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": settings.http_user_agent})
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide crawler session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = build_session()
+    return _session
@@ -1,5 +1,4 @@
 from pathlib import Path
-import requests
 from bs4 import BeautifulSoup
 
 from ..utils.config import settings
@@ -10,8 +9,7 @@ class ShuttleBusCrawler(BaseCrawler):
     URL = 'https://plus.cnu.ac.kr/html/kr/sub05/sub05_050403.html'
 
     def fetch(self) -> str:
-        resp = requests.get(self.URL, timeout=10)
-        resp.raise_for_status()
+        resp = self.conditional_get(self.URL)
         resp.encoding = resp.apparent_encoding or 'utf-8'
         return resp.text
 
@@ -33,6 +31,9 @@ class ShuttleBusCrawler(BaseCrawler):
                     results.append({'type': 'route', 'row': cells})
         return results
 
+    def store_records(self, items: list[dict], crawled_at: str) -> None:
+        self.store.replace_shuttle(items, crawled_at)
+
 if __name__ == '__main__':
     crawler = ShuttleBusCrawler(settings.data_dir / 'raw/shuttle_bus')
     crawler.run()
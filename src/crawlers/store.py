@@ -0,0 +1,565 @@
+"""Indexed SQLite store for crawled records.
+
+Crawlers write their parsed records here from ``save`` (the JSON/CSV files
+under ``data/raw`` are still written as exports) and the answer modules
+query it instead of loading and filtering whole files per question.
+
+Every write compares content hashes of the records it replaces with the
+new ones and appends the difference to the ``changes`` log, so "what
+changed" questions are a range query instead of a re-crawl and a diff.
+"""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Sequence
+
+from ..utils.config import settings
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+STORE_PATH = settings.data_dir / "local.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meals (
+    date TEXT NOT NULL,
+    cafeteria INTEGER,
+    meal TEXT,
+    who TEXT,
+    menu TEXT,
+    crawled_at TEXT,
+    code TEXT  -- cafeteria code of the menu page; ``cafeteria`` is its column
+);
+CREATE INDEX IF NOT EXISTS meals_lookup ON meals (date, cafeteria, meal);
+
+CREATE TABLE IF NOT EXISTS events (
+    year INTEGER NOT NULL,
+    month INTEGER,
+    month_label TEXT,
+    date TEXT,
+    event TEXT,
+    crawled_at TEXT
+);
+CREATE INDEX IF NOT EXISTS events_lookup ON events (year, month);
+
+CREATE TABLE IF NOT EXISTS notices (
+    id TEXT PRIMARY KEY,
+    college TEXT,
+    dept TEXT,
+    title TEXT,
+    url TEXT,
+    posted_at TEXT,
+    crawled_at INTEGER
+);
+CREATE INDEX IF NOT EXISTS notices_lookup ON notices (dept, posted_at);
+
+CREATE TABLE IF NOT EXISTS requirements (
+    year INTEGER NOT NULL,
+    college TEXT,
+    dept TEXT,
+    row TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS requirements_lookup ON requirements (year, dept);
+
+CREATE TABLE IF NOT EXISTS shuttle (
+    type TEXT,
+    row TEXT NOT NULL,
+    crawled_at TEXT
+);
+CREATE INDEX IF NOT EXISTS shuttle_lookup ON shuttle (type);
+
+-- records added to or removed from a scope (a meal date, a calendar year,
+-- a notice department, ...) by a save
+CREATE TABLE IF NOT EXISTS changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    action TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    record TEXT NOT NULL,
+    changed_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS changes_lookup ON changes (source, changed_at);
+
+-- bumped by every write so readers can tell when a table changed
+CREATE TABLE IF NOT EXISTS versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+_MONTH_RE = re.compile(r"(\d{1,2})\s*월")
+_POSTED_RE = re.compile(r"(\d{4})[./-](\d{1,2})[./-](\d{1,2})")
+
+
+def month_number(label: str | None) -> int | None:
+    """Return the month of a calendar label such as ``'05월'``."""
+    m = _MONTH_RE.search(label or "")
+    return int(m.group(1)) if m else None
+
+
+def normalize_posted(value: str | None) -> str:
+    """Return ``YYYY-MM-DD`` for the date formats used on notice boards."""
+    m = _POSTED_RE.search(value or "")
+    if not m:
+        return ""
+    y, mo, d = m.groups()
+    return f"{y}-{int(mo):02d}-{int(d):02d}"
+
+
+def record_hash(record: dict) -> str:
+    """Content hash of a record, independent of key order and value types."""
+    content = {k: None if v is None else str(v) for k, v in record.items()}
+    payload = json.dumps(content, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class LocalStore:
+    """SQLite database shared by crawlers and answer handlers.
+
+    Each thread gets its own connection; the database runs in WAL mode so
+    readers are not blocked while a crawler replaces a table slice.
+    """
+
+    def __init__(self, path: Path = STORE_PATH):
+        self.path = Path(path)
+        self._local = threading.local()
+        self.created = not self.path.exists()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+            self._migrate(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Add columns introduced after a database was created."""
+        columns = {r["name"] for r in conn.execute("PRAGMA table_info(meals)")}
+        if "code" not in columns:
+            # menus stored before then all came from the main cafeteria page
+            conn.execute("ALTER TABLE meals ADD COLUMN code TEXT")
+            conn.execute("UPDATE meals SET code = ?", (settings.meal_cafeteria_codes[0],))
+
+    def _query(self, sql: str, params: Sequence = ()) -> list[sqlite3.Row]:
+        return self._connect().execute(sql, params).fetchall()
+
+    def _exists(self, table: str, where: str, params: Sequence) -> bool:
+        return bool(self._query(f"SELECT 1 FROM {table} WHERE {where} LIMIT 1", params))
+
+    @staticmethod
+    def _bump(conn: sqlite3.Connection, table: str) -> None:
+        conn.execute(
+            "INSERT INTO versions VALUES (?, 1) "
+            "ON CONFLICT (name) DO UPDATE SET version = version + 1",
+            (table,),
+        )
+
+    def _log_changes(
+        self,
+        conn: sqlite3.Connection,
+        source: str,
+        scope: str,
+        old: Iterable[dict],
+        new: Iterable[dict],
+    ) -> int:
+        """Append records of ``scope`` that ``new`` adds or drops to the change log.
+
+        The first snapshot of a scope is its baseline and is not logged.
+        """
+        before = {record_hash(r): r for r in old}
+        if not before:
+            return 0
+        after = {record_hash(r): r for r in new}
+        return self._append_changes(conn, source, scope, [
+            (action, h, r)
+            for action, records, other in (("added", after, before), ("removed", before, after))
+            for h, r in records.items()
+            if h not in other
+        ])
+
+    def _append_changes(
+        self,
+        conn: sqlite3.Connection,
+        source: str,
+        scope: str,
+        changes: Sequence[tuple[str, str, dict]],
+    ) -> int:
+        """Write ``(action, hash, record)`` entries to the change log."""
+        now = int(time.time())
+        entries = [
+            (source, scope, action, h, json.dumps(r, ensure_ascii=False), now)
+            for action, h, r in changes
+        ]
+        if entries:
+            conn.executemany(
+                "INSERT INTO changes (source, scope, action, hash, record, changed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                entries,
+            )
+            self._bump(conn, "changes")
+        return len(entries)
+
+    def changes(
+        self,
+        source: str | None = None,
+        since: int | None = None,
+        scope: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Logged changes newest first; each record carries ``change`` and ``changed_at``."""
+        sql = "SELECT source, scope, action, record, changed_at FROM changes"
+        clauses, params = [], []
+        if source is not None:
+            clauses.append("source = ?")
+            params.append(source)
+        if since is not None:
+            clauses.append("changed_at >= ?")
+            params.append(since)
+        if scope is not None:
+            clauses.append("scope = ?")
+            params.append(scope)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY changed_at DESC, id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [
+            {
+                **json.loads(r["record"]),
+                "change": r["action"],
+                "changed_at": r["changed_at"],
+                "source": r["source"],
+                "scope": r["scope"],
+            }
+            for r in self._query(sql, params)
+        ]
+
+    def count(self, table: str) -> int:
+        """Number of rows in ``table``."""
+        return self._query(f"SELECT COUNT(*) FROM {table}")[0][0]
+
+    def version(self, table: str) -> int:
+        """Write counter of ``table``; changes whenever its rows change."""
+        rows = self._query("SELECT version FROM versions WHERE name = ?", (table,))
+        return rows[0][0] if rows else 0
+
+    # meals -----------------------------------------------------------------
+    def replace_meals(self, date: str, items: Iterable[dict], crawled_at: str) -> None:
+        default_code = settings.meal_cafeteria_codes[0]
+        rows = [
+            (date, it.get("cafeteria"), it.get("meal"), it.get("who"), it.get("menu"), crawled_at,
+             it.get("code", default_code))
+            for it in items
+        ]
+        fields = ("cafeteria", "meal", "who", "menu", "code")
+        with self._connect() as conn:
+            old = conn.execute(
+                "SELECT cafeteria, meal, who, menu, code FROM meals WHERE date = ?", (date,)
+            ).fetchall()
+            self._log_changes(
+                conn, "meals", date,
+                (dict(r) for r in old),
+                (dict(zip(fields, r[1:5] + r[6:])) for r in rows),
+            )
+            conn.execute("DELETE FROM meals WHERE date = ?", (date,))
+            conn.executemany(
+                "INSERT INTO meals (date, cafeteria, meal, who, menu, crawled_at, code) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._bump(conn, "meals")
+
+    def has_meals(self, date: str) -> bool:
+        return self._exists("meals", "date = ?", (date,))
+
+    def meals(
+        self,
+        date: str,
+        cafeteria: int | None = None,
+        meal: str | None = None,
+        code: str | None = None,
+    ) -> list[dict]:
+        """Return menu cells for ``date``, skipping the operating-notes row.
+
+        ``cafeteria`` is a column number of the menu page of ``code``.
+        """
+        sql = "SELECT meal, who, cafeteria, menu, code FROM meals WHERE date = ?"
+        params: list = [date]
+        if code is not None:
+            sql += " AND code = ?"
+            params.append(code)
+        if cafeteria is not None:
+            sql += " AND cafeteria = ?"
+            params.append(cafeteria)
+        if meal is not None:
+            sql += " AND meal = ?"
+            params.append(meal)
+        sql += " AND menu IS NOT '메뉴운영내역' ORDER BY rowid"
+        return [
+            {k: r[k] for k in r.keys() if r[k] is not None}
+            for r in self._query(sql, params)
+        ]
+
+    # academic calendar -----------------------------------------------------
+    def replace_events(self, year: int, items: Iterable[dict], crawled_at: str) -> None:
+        rows = [
+            (year, month_number(it.get("month")), it.get("month"), it.get("date"), it.get("event"), crawled_at)
+            for it in items
+        ]
+        with self._connect() as conn:
+            old = conn.execute(
+                "SELECT month_label AS month, date, event FROM events WHERE year = ?", (year,)
+            ).fetchall()
+            self._log_changes(
+                conn, "academic_calendar", str(year),
+                (dict(r) for r in old),
+                (dict(zip(("month", "date", "event"), r[2:5])) for r in rows),
+            )
+            conn.execute("DELETE FROM events WHERE year = ?", (year,))
+            conn.executemany("INSERT INTO events VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self._bump(conn, "events")
+
+    def has_events(self, year: int) -> bool:
+        return self._exists("events", "year = ?", (year,))
+
+    def events(self, year: int, month: int | None = None, day: int | None = None) -> list[dict]:
+        sql = "SELECT month_label AS month, date, event FROM events WHERE year = ?"
+        params: list = [year]
+        if month is not None:
+            sql += " AND month = ?"
+            params.append(month)
+            if day is not None:
+                sql += " AND instr(date, ?) > 0"
+                params.append(str(day))
+        sql += " ORDER BY rowid"
+        return [dict(r) for r in self._query(sql, params)]
+
+    # notices ---------------------------------------------------------------
+    def upsert_notices(self, rows: Iterable[dict]) -> None:
+        """Insert notices; known ids are updated but keep their first ``crawled_at``.
+
+        Unseen ids of a department that already has notices are logged as
+        added (notices are never logged as removed).
+        """
+        data = [
+            (
+                r["id"],
+                r.get("college", ""),
+                r.get("dept", ""),
+                r.get("title", ""),
+                r.get("url", ""),
+                normalize_posted(r.get("posted_at")),
+                int(r.get("crawled_at") or time.time()),
+            )
+            for r in rows
+        ]
+        with self._connect() as conn:
+            by_dept: dict[str, list[tuple]] = {}
+            for row in data:
+                by_dept.setdefault(row[2], []).append(row)
+            for dept, dept_rows in by_dept.items():
+                known = {
+                    r[0]
+                    for r in conn.execute("SELECT id FROM notices WHERE dept = ?", (dept,))
+                }
+                if not known:
+                    continue
+                added = {
+                    i: {"college": c, "dept": d, "title": t, "url": u, "posted_at": p}
+                    for i, c, d, t, u, p, _ in dept_rows
+                    if i not in known
+                }
+                self._append_changes(
+                    conn, "notices", dept, [("added", i, r) for i, r in added.items()]
+                )
+            conn.executemany(
+                "INSERT INTO notices VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET college = excluded.college, dept = excluded.dept, "
+                "title = excluded.title, url = excluded.url, posted_at = excluded.posted_at",
+                data,
+            )
+            self._bump(conn, "notices")
+
+    def notice_depts(self) -> list[str]:
+        return [r[0] for r in self._query("SELECT DISTINCT dept FROM notices ORDER BY dept")]
+
+    def notices(
+        self,
+        dept: str | None = None,
+        crawled_since: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Return notices newest first, optionally for one department."""
+        sql = "SELECT id, title, url, posted_at, college, dept, crawled_at FROM notices"
+        clauses, params = [], []
+        if dept is not None:
+            clauses.append("dept = ?")
+            params.append(dept)
+        if crawled_since is not None:
+            clauses.append("crawled_at >= ?")
+            params.append(crawled_since)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY posted_at DESC, crawled_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(r) for r in self._query(sql, params)]
+
+    # graduation requirements ----------------------------------------------
+    def replace_requirements(self, year: int, rows: Iterable[dict]) -> None:
+        data = [
+            (year, r.get("대학명"), r.get("학과명"), json.dumps(r, ensure_ascii=False))
+            for r in rows
+        ]
+        with self._connect() as conn:
+            old = conn.execute("SELECT row FROM requirements WHERE year = ?", (year,)).fetchall()
+            self._log_changes(
+                conn, "graduation_req", str(year),
+                (json.loads(r[0]) for r in old),
+                (json.loads(r[3]) for r in data),
+            )
+            conn.execute("DELETE FROM requirements WHERE year = ?", (year,))
+            conn.executemany("INSERT INTO requirements VALUES (?, ?, ?, ?)", data)
+            self._bump(conn, "requirements")
+
+    def requirement_years(self) -> list[int]:
+        return [r[0] for r in self._query("SELECT DISTINCT year FROM requirements ORDER BY year")]
+
+    def requirement_depts(self, year: int | None = None) -> list[str]:
+        """Department names of ``year`` (every year when ``None``)."""
+        sql = "SELECT DISTINCT dept FROM requirements WHERE dept IS NOT NULL AND dept != ''"
+        params: list = []
+        if year is not None:
+            sql += " AND year = ?"
+            params.append(year)
+        return [r[0] for r in self._query(sql, params)]
+
+    def requirements(self, year: int, depts: Sequence[str] | None = None) -> list[dict]:
+        sql = "SELECT row FROM requirements WHERE year = ?"
+        params: list = [year]
+        if depts is not None:
+            sql += f" AND dept IN ({', '.join('?' for _ in depts)})"
+            params.extend(depts)
+        sql += " ORDER BY rowid"
+        return [json.loads(r[0]) for r in self._query(sql, params)]
+
+    # shuttle bus -----------------------------------------------------------
+    def replace_shuttle(self, items: Iterable[dict], crawled_at: str) -> None:
+        rows = [
+            (it.get("type"), json.dumps(it.get("row", []), ensure_ascii=False), crawled_at)
+            for it in items
+        ]
+        with self._connect() as conn:
+            old = conn.execute("SELECT type, row FROM shuttle").fetchall()
+            self._log_changes(
+                conn, "shuttle_bus", "",
+                ({"type": r[0], "row": json.loads(r[1])} for r in old),
+                ({"type": r[0], "row": json.loads(r[1])} for r in rows),
+            )
+            conn.execute("DELETE FROM shuttle")
+            conn.executemany("INSERT INTO shuttle VALUES (?, ?, ?)", rows)
+            self._bump(conn, "shuttle")
+
+    def has_shuttle(self) -> bool:
+        return self._exists("shuttle", "1", ())
+
+    def shuttle(self, bus_type: str | None = None) -> list[dict]:
+        sql = "SELECT type, row FROM shuttle"
+        params: list = []
+        if bus_type is not None:
+            sql += " WHERE type = ?"
+            params.append(bus_type)
+        sql += " ORDER BY rowid"
+        return [{"type": r["type"], "row": json.loads(r["row"])} for r in self._query(sql, params)]
+
+
+def import_raw(store: LocalStore, root: Path | None = None) -> None:
+    """Load the existing exports under ``data/raw`` into ``store``."""
+    from .graduation_req import clean_requirements
+    from .notices import _make_id, is_snapshot, snapshot_target
+    import pandas as pd
+
+    root = Path(root or settings.data_dir / "raw")
+
+    def _json(path: Path) -> dict:
+        try:
+            with path.open(encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    for path in sorted((root / "meals").glob("*.json")):
+        payload = _json(path)
+        store.replace_meals(path.stem, payload.get("items", []), payload.get("crawled_at", ""))
+
+    for path in sorted((root / "academic_calendar").glob("*/data.json")):
+        if path.parent.name.isdigit():
+            payload = _json(path)
+            store.replace_events(int(path.parent.name), payload.get("items", []), payload.get("crawled_at", ""))
+
+    for path in sorted((root / "notices").glob("*.csv")):
+        if is_snapshot(path) and snapshot_target(path).exists():
+            # already merged into the compacted per-department file; snapshots
+            # of departments never compacted are imported as they are
+            continue
+        with path.open(encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+        for row in rows:
+            row["id"] = _make_id(row.get("url", ""), row.get("title", ""))
+        store.upsert_notices(rows)
+
+    for path in sorted((root / "graduation_req").glob("*.csv")):
+        if not path.stem.isdigit():
+            continue
+        try:
+            df = pd.read_csv(path)
+        except Exception:
+            continue
+        store.replace_requirements(int(path.stem), clean_requirements(df))
+
+    shuttle = root / "shuttle_bus" / "data.json"
+    if shuttle.exists():
+        payload = _json(shuttle)
+        store.replace_shuttle(payload.get("items", []), payload.get("crawled_at", ""))
+
+
+_store: LocalStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> LocalStore:
+    """Return the process-wide store, importing ``data/raw`` into a new database."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = LocalStore()
+                if store.created:
+                    logger.info("Importing data/raw into the local store")
+                    import_raw(store)
+                _store = store
+    return _store
+
+
+if __name__ == "__main__":
+    import_raw(get_store())
+    print(f"imported data/raw into {STORE_PATH}")
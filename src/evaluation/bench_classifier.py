@@ -0,0 +1,97 @@
+"""Compare the CPU backends of the intent classifier.
+
+For each backend (see :mod:`src.classifier`) reports model load time,
+single-question latency, batched throughput, accuracy on the labelled
+question sets and how often it agrees with the first backend listed
+(full-precision ``torch`` by default)::
+
+    python -m src.evaluation.bench_classifier --backends torch int8 onnx
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+
+from src.classifier import load_classifier
+from src.utils.config import settings
+
+DATASETS = [settings.data_dir / "test_cls.json", *sorted((settings.data_dir / "question").glob("*_result.json"))]
+
+
+def load_questions(paths: list[Path]) -> list[tuple[str, int]]:
+    """(question, label) pairs from JSON arrays of ``{"question", "label"}``."""
+    items = []
+    for path in paths:
+        if not path.exists():
+            continue
+        for item in json.loads(path.read_text(encoding="utf-8")):
+            items.append((item["question"], int(item["label"])))
+    return items
+
+
+def bench(backend: str, model: Path | None, items: list[tuple[str, int]], batch: int) -> tuple[dict, list[int]]:
+    start = time.perf_counter()
+    clf = load_classifier(backend, model)
+    load = time.perf_counter() - start
+    questions = [q for q, _ in items]
+
+    clf.predict(questions[0])  # warm-up
+    clf.encode.cache_clear()
+    times = []
+    preds = []
+    for q in questions:
+        t = time.perf_counter()
+        preds.append(clf.predict(q))
+        times.append(time.perf_counter() - t)
+    times.sort()
+
+    clf.encode.cache_clear()  # batched throughput includes tokenization
+    start = time.perf_counter()
+    for i in range(0, len(questions), batch):
+        clf.predict_batch(questions[i:i + batch])
+    wall = time.perf_counter() - start
+
+    correct = sum(p == label for p, (_, label) in zip(preds, items))
+    return {
+        "load_s": load,
+        "p50_ms": statistics.median(times) * 1000,
+        "p95_ms": times[min(len(times) - 1, int(len(times) * 0.95))] * 1000,
+        "throughput": len(questions) / wall,
+        "accuracy": correct / len(items),
+    }, preds
+
+
+def run(backends: list[str], model: Path | None, batch: int) -> None:
+    items = load_questions(DATASETS)
+    if not items:
+        print("no labelled questions found")
+        return
+    print(f"{len(items)} questions, batch size {batch}")
+    print(f"{'backend':<7} {'load':>7} {'p50':>9} {'p95':>9} {'q/s':>8} {'acc':>7} {'agree':>7}")
+    reference = None
+    for backend in backends:
+        try:
+            result, preds = bench(backend, model, items, batch)
+        except ImportError as e:
+            print(f"{backend:<7} skipped: {e}")
+            continue
+        if reference is None:
+            reference = preds
+        agree = sum(a == b for a, b in zip(preds, reference)) / len(preds)
+        print(
+            f"{backend:<7} {result['load_s']:6.1f}s {result['p50_ms']:7.2f}ms {result['p95_ms']:7.2f}ms "
+            f"{result['throughput']:8.1f} {result['accuracy']:7.1%} {agree:7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Benchmark classifier backends")
+    ap.add_argument("--model", type=Path, default=None, help="model directory (default: settings.classifier_path)")
+    ap.add_argument("--backends", nargs="+", default=["torch", "int8", "onnx"], choices=["torch", "int8", "onnx"])
+    ap.add_argument("--batch", type=int, default=settings.classifier_max_batch)
+    args = ap.parse_args()
+    run(args.backends, args.model, args.batch)
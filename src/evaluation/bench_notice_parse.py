@@ -0,0 +1,100 @@
+"""Benchmark notice list parsing: BeautifulSoup probing vs lxml + profile.
+
+Pages are read from ``--pages`` (one ``.html`` file per board plus an
+``index.json`` describing them). Use ``--fetch`` to download the boards
+listed in ``data/links.txt`` first.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.crawlers.notices import NoticeCrawler, extract_rows, load_links, resilient_get
+from src.utils.config import settings
+
+DEFAULT_PAGES = settings.data_dir / "cache" / "notice_pages"
+
+
+def fetch_pages(out_dir: Path, workers: int = 8) -> None:
+    """Download every board in ``links.txt`` into ``out_dir``."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    index: dict[str, dict] = {}
+
+    def task(link):
+        college, dept, url = link
+        try:
+            resp = resilient_get(url)
+        except Exception:
+            return None
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".html"
+        (out_dir / name).write_text(resp.text, encoding="utf-8")
+        return name, {"url": resp.url, "college": college, "dept": dept}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for res in pool.map(task, load_links(NoticeCrawler.LINKS_FILE)):
+            if res:
+                index[res[0]] = res[1]
+    with (out_dir / "index.json").open("w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+
+def _key(rows: list[dict]) -> list[tuple[str, str, str]]:
+    return [(r["title"], r["url"], r["posted_at"]) for r in rows]
+
+
+def run(pages_dir: Path, repeat: int) -> None:
+    with (pages_dir / "index.json").open(encoding="utf-8") as f:
+        index = json.load(f)
+    pages = [
+        ((pages_dir / name).read_text(encoding="utf-8"), meta)
+        for name, meta in index.items()
+        if (pages_dir / name).exists()
+    ]
+    if not pages:
+        print("no saved pages")
+        return
+
+    # learn the profile once, like the first crawl of each board
+    profiles = [extract_rows(text, m["url"], m["college"], m["dept"])[0] for text, m in pages]
+
+    old_time = new_time = 0.0
+    mismatches = 0
+    for _ in range(repeat):
+        for (text, m), preferred in zip(pages, profiles):
+            t0 = time.perf_counter()
+            _, old_rows = extract_rows(text, m["url"], m["college"], m["dept"], parser="html.parser")
+            t1 = time.perf_counter()
+            _, new_rows = extract_rows(text, m["url"], m["college"], m["dept"], preferred=preferred)
+            t2 = time.perf_counter()
+            old_time += t1 - t0
+            new_time += t2 - t1
+            if _key(old_rows) != _key(new_rows):
+                mismatches += 1
+
+    runs = len(pages) * repeat
+    print(f"pages: {len(pages)}  repeat: {repeat}")
+    print(f"html.parser + probing : {old_time:.3f}s total, {old_time / runs * 1000:.2f} ms/page")
+    print(f"lxml + profile        : {new_time:.3f}s total, {new_time / runs * 1000:.2f} ms/page")
+    if new_time:
+        print(f"speedup               : {old_time / new_time:.1f}x")
+    print(f"pages with differing rows: {mismatches // repeat}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--pages", type=Path, default=DEFAULT_PAGES)
+    ap.add_argument("--fetch", action="store_true", help="download boards before benchmarking")
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+    if args.fetch:
+        fetch_pages(args.pages)
+    run(args.pages, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
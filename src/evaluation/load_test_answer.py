@@ -0,0 +1,103 @@
+"""Load test of ``/answer`` with a mix of fast and slow questions.
+
+Fast questions are answered from local data (and the answer cache); slow
+ones ask for data that is not stored locally, so their handlers wait on a
+background crawl up to the request deadline. With the handlers off the
+event loop, fast questions keep their latency while slow ones are in
+flight. Requests bypass the answer cache unless ``--use-cache`` is given,
+so the fast-path latency is that of the handlers rather than of cache
+hits. Run against a server started with ``uvicorn src.realtime_model:app``::
+
+    python -m src.evaluation.load_test_answer --requests 200 --concurrency 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+API_URL = "http://localhost:8000"
+
+FAST_QUESTIONS = [
+    "오늘 학식 뭐야?",
+    "학사일정 알려줘",
+    "컴퓨터융합학부 공지 알려줘",
+    "2025학년도 컴퓨터융합학부 졸업 학점",
+    "셔틀버스 시간표 알려줘",
+]
+
+# dates far from the crawled window: the meals handler waits on a crawl
+SLOW_QUESTIONS = [
+    f"2019년 {m}월 {d}일 2학 점심 뭐였어?" for m in (3, 4, 5, 6) for d in (4, 11, 18)
+]
+
+
+def _ask(url: str, question: str, timeout: float, use_cache: bool) -> tuple[float, bool]:
+    start = time.perf_counter()
+    try:
+        payload = {"question": question, "cache": use_cache}
+        ok = requests.post(f"{url}/answer", json=payload, timeout=timeout).ok
+    except requests.RequestException:
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+def _summary(name: str, samples: list[tuple[float, bool]]) -> str:
+    if not samples:
+        return f"{name:<5} no requests"
+    times = sorted(t for t, _ in samples)
+    p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+    errors = sum(1 for _, ok in samples if not ok)
+    return (
+        f"{name:<5} n={len(samples):<5} p50={statistics.median(times) * 1000:8.1f}ms "
+        f"p95={p95 * 1000:8.1f}ms max={times[-1] * 1000:8.1f}ms errors={errors}"
+    )
+
+
+def run(
+    url: str,
+    total: int,
+    concurrency: int,
+    slow_ratio: float,
+    timeout: float,
+    seed: int,
+    use_cache: bool = False,
+) -> None:
+    rng = random.Random(seed)
+    plan = [
+        ("slow", rng.choice(SLOW_QUESTIONS)) if rng.random() < slow_ratio else ("fast", rng.choice(FAST_QUESTIONS))
+        for _ in range(total)
+    ]
+    results: dict[str, list[tuple[float, bool]]] = {"fast": [], "slow": []}
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [(kind, pool.submit(_ask, url, q, timeout, use_cache)) for kind, q in plan]
+        for kind, fut in futures:
+            results[kind].append(fut.result())
+    wall = time.perf_counter() - start
+
+    print(
+        f"{total} requests, concurrency {concurrency}, slow ratio {slow_ratio:.0%}, "
+        f"answer cache {'on' if use_cache else 'bypassed'}"
+    )
+    for kind in ("fast", "slow"):
+        print(_summary(kind, results[kind]))
+    print(f"wall {wall:.1f}s, throughput {total / wall:.1f} req/s")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Load test /answer with fast and slow questions")
+    ap.add_argument("--url", default=API_URL)
+    ap.add_argument("--requests", type=int, default=200)
+    ap.add_argument("--concurrency", type=int, default=32)
+    ap.add_argument("--slow-ratio", type=float, default=0.2)
+    ap.add_argument("--timeout", type=float, default=30)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--use-cache", action="store_true", help="let repeated questions hit the answer cache")
+    args = ap.parse_args()
+    run(args.url, args.requests, args.concurrency, args.slow_ratio, args.timeout, args.seed, args.use_cache)
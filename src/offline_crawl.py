@@ -1,31 +1,211 @@
+from __future__ import annotations
+
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Callable
 
+from .readiness import get_readiness
 from .utils.config import settings
 
+from .crawlers.archive import get_archive, to_response
+from .crawlers.base import BaseCrawler, CrawlStats
 from .crawlers.academic_calendar import AcademicCalendarCrawler
-from .crawlers.meals import MealsCrawler
+from .crawlers.meals import MealsCrawler, crawl_meals
 from .crawlers.shuttle_bus import ShuttleBusCrawler
-from .crawlers.graduation_req import GraduationRequirementCrawler
+from .crawlers.graduation_req import GraduationRequirementCrawler, parse_all_years
 from .crawlers.notices import NoticeCrawler
 
 
-def build_offline_db(year_start: int, year_end: int, days: int) -> None:
-    """Crawl a range of data to populate local cache."""
+@dataclass
+class JobResult:
+    """Outcome of one crawler job in :func:`run_jobs`."""
+
+    name: str
+    ok: bool = True
+    error: str = ""
+    seconds: float = 0.0
+    stats: CrawlStats = field(default_factory=CrawlStats)
+
+
+def _run_crawler(crawler: BaseCrawler, stats: CrawlStats) -> bool:
+    ok = crawler.run()
+    stats.merge(crawler.stats)
+    return ok
+
+
+def build_jobs(year_start: int, year_end: int, days: int) -> dict[str, Callable[[CrawlStats], None]]:
+    """Return the independent crawler jobs of the offline build by name."""
     data_root = settings.data_dir / "raw"
 
-    for year in range(year_start, year_end + 1):
-        AcademicCalendarCrawler(data_root / "academic_calendar", year).run()
-        GraduationRequirementCrawler(data_root / "graduation_req", year).run()
+    def academic_calendar(stats: CrawlStats) -> None:
+        for year in range(year_start, year_end + 1):
+            _run_crawler(AcademicCalendarCrawler(data_root / "academic_calendar", year), stats)
+
+    def graduation_req(stats: CrawlStats) -> None:
+        # every PDF year in one page-parallel pass; the run below picks the
+        # latest PDF and reuses the content-hash cache to refresh ``data.csv``.
+        # Its counters are not merged: parse_all_years already counted that PDF
+        parse_all_years(data_root / "graduation_req", stats=stats)
+        if not GraduationRequirementCrawler(data_root / "graduation_req").run():
+            stats.add(failed=1)
+
+    def meals(stats: CrawlStats) -> None:
+        dates = [(datetime.now() - timedelta(days=d)).strftime("%Y%m%d") for d in range(days)]
+        crawl_meals(data_root / "meals", dates, stats=stats)
+
+    def notices(stats: CrawlStats) -> None:
+        _run_crawler(NoticeCrawler(data_root / "notices"), stats)
+
+    def shuttle_bus(stats: CrawlStats) -> None:
+        _run_crawler(ShuttleBusCrawler(data_root / "shuttle_bus"), stats)
+
+    return {
+        "academic_calendar": academic_calendar,
+        "graduation_req": graduation_req,
+        "meals": meals,
+        "notices": notices,
+        "shuttle_bus": shuttle_bus,
+    }
+
+
+def run_jobs(
+    jobs: dict[str, Callable[[CrawlStats], None]],
+    max_workers: int | None = None,
+    on_done: Callable[[JobResult], None] | None = None,
+) -> list[JobResult]:
+    """Run ``jobs`` concurrently; a failing job does not stop the others.
+
+    Each successful job is recorded in the readiness manifest; ``on_done``
+    is called with every result as soon as its job finishes.
+    """
+
+    def task(name: str) -> JobResult:
+        result = JobResult(name)
+        start = time.perf_counter()
+        try:
+            jobs[name](result.stats)
+        except Exception as e:
+            result.ok = False
+            result.error = f"{type(e).__name__}: {e}"
+        result.seconds = time.perf_counter() - start
+        get_readiness().record(name, result.ok)
+        if on_done is not None:
+            on_done(result)
+        return result
 
-    for d in range(days):
-        date = (datetime.now() - timedelta(days=d)).strftime("%Y%m%d")
-        MealsCrawler(data_root / "meals", date).run()
+    workers = max(1, min(max_workers or settings.crawl_max_workers, len(jobs) or 1))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(task, jobs))
 
-    NoticeCrawler(data_root / "notices").run()
-    ShuttleBusCrawler(data_root / "shuttle_bus").run()
+
+def format_report(results: list[JobResult], wall: float) -> str:
+    lines = [
+        f"{'job':<18} {'status':<7} {'time(s)':>8} {'bytes':>11} "
+        f"{'records':>8} {'unchanged':>9} {'failed':>6}"
+    ]
+    for r in results:
+        status = "FAIL" if not r.ok else ("partial" if r.stats.failed else "ok")
+        lines.append(
+            f"{r.name:<18} {status:<7} {r.seconds:>8.1f} {r.stats.bytes:>11,} "
+            f"{r.stats.records:>8} {r.stats.not_modified:>9} {r.stats.failed:>6}"
+        )
+    for r in results:
+        if not r.ok:
+            lines.append(f"  {r.name}: {r.error}")
+    serial = sum(r.seconds for r in results)
+    lines.append(f"wall time {wall:.1f}s (sum of jobs {serial:.1f}s)")
+    return "\n".join(lines)
+
+
+def build_offline_db(
+    year_start: int,
+    year_end: int,
+    days: int,
+    max_workers: int | None = None,
+) -> list[JobResult]:
+    """Crawl a range of data to populate local cache.
+
+    The crawler jobs are independent and run concurrently; a timing report is
+    printed when all of them have finished.
+    """
+    start = time.perf_counter()
+    results = run_jobs(build_jobs(year_start, year_end, days), max_workers)
+    print(format_report(results, time.perf_counter() - start))
+    return results
+
+
+# archived crawler name -> (class, output directory under ``data/raw``)
+REPARSE_TARGETS: dict[str, tuple[type[BaseCrawler], str]] = {
+    "AcademicCalendarCrawler": (AcademicCalendarCrawler, "academic_calendar"),
+    "MealsCrawler": (MealsCrawler, "meals"),
+    "NoticeCrawler": (NoticeCrawler, "notices"),
+    "ShuttleBusCrawler": (ShuttleBusCrawler, "shuttle_bus"),
+}
+
+
+def _reparse_task(task: tuple[str, dict, dict[str, dict]]) -> tuple[str, CrawlStats, float]:
+    """Worker: re-run one crawler against its archived responses."""
+    name, context, records = task
+    start = time.perf_counter()
+    cls, subdir = REPARSE_TARGETS[name]
+    crawler = cls(settings.data_dir / "raw" / subdir, **context)
+    crawler.replay = {key: to_response(rec) for key, rec in records.items()}
+    crawler.run(force=True)
+    return name, crawler.stats, time.perf_counter() - start
+
+
+def reparse_archive(max_workers: int | None = None) -> list[JobResult]:
+    """Rebuild ``data/raw`` from the response archive without any network I/O.
+
+    The newest archived responses of every crawler run (per year, per date,
+    ...) are parsed again on a process pool; graduation tables (``<year>.csv``
+    and ``data.csv``) are rebuilt from the local PDFs.
+    """
+    start = time.perf_counter()
+    tasks = [
+        (name, json.loads(context), records)
+        for (name, context), records in get_archive().latest().items()
+        if name in REPARSE_TARGETS
+    ]
+    results = {name: JobResult(subdir) for name, (_, subdir) in REPARSE_TARGETS.items()}
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        for name, stats, seconds in pool.map(_reparse_task, tasks):
+            results[name].stats.merge(stats)
+            results[name].seconds += seconds
+
+    grad = JobResult("graduation_req")
+    grad_start = time.perf_counter()
+    grad_dir = settings.data_dir / "raw" / "graduation_req"
+    parse_all_years(grad_dir, stats=grad.stats)
+    # data.csv of the latest PDF; its tables come from the cache just filled
+    GraduationRequirementCrawler(grad_dir).run(force=True)
+    grad.seconds = time.perf_counter() - grad_start
+
+    wall = time.perf_counter() - start
+    report = [r for r in results.values() if r.stats.records or r.stats.failed] + [grad]
+    print(format_report(report, wall))
+    return report
 
 
 if __name__ == "__main__":
-    build_offline_db(datetime.now().year - 1, datetime.now().year, 7)
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Build the local crawl database")
+    ap.add_argument("--days", type=int, default=7, help="days of meals to crawl")
+    ap.add_argument("--workers", type=int, default=settings.crawl_max_workers)
+    ap.add_argument(
+        "--reparse",
+        action="store_true",
+        help="rebuild data/raw from archived responses instead of crawling",
+    )
+    args = ap.parse_args()
 
+    if args.reparse:
+        reparse_archive(args.workers)
+    else:
+        year = datetime.now().year
+        build_offline_db(year - 1, year, args.days, args.workers)
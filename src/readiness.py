@@ -0,0 +1,196 @@
+"""Data-readiness manifest and the tracked cold-start build.
+
+The crawl pipeline records every successful source refresh in
+``data/manifest.json``: when it last succeeded, how many records the store
+holds and the store's content version. The manifest is read once per
+process; answer handlers only consult the in-memory copy. Sources with no
+local data at start-up are refreshed through the scheduler under their own
+source keys, so the periodic refresh never crawls them a second time; the
+progress of that cold start is reported by :meth:`Readiness.progress`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from .utils.config import settings
+from .utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MANIFEST_PATH = settings.data_dir / "manifest.json"
+
+# source -> store table holding its records
+SOURCE_TABLES = {
+    "academic_calendar": "events",
+    "graduation_req": "requirements",
+    "meals": "meals",
+    "notices": "notices",
+    "shuttle_bus": "shuttle",
+}
+
+
+def _store():
+    from .crawlers.store import get_store
+
+    return get_store()
+
+
+@dataclass
+class ColdStart:
+    """Progress of the background build of sources missing at start-up."""
+
+    sources: list[str]
+    started: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+    jobs: dict[str, str] = field(default_factory=dict)  # source -> ok / error
+
+    def as_dict(self) -> dict:
+        end = self.finished if self.finished is not None else time.monotonic()
+        return {
+            "running": self.finished is None,
+            "total": len(self.sources),
+            "done": len(self.jobs),
+            "jobs": {s: self.jobs.get(s, "pending") for s in self.sources},
+            "elapsed": round(end - self.started, 1),
+        }
+
+
+class Readiness:
+    """In-memory view of the manifest plus the cold-start job."""
+
+    def __init__(self, path: Path = MANIFEST_PATH):
+        self.path = Path(path)
+        self.sources: dict[str, dict] = {}
+        self.cold_start: ColdStart | None = None
+        self.checked = False
+        self._lock = threading.Lock()
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                self.sources = json.load(f).get("sources", {})
+        except (OSError, json.JSONDecodeError):
+            self.sources = {}
+
+    def _write(self) -> None:
+        tmp = self.path.with_suffix(".tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"sources": self.sources}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
+
+    def job_done(self, key: str, error: str | None = None) -> None:
+        """Scheduler callback: job ``key`` finished, failing with ``error``.
+
+        ``key`` is a source name or a slice of one (``meals:<date>``).
+        """
+        source = key.split(":")[0]
+        if error is None:
+            self.record(source)
+        progress = self.cold_start
+        if progress is not None and key in progress.sources and key not in progress.jobs:
+            progress.jobs[key] = "ok" if error is None else error
+            logger.info(
+                f"cold start {len(progress.jobs)}/{len(progress.sources)}: {key} "
+                f"{'ok' if error is None else 'failed'}"
+            )
+            if len(progress.jobs) == len(progress.sources):
+                progress.finished = time.monotonic()
+
+    def record(self, source: str, success: bool = True) -> None:
+        """Record a successful refresh of ``source`` with its store counts."""
+        table = SOURCE_TABLES.get(source)
+        if table is None or not success:
+            return
+        store = _store()
+        entry = {
+            "last_success": datetime.now().isoformat(timespec="seconds"),
+            "records": store.count(table),
+            "version": store.version(table),
+        }
+        with self._lock:
+            self.sources[source] = entry
+            self._write()
+
+    def is_ready(self, source: str) -> bool:
+        """True once ``source`` has records in the store."""
+        return bool(self.sources.get(source, {}).get("records"))
+
+    @property
+    def ready(self) -> bool:
+        return all(self.is_ready(s) for s in SOURCE_TABLES)
+
+    def check(self) -> "Readiness":
+        """Start-up check: adopt data already in the store, build the rest.
+
+        Sources without a manifest entry but with stored records (e.g. from
+        an older deployment or ``data/raw`` imported into a new store) are
+        recorded as-is; the others are refreshed in the background by the
+        scheduler. Runs once per process.
+        """
+        with self._lock:
+            if self.checked:
+                return self
+            self.checked = True
+        store = _store()
+        missing = []
+        for source, table in SOURCE_TABLES.items():
+            if self.is_ready(source):
+                continue
+            if store.count(table):
+                with self._lock:
+                    self.sources[source] = {
+                        "last_success": None,
+                        "records": store.count(table),
+                        "version": store.version(table),
+                    }
+            else:
+                missing.append(source)
+        with self._lock:
+            self._write()
+        if missing:
+            self._start_cold_start(missing)
+        return self
+
+    def _start_cold_start(self, sources: list[str]) -> None:
+        from .scheduler import get_scheduler
+
+        self.cold_start = ColdStart(sources)
+        logger.info(f"cold start: building {', '.join(sources)} in the background")
+        scheduler = get_scheduler()
+        for source in sources:
+            # a refresh already running under the same key is not queued twice
+            scheduler.trigger(source)
+            if self.is_ready(source):  # finished before it was tracked
+                self.job_done(source)
+
+    @property
+    def building(self) -> bool:
+        return self.cold_start is not None and self.cold_start.finished is None
+
+    def progress(self) -> dict:
+        """Manifest entries and cold-start progress, for ``/metrics``."""
+        return {
+            "ready": self.ready,
+            "sources": dict(self.sources),
+            "cold_start": self.cold_start.as_dict() if self.cold_start else None,
+        }
+
+
+_readiness: Readiness | None = None
+_readiness_lock = threading.Lock()
+
+
+def get_readiness() -> Readiness:
+    """Return the process-wide readiness state, loading the manifest once."""
+    global _readiness
+    if _readiness is None:
+        with _readiness_lock:
+            if _readiness is None:
+                _readiness = Readiness()
+    return _readiness
@@ -2,11 +2,20 @@ from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
 import json
-from transformers import AutoTokenizer, AutoModelForSequenceClassification, pipeline
-import torch
+import threading
 from .retrieval.rag_pipeline import HybridRetriever, AnswerGenerator
+from .classifier import load_classifier
 from .utils.config import settings
+from .readiness import get_readiness
+from .scheduler import get_scheduler
+from .utils.loader_cache import get_loader_cache
+from .utils.micro_batch import MicroBatcher
+from .answers import answer_budget, freshness_stats
+from .answers.answer_cache import cached_answer, get_answer_cache
 from .answers import (
     academic_calendar_answer,
     shuttle_bus_answer,
@@ -16,51 +25,36 @@ from .answers import (
 )
 
 
-class SimpleClassifier:
-    """Very naive rule based classifier returning label 0-4."""
-
-    KEYWORDS = {
-        0: ["졸업", "졸업요건", "졸업 요건"],
-        1: ["공지", "notice"],
-        2: ["학사일정", "academic", "캘린더"],
-        3: ["식단", "학식", "메뉴"],
-        4: ["셔틀", "버스", "통학"],
-    }
-
-    def predict(self, text: str) -> int:
-        text = text.lower()
-        for label, words in self.KEYWORDS.items():
-            for w in words:
-                if w.lower() in text:
-                    return label
-        return 1
-
-
-class LLMClassifier:
-    """Load fine-tuned sequence classification model to predict labels."""
-
-    def __init__(self, model_path: str = "./models/classifier"):
-        self.model = AutoModelForSequenceClassification.from_pretrained(model_path)
-        self.tokenizer = AutoTokenizer.from_pretrained(model_path)
-        device = 0 if torch.cuda.is_available() else -1
-        self.pipe = pipeline(
-            "text-classification",
-            model=self.model,
-            tokenizer=self.tokenizer,
-            return_all_scores=True,
-        )
-
-    def predict(self, text: str) -> int:
-        result = self.pipe(text)[0]
-        best = max(result, key=lambda x: x["score"])
-        return int(best["label"].split("_")[-1])
-
 app = FastAPI()
 
 # Initialize core pipeline components once at startup
 retriever = HybridRetriever()
 generator = AnswerGenerator()
-classifier = LLMClassifier()
+# backend (full precision, int8 or ONNX) chosen by settings.classifier_backend
+classifier = load_classifier()
+# concurrent questions are classified together in one forward pass
+classify = MicroBatcher(
+    classifier.predict_batch,
+    max_batch=settings.classifier_max_batch,
+    max_wait=settings.classifier_max_wait_ms / 1000,
+    workers=settings.inference_workers,
+    name="classifier",
+)
+# keep crawled data fresh in the background; handlers only read local files
+refresh_scheduler = get_scheduler(start=True)
+# read the data manifest once; missing sources are built in the background
+readiness = get_readiness().check()
+
+# handler I/O runs off the event loop on a bounded pool; inference runs on
+# the classifier's batch workers
+handler_pool = ThreadPoolExecutor(max_workers=settings.handler_workers, thread_name_prefix="handler")
+
+
+async def run_in(pool: ThreadPoolExecutor, fn, *args):
+    """Run ``fn(*args)`` on ``pool`` with the caller's context (answer budget)."""
+    ctx = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(pool, ctx.run, fn, *args)
+
 
 # Map labels to answer generator functions
 ANSWER_HANDLERS = {
@@ -72,9 +66,15 @@ ANSWER_HANDLERS = {
 }
 
 LOG_PATH = Path("outputs/realtime_output.json")
+_log_lock = threading.Lock()
 
 def append_log(record: dict):
     """Append a record to ``realtime_output.json`` using a JSON array format."""
+    with _log_lock:
+        _append_log(record)
+
+
+def _append_log(record: dict):
     LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
     records = []
     if LOG_PATH.exists():
@@ -91,18 +91,20 @@ def append_log(record: dict):
 
 class Query(BaseModel):
     question: str
+    # False bypasses the answer cache (e.g. load tests of the handlers)
+    cache: bool = True
 
 @app.post('/predict')
 async def predict(query: Query):
-    label = classifier.predict(query.question)
+    label = await asyncio.wrap_future(classify.submit(query.question))
     return {'label': label}
 
-def _route_answer(label: int, question: str) -> str:
+def _route_answer(label: int, question: str, use_cache: bool = True) -> str:
     """Route question to the appropriate answer handler."""
 
     handler = ANSWER_HANDLERS.get(label)
     if handler:
-        return handler(question)
+        return cached_answer(label, question, handler) if use_cache else handler(question)
 
     docs = retriever.retrieve(question)
     context = [{"text": d} for d in docs]
@@ -114,14 +116,23 @@ async def answer(query: Query):
     """Return an answer for ``query`` with detailed error handling."""
     label = -1
     try:
-        # Step 1: classify the question
-        label = classifier.predict(query.question)
-
-        # Step 2: generate answer based on the label
-        response_text = _route_answer(label, query.question)
-
-        append_log({"user": query.question, "model": response_text, "label": label, "status": "SUCCESS"})
-        return {"answer": response_text}
+        # the whole request runs under one deadline; handlers answer from
+        # stale local data rather than miss it
+        with answer_budget() as budget:
+            # Step 1: classify the question
+            label = await asyncio.wrap_future(classify.submit(query.question))
+
+            # Step 2: generate answer based on the label
+            response_text = await run_in(handler_pool, _route_answer, label, query.question, query.cache)
+
+        await run_in(handler_pool, append_log, {
+            "user": query.question,
+            "model": response_text,
+            "label": label,
+            "status": "SUCCESS",
+            "fresh": budget.fresh,
+        })
+        return {"answer": response_text, "fresh": budget.fresh, "stale_sources": sorted(budget.stale)}
 
     except Exception as e:
         error_code = "ERR_UNKNOWN"
@@ -134,6 +145,24 @@ async def answer(query: Query):
             error_message = f"답변 생성 중 오류가 발생했습니다 (Label: {label}): {e}"
 
         # Log failure
-        append_log({"user": query.question, "model": error_message, "label": label, "status": "FAIL"})
+        await run_in(handler_pool, append_log, {"user": query.question, "model": error_message, "label": label, "status": "FAIL"})
 
         raise HTTPException(status_code=500, detail={"code": error_code, "message": error_message})
+
+
+@app.get('/metrics')
+async def metrics():
+    """Answer freshness, cache counters and data readiness."""
+    return {
+        "freshness": freshness_stats(),
+        "loader_cache": get_loader_cache().stats(),
+        "answer_cache": get_answer_cache().stats(),
+        "classifier_batching": classify.stats(),
+        "readiness": readiness.progress(),
+    }
+
+
+@app.get('/ready')
+async def ready():
+    """Data readiness per source and progress of the cold-start build."""
+    return readiness.progress()
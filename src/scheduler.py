@@ -0,0 +1,223 @@
+"""Background refresh of crawled data with per-source TTLs.
+
+Answer handlers only read local files; keeping them fresh is the job of
+:class:`RefreshScheduler`. Its periodic loop runs inside the API server or
+standalone via ``python -m src.scheduler``; other processes (web UI, eval
+scripts) only run on-demand refreshes unless ``settings.refresh_in_process``
+is set.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable
+
+from .crawlers.registry import crawler_attr, get_crawler
+from .readiness import SOURCE_TABLES, get_readiness
+from .utils.config import settings
+from .utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# hours around breakfast, lunch and dinner when menus are refreshed hourly
+MEAL_HOURS = {7, 8, 10, 11, 12, 13, 16, 17, 18}
+
+
+@dataclass
+class Source:
+    """A periodically refreshed data source."""
+
+    name: str
+    refresh: Callable[[], object]
+    ttl: Callable[[datetime], float]  # seconds until the next refresh
+
+
+def _meals_ttl(now: datetime) -> float:
+    if now.hour in MEAL_HOURS:
+        return settings.refresh_ttl_meals
+    return settings.refresh_ttl_meals_offpeak
+
+
+def _constant(seconds_attr: str) -> Callable[[datetime], float]:
+    return lambda now: getattr(settings, seconds_attr)
+
+
+def default_sources() -> list[Source]:
+    data_root = settings.data_dir / "raw"
+
+    # crawler modules are loaded by the first refresh that needs them
+    def meals() -> None:
+        today = datetime.now().date()
+        dates = crawler_attr("meals", "date_range")(today, today + timedelta(days=6))
+        crawler_attr("meals", "crawl_meals")(data_root / "meals", dates)
+
+    def notices() -> None:
+        get_crawler("notices")(data_root / "notices").run()
+
+    def academic_calendar() -> None:
+        year = datetime.now().year
+        for y in (year - 1, year):
+            get_crawler("academic_calendar")(data_root / "academic_calendar", y).run()
+
+    def shuttle_bus() -> None:
+        get_crawler("shuttle_bus")(data_root / "shuttle_bus").run()
+
+    pdf_digests: dict[str, str] = {}
+
+    def graduation_req() -> None:
+        # re-parse only when a PDF was added or changed
+        pdf_digest = crawler_attr("graduation_req", "pdf_digest")
+        current = {
+            p.name: pdf_digest(p.read_bytes())
+            for p in get_crawler("graduation_req").PDF_DIR.glob("*.pdf")
+        }
+        if current != pdf_digests:
+            crawler_attr("graduation_req", "parse_all_years")(data_root / "graduation_req")
+            pdf_digests.clear()
+            pdf_digests.update(current)
+
+    return [
+        Source("meals", meals, _meals_ttl),
+        Source("notices", notices, _constant("refresh_ttl_notices")),
+        Source("academic_calendar", academic_calendar, _constant("refresh_ttl_calendar")),
+        Source("shuttle_bus", shuttle_bus, _constant("refresh_ttl_shuttle")),
+        Source("graduation_req", graduation_req, _constant("refresh_ttl_pdf")),
+    ]
+
+
+def _has_local_data(name: str) -> bool:
+    from .crawlers.store import get_store
+
+    table = SOURCE_TABLES.get(name)
+    return table is not None and get_store().count(table) > 0
+
+
+class RefreshScheduler:
+    """Run each source on its TTL and on-demand refreshes in the background.
+
+    Jobs run on a small thread pool; a job with the same key is never queued
+    twice, so many handlers asking for the same missing date trigger one
+    crawl.
+    """
+
+    def __init__(self, sources: list[Source] | None = None, tick: float | None = None):
+        self.sources = {s.name: s for s in (sources if sources is not None else default_sources())}
+        self.tick = tick or settings.refresh_tick
+        self._pool = ThreadPoolExecutor(max_workers=settings.refresh_workers)
+        self._lock = threading.Lock()
+        self._running: set[str] = set()
+        self._jobs: dict[str, Future] = {}
+        # sources with local data wait one TTL; missing ones are due now
+        now = time.monotonic()
+        self._next_due: dict[str, float] = {
+            name: now + s.ttl(datetime.now()) if _has_local_data(name) else 0.0
+            for name, s in self.sources.items()
+        }
+        self.last_run: dict[str, datetime] = {}
+        self.last_error: dict[str, str] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, key: str, fn: Callable[[], object]) -> bool:
+        """Run ``fn`` in the background unless ``key`` is already running."""
+        with self._lock:
+            if key in self._running:
+                return False
+            self._running.add(key)
+            self._jobs[key] = self._pool.submit(self._run, key, fn)
+        return True
+
+    def wait(self, key: str, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for job ``key``; True once it is not running."""
+        with self._lock:
+            job = self._jobs.get(key)
+        if job is None:
+            return True
+        try:
+            job.result(timeout=max(0.0, timeout))
+        except FutureTimeout:
+            return False
+        return True
+
+    def _run(self, key: str, fn: Callable[[], object]) -> None:
+        try:
+            fn()
+            self.last_error.pop(key, None)
+            get_readiness().job_done(key)
+        except Exception as e:
+            self.last_error[key] = f"{type(e).__name__}: {e}"
+            logger.warning(f"refresh {key} failed: {e}")
+            get_readiness().job_done(key, self.last_error[key])
+        finally:
+            self.last_run[key] = datetime.now()
+            with self._lock:
+                self._running.discard(key)
+                self._jobs.pop(key, None)
+
+    def trigger(self, name: str) -> bool:
+        """Refresh source ``name`` now, in the background."""
+        source = self.sources[name]
+        self._next_due[name] = time.monotonic() + source.ttl(datetime.now())
+        return self.submit(name, source.refresh)
+
+    def run_due(self) -> None:
+        now = time.monotonic()
+        for name, due in list(self._next_due.items()):
+            if now >= due:
+                self.trigger(name)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self.run_due()
+            self._stop.wait(self.tick)
+
+    def start(self) -> 'RefreshScheduler':
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="refresh-scheduler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._pool.shutdown(wait=False)
+
+
+_scheduler: RefreshScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler(start: bool = False) -> RefreshScheduler:
+    """Return the process-wide scheduler.
+
+    The periodic loop starts when ``settings.refresh_in_process`` is on, or
+    when it is unset and the caller is the server entrypoint (``start``).
+    Library code calls this without ``start``, so eval scripts and the web
+    UI do not crawl every source next to a running server; on-demand
+    :meth:`RefreshScheduler.submit` works either way.
+    """
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RefreshScheduler()
+    enabled = settings.refresh_in_process
+    if (enabled or (enabled is None and start)) and _scheduler._thread is None:
+        with _scheduler_lock:
+            _scheduler.start()
+    return _scheduler
+
+
+if __name__ == "__main__":
+    scheduler = RefreshScheduler().start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        scheduler.stop()
@@ -17,4 +17,88 @@ class Settings(BaseSettings):
     generator_model_type: Literal['local', 'openai'] = 'local'
     generator_model_name_or_path: str = "beomi/Llama-3-Open-Ko-8B"
 
+    # notice board crawling: total worker threads and concurrent requests per host
+    notice_max_workers: int = 16
+    notice_per_host: int = 2
+    # append only unseen notices, stopping after this many known rows in a row
+    notice_incremental: bool = True
+    notice_known_streak: int = 5
+    # daily notice snapshots kept after they are merged into the per-department file
+    notice_snapshot_days: int = 7
+
+    # meals: cafeteria codes queried per date and concurrent date fetches.
+    # "2학"-style cafeteria numbers in questions are columns of the first code.
+    meal_cafeteria_codes: list[str] = ["OCL03.02"]
+    meal_max_workers: int = 4
+
+    # graduation PDFs: worker processes for page-level table extraction
+    # (``None`` uses every CPU)
+    pdf_workers: int | None = None
+
+    # offline build: crawler jobs running at the same time
+    crawl_max_workers: int = 5
+
+    # keep every raw crawler response under ``data/archive`` for re-parsing
+    archive_responses: bool = True
+    # archive segments older than this are folded into one base segment that
+    # keeps only the newest response per request (0 keeps everything)
+    archive_retention_days: int = 30
+
+    # background refresh (seconds); answer handlers never crawl themselves.
+    # ``refresh_in_process``: None runs the periodic loop only in the API
+    # server (src.realtime_model); True/False force it on/off in every process
+    refresh_in_process: bool | None = None
+    refresh_tick: float = 30
+    refresh_workers: int = 2
+    refresh_ttl_meals: float = 3600             # around meal times
+    refresh_ttl_meals_offpeak: float = 6 * 3600
+    refresh_ttl_notices: float = 30 * 60
+    refresh_ttl_calendar: float = 24 * 3600
+    refresh_ttl_shuttle: float = 24 * 3600
+    refresh_ttl_pdf: float = 10 * 60           # re-hash PDFs, parse on change
+
+    # per-question budget (seconds) of the answer handlers; below the 10 s
+    # client timeout. ``answer_reserve`` is kept for building the answer
+    # when waiting for a background refresh.
+    answer_deadline: float = 8.0
+    answer_reserve: float = 1.0
+
+    # how far back (seconds) "변동/업데이트" questions look in the change log
+    change_window: float = 7 * 24 * 3600
+    # change log entries listed per answer
+    change_limit: int = 10
+
+    # parsed records kept in memory by the answer modules (LRU entries)
+    loader_cache_entries: int = 256
+
+    # serving threads: model inference and answer handlers (which may wait on
+    # crawls) run on separate pools so slow questions do not block the rest
+    inference_workers: int = 1
+    handler_workers: int = 16
+    # fine-tuned intent classifier and its CPU backend: ``torch`` (fp32),
+    # ``int8`` (dynamic quantization) or ``onnx`` (exported graph, needs
+    # onnxruntime); ``None`` threads keeps the library default and ``None``
+    # max_length the tokenizer's model maximum (e.g. 64 trades recall of long
+    # questions for latency)
+    classifier_path: Path = Path("./models/classifier")
+    classifier_backend: Literal['torch', 'int8', 'onnx'] = 'torch'
+    classifier_threads: int | None = None
+    classifier_max_length: int | None = None
+    # classifier micro-batching: questions arriving within ``max_wait_ms`` of
+    # the first queued one share a forward pass of up to ``max_batch`` items
+    classifier_max_batch: int = 16
+    classifier_max_wait_ms: float = 5
+
+    # answers reused for repeated questions until the source's data changes
+    answer_cache_entries: int = 1024
+    answer_cache_ttl: float = 300
+
+    # shared HTTP client used by all crawlers
+    http_timeout: float = 10
+    http_pool_connections: int = 32   # number of hosts kept in the pool
+    http_pool_maxsize: int = 4        # keep-alive connections per host
+    http_retries: int = 2
+    http_backoff: float = 0.5
+    http_user_agent: str = "Mozilla/5.0 (compatible; CNUNoticeBot/1.0)"
+
 settings = Settings()
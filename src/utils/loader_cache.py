@@ -0,0 +1,114 @@
+"""In-process cache for data loaded by the answer modules."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Callable, Hashable
+
+from .config import settings
+
+_MISSING = object()
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON/records: lists become tuples, dicts mapping proxies."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+class LoaderCache:
+    """LRU cache of parsed records, revalidated by a cheap stamp.
+
+    Each entry remembers the stamp it was loaded with (file mtime and size,
+    or a store table version); a lookup with a different stamp reloads the
+    entry. The bound is an entry count (``max_entries``), not memory: one
+    entry may be a whole export file.
+
+    Cached values are shared by every request, so they are stored frozen
+    (see :func:`freeze`): callers get tuples and read-only mappings and
+    must copy before modifying.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Hashable, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, stamp: Hashable, load: Callable[[], Any]) -> Any:
+        """Return the (frozen) value cached for ``key``, reloading it when ``stamp`` changed."""
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        value = freeze(load())
+        with self._lock:
+            self._entries[key] = (stamp, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def load_items(self, path: Path, default: Any = None) -> Any:
+        """Return ``items`` of a crawler JSON export.
+
+        Returns ``[]`` for a missing file and ``default`` when the JSON cannot
+        be decoded.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return []
+        return self.get(
+            ('json', str(path)),
+            (st.st_mtime_ns, st.st_size),
+            lambda: _read_items(path, default),
+        )
+
+    def stats(self) -> dict[str, float]:
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _read_items(path: Path, default: Any) -> Any:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f).get('items', [])
+    except FileNotFoundError:
+        return []
+    except json.JSONDecodeError:
+        return default
+
+
+_cache: LoaderCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_loader_cache() -> LoaderCache:
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = LoaderCache(settings.loader_cache_entries)
+    return _cache
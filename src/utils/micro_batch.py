@@ -0,0 +1,116 @@
+"""Dynamic micro-batching of concurrent model calls."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, InvalidStateError
+from typing import Any, Callable, Sequence
+
+# upper bounds (ms) of the queue-wait histogram buckets
+WAIT_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+
+class MicroBatcher:
+    """Collect concurrent requests into batches for one call of ``batch_fn``.
+
+    A worker takes the first queued item, then keeps collecting until
+    ``max_batch`` items are queued or ``max_wait`` seconds have passed since
+    that first item arrived, calls ``batch_fn(items)`` once and resolves each
+    caller's future with its result. ``workers`` threads run batches
+    concurrently (one model forward pass each).
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[Any]], Sequence[Any]],
+        max_batch: int = 16,
+        max_wait: float = 0.005,
+        workers: int = 1,
+        name: str = "micro-batch",
+    ):
+        self.batch_fn = batch_fn
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+        self._queue: queue.Queue[tuple[Any, Future, float]] = queue.Queue()
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+        self.batch_sizes: Counter[int] = Counter()
+        self.wait_hist: Counter[str] = Counter()
+        for i in range(max(1, workers)):
+            threading.Thread(target=self._loop, name=f"{name}-{i}", daemon=True).start()
+
+    def submit(self, item: Any) -> Future:
+        """Queue ``item``; the future resolves to ``batch_fn``'s result for it."""
+        fut: Future = Future()
+        self._queue.put((item, fut, time.monotonic()))
+        return fut
+
+    def __call__(self, item: Any) -> Any:
+        """Blocking :meth:`submit`."""
+        return self.submit(item).result()
+
+    def _collect(self) -> list[tuple[Any, Future, float]]:
+        batch = [self._queue.get()]
+        deadline = batch[0][2] + self.max_wait
+        while len(batch) < self.max_batch:
+            timeout = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _record(self, batch: list[tuple[Any, Future, float]], started: float) -> None:
+        with self._lock:
+            self.batches += 1
+            self.items += len(batch)
+            self.batch_sizes[len(batch)] += 1
+            for _, _, queued in batch:
+                wait_ms = (started - queued) * 1000
+                bucket = next((f"<={b}" for b in WAIT_BUCKETS_MS if wait_ms <= b), f">{WAIT_BUCKETS_MS[-1]}")
+                self.wait_hist[bucket] += 1
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._collect()
+            # callers that gave up (e.g. a cancelled ``asyncio.wrap_future``)
+            # are dropped; the rest can no longer be cancelled
+            batch = [entry for entry in batch if entry[1].set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            self._record(batch, time.monotonic())
+            try:
+                results = self.batch_fn([item for item, _, _ in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(f"batch_fn returned {len(results)} results for {len(batch)} items")
+            except Exception as e:
+                self._resolve(batch, error=e)
+                continue
+            self._resolve(batch, results)
+
+    @staticmethod
+    def _resolve(batch, results: Sequence[Any] = (), error: Exception | None = None) -> None:
+        for i, (_, fut, _) in enumerate(batch):
+            try:
+                if error is not None:
+                    fut.set_exception(error)
+                else:
+                    fut.set_result(results[i])
+            except InvalidStateError:
+                pass
+
+    def stats(self) -> dict:
+        """Batch-size and queue-wait histograms."""
+        with self._lock:
+            buckets = [f"<={b}" for b in WAIT_BUCKETS_MS] + [f">{WAIT_BUCKETS_MS[-1]}"]
+            return {
+                "batches": self.batches,
+                "items": self.items,
+                "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+                "batch_size": {size: self.batch_sizes[size] for size in sorted(self.batch_sizes)},
+                "queue_wait_ms": {b: self.wait_hist[b] for b in buckets if self.wait_hist[b]},
+            }
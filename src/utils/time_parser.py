@@ -1,6 +1,8 @@
 import re
+from dataclasses import dataclass
 from datetime import datetime, timedelta, date
-from typing import Tuple
+from functools import lru_cache
+from typing import Iterable, Tuple
 
 DAY_MAP = {"월":0,"화":1,"수":2,"목":3,"금":4,"토":5,"일":6}
 
@@ -24,6 +26,7 @@ HOLIDAYS_EXTRA = {
 }
 
 
+@lru_cache(maxsize=1024)
 def is_holiday(d: date) -> str | None:
     """Return the holiday name for date ``d`` if it is a public holiday."""
     names = []
@@ -38,69 +41,206 @@ def is_holiday(d: date) -> str | None:
     return None
 
 
+_MONTH = r"(?<!\d)(\d{1,2})월"
+_DAY = r"(?<!\d)(\d{1,2})일"
+
+# One alternation scanned left to right. At a given position the first
+# alternative that matches wins, so longer forms ("2025년 5월 3일",
+# "지난 월요일") are listed before their prefixes ("2025년", "지난 주").
+_PATTERNS = [
+    ("range", rf"(?:(20\d{{2}})년\s*)?{_MONTH}\s*{_DAY}\s*(?:부터|에서|~|-)\s*(?:{_MONTH}\s*)?{_DAY}(?:\s*까지)?"),
+    ("ymd", rf"(20\d{{2}})년\s*{_MONTH}\s*{_DAY}"),
+    ("ym", rf"(20\d{{2}})년\s*{_MONTH}"),
+    ("y", r"(20\d{2})년"),
+    ("md", rf"{_MONTH}\s*{_DAY}"),
+    ("m", _MONTH),
+    ("rel_days", r"(\d+)일\s*(후|전)"),
+    ("weekday", r"(지난|이번|다음)\s*(주\s*)?([월화수목금토일])요일"),
+    ("weekend", r"(이번|다음|지난)\s*주말"),
+    ("week", r"(이번|다음|지난)\s*주(?!\s*[월화수목금토일]요일)"),
+    ("rel_month", r"(이번|다음|지난|저번)\s*달"),
+    ("window", r"(최근|지난)\s*(\d+|한|두|세|일)?\s*(주일|개월|일|주|달)"),
+    ("word", r"오늘|내일|모레|어제"),
+]
+# every alternative starts with a digit or one of these syllables; the
+# lookahead rejects other positions before the alternation is tried
+_FIRST = r"(?=[\d오내모어지이다저최])"
+_SCANNER = re.compile(_FIRST + "(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in _PATTERNS) + ")")
+# numbered groups of each alternative within ``_SCANNER``
+_GROUPS: dict[str, range] = {}
+for _name, _pattern in _PATTERNS:
+    _first = _SCANNER.groupindex[_name] + 1
+    _GROUPS[_name] = range(_first, _first + re.compile(_pattern).groups)
+
+_WORD_DAYS = {"오늘": 0, "내일": 1, "모레": 2, "어제": -1}
+_WEEK_OFFSET = {"이번": 0, "다음": 7, "지난": -7}
+_MONTH_OFFSET = {"이번": 0, "다음": 1, "지난": -1, "저번": -1}
+_COUNTS = {"한": 1, "두": 2, "세": 3, "일": 1}
+_UNIT_DAYS = {"일": 1, "주": 7, "주일": 7, "달": 30, "개월": 30}
+
+# precedence of the single date returned by ``TimeParser.parse``
+_RANK = {
+    "오늘": 0, "내일": 1, "모레": 2, "어제": 3, "후": 4, "전": 5,
+    "weekday_past": 6, "weekday": 7, "week_past": 8, "week_next": 9,
+    "ymd": 10, "range": 11, "md": 11, "ym": 12, "m": 13, "rel_month": 14, "y": 15,
+}
+
+
+@dataclass(frozen=True)
+class TimeExpr:
+    """A time expression found in a question.
+
+    ``start``/``end`` is the covered date range (equal for a single day);
+    ``status`` is the granularity reported by :meth:`TimeParser.parse`
+    (``exact``, ``month`` or ``year``) and ``span`` the position in the text.
+    """
+
+    kind: str
+    start: date
+    end: date
+    status: str
+    span: tuple[int, int]
+    rank: int | None = None
+
+
+def _month_end(d: date) -> date:
+    nxt = date(d.year + d.month // 12, d.month % 12 + 1, 1)
+    return nxt - timedelta(days=1)
+
+
+def _build(kind: str, g: list[str | None], base: date, span: tuple[int, int]) -> TimeExpr | None:
+    if kind == "range":
+        y, m1, d1, m2, d2 = g
+        year = int(y) if y else base.year
+        start = date(year, int(m1), int(d1))
+        end = date(year, int(m2 or m1), int(d2))
+        if end < start:
+            end = date(year + 1, end.month, end.day)
+        return TimeExpr("range", start, end, "exact", span, _RANK["ymd" if y else "range"])
+    if kind == "ymd":
+        d = date(int(g[0]), int(g[1]), int(g[2]))
+        return TimeExpr(kind, d, d, "exact", span, _RANK[kind])
+    if kind == "md":
+        d = date(base.year, int(g[0]), int(g[1]))
+        return TimeExpr(kind, d, d, "exact", span, _RANK[kind])
+    if kind in ("ym", "m"):
+        d = date(int(g[0]), int(g[1]), 1) if kind == "ym" else date(base.year, int(g[0]), 1)
+        return TimeExpr(kind, d, _month_end(d), "month", span, _RANK[kind])
+    if kind == "y":
+        y = int(g[0])
+        return TimeExpr(kind, date(y, 1, 1), date(y, 12, 31), "year", span, _RANK[kind])
+    if kind == "rel_days":
+        n = int(g[0])
+        d = base + timedelta(days=n if g[1] == "후" else -n)
+        return TimeExpr(kind, d, d, "exact", span, _RANK[g[1]])
+    if kind == "weekday":
+        rel, week, target = g[0], g[1], DAY_MAP[g[2]]
+        if rel == "지난" and not week:
+            diff = (base.weekday() - target + 7) % 7 or 7
+            d = base - timedelta(days=diff)
+            return TimeExpr(kind, d, d, "exact", span, _RANK["weekday_past"])
+        if rel == "다음" and week:
+            d = base + timedelta(days=7 + (target - base.weekday() + 7) % 7)
+        elif rel == "다음":
+            d = base + timedelta(days=(target - base.weekday() + 7) % 7 or 7)
+        else:
+            monday = base - timedelta(days=base.weekday()) + timedelta(days=_WEEK_OFFSET[rel])
+            d = monday + timedelta(days=target)
+        return TimeExpr(kind, d, d, "exact", span, _RANK["weekday"])
+    if kind in ("week", "weekend"):
+        monday = base - timedelta(days=base.weekday()) + timedelta(days=_WEEK_OFFSET[g[0]])
+        rank = {"지난": _RANK["week_past"], "다음": _RANK["week_next"]}.get(g[0])
+        start = monday + timedelta(days=5) if kind == "weekend" else monday
+        return TimeExpr(kind, start, monday + timedelta(days=6), "exact", span, rank)
+    if kind == "rel_month":
+        index = base.year * 12 + base.month - 1 + _MONTH_OFFSET[g[0]]
+        d = date(index // 12, index % 12 + 1, 1)
+        return TimeExpr(kind, d, _month_end(d), "month", span, _RANK[kind])
+    if kind == "window":
+        count = g[1]
+        n = int(count) if count and count.isdigit() else _COUNTS.get(count, 1)
+        return TimeExpr(kind, base - timedelta(days=n * _UNIT_DAYS[g[2]]), base, "exact", span)
+    return None
+
+
+@lru_cache(maxsize=4096)
+def scan(text: str, base: date) -> tuple[TimeExpr, ...]:
+    """Return every time expression in ``text`` relative to ``base``, in order.
+
+    The text is scanned once with a single compiled pattern; results are
+    memoized per ``(text, base)``.
+    """
+    found: list[TimeExpr] = []
+    for m in _SCANNER.finditer(text):
+        kind = m.lastgroup
+        if kind == "word":
+            d = base + timedelta(days=_WORD_DAYS[m.group()])
+            found.append(TimeExpr("day", d, d, "exact", m.span(), _RANK[m.group()]))
+            continue
+        try:
+            expr = _build(kind, [m.group(i) for i in _GROUPS[kind]], base, m.span())
+        except ValueError:
+            continue  # e.g. "2월 30일"
+        if expr is not None:
+            found.append(expr)
+    return tuple(found)
+
+
+def _pick(exprs: tuple[TimeExpr, ...], base: date) -> Tuple[date, str]:
+    ranked = [e for e in exprs if e.rank is not None]
+    if not ranked:
+        return base, "failed"
+    best = min(ranked, key=lambda e: e.rank)
+    if best.kind in ("week", "weekend"):
+        # "지난 주(말)"/"다음 주(말)" as a single date: the same weekday that week
+        return base + timedelta(days=7 if best.rank == _RANK["week_next"] else -7), "exact"
+    if best.kind == "md":
+        # a year mentioned elsewhere ("2025년 ... 5월 3일") applies to the date
+        year = next((e.start.year for e in exprs if e.kind == "y"), None)
+        if year is not None:
+            try:
+                return best.start.replace(year=year), "exact"
+            except ValueError:
+                pass
+    return best.start, best.status
+
+
+def parse_batch(texts: Iterable[str], base: date | None = None) -> list[Tuple[date, str]]:
+    """:meth:`TimeParser.parse` for many questions against one base date."""
+    base = base or datetime.now().date()
+    return [_pick(scan(t.strip(), base), base) for t in texts]
+
+
 class TimeParser:
-    """Parse various Korean time expressions."""
+    """Parse various Korean time expressions.
+
+    Thin wrapper over the memoized :func:`scan`; parsing the same question
+    again (e.g. from several handlers) costs a cache lookup.
+    """
 
     def __init__(self, text: str):
         self.text = text.strip()
 
+    def expressions(self, base: date | None = None) -> tuple[TimeExpr, ...]:
+        """All expressions in the text: single days, weeks, months, ranges."""
+        return scan(self.text, base or datetime.now().date())
+
+    def parse_week(self, base: date | None = None) -> Tuple[date, date] | None:
+        """Return (Monday, Sunday) for "이번 주", "다음 주" or "지난 주".
+
+        Returns ``None`` when no week is mentioned or a weekday or weekend
+        narrows the question down (e.g. "다음 주 월요일", "다음 주말").
+        """
+        for expr in self.expressions(base):
+            if expr.kind == "week":
+                return expr.start, expr.end
+        return None
+
     def parse(self, base: date | None = None) -> Tuple[date, str]:
-        base = base or datetime.now().date()
-        q = self.text
-
-        if "오늘" in q:
-            return base, "exact"
-        if "내일" in q:
-            return base + timedelta(days=1), "exact"
-        if "모레" in q:
-            return base + timedelta(days=2), "exact"
-        if "어제" in q:
-            return base - timedelta(days=1), "exact"
-
-        m = re.search(r"(\d+)일\s*후", q)
-        if m:
-            return base + timedelta(days=int(m.group(1))), "exact"
-        m = re.search(r"(\d+)일\s*전", q)
-        if m:
-            return base - timedelta(days=int(m.group(1))), "exact"
-
-        m = re.search(r"지난\s*([월화수목금토일])요일", q)
-        if m:
-            target = DAY_MAP[m.group(1)]
-            diff = (base.weekday() - target + 7) % 7 or 7
-            return base - timedelta(days=diff), "exact"
-        m = re.search(r"다음\s*주\s*([월화수목금토일])요일", q)
-        if m:
-            target = DAY_MAP[m.group(1)]
-            diff = (target - base.weekday() + 7) % 7
-            return base + timedelta(days=7 + diff), "exact"
-
-        if "지난 주" in q:
-            return base - timedelta(days=7), "exact"
-        if "다음 주" in q:
-            return base + timedelta(days=7), "exact"
-
-        m = re.search(r"(20\d{2})년\s*(\d{1,2})월\s*(\d{1,2})일", q)
-        if m:
-            y,mn,d = map(int, m.groups())
-            return date(y,mn,d), "exact"
-        m = re.search(r"(\d{1,2})월\s*(\d{1,2})일", q)
-        if m:
-            year_match = re.search(r"(20\d{2})년", q)
-            y = int(year_match.group(1)) if year_match else base.year
-            mn,d = map(int, m.groups())
-            return date(y,mn,d), "exact"
-        m = re.search(r"(20\d{2})년\s*(\d{1,2})월", q)
-        if m:
-            y,mn = map(int, m.groups())
-            return date(y,mn,1), "month"
-        m = re.search(r"(\d{1,2})월", q)
-        if m:
-            mn = int(m.group(1))
-            return date(base.year,mn,1), "month"
-        m = re.search(r"(20\d{2})년", q)
-        if m:
-            y = int(m.group(1))
-            return date(y,1,1), "year"
+        """Return the date the question is about and its granularity.
 
-        return base, "failed"
+        The status is ``exact``, ``month``, ``year`` or ``failed`` (``base``
+        is returned when nothing is recognized).
+        """
+        base = base or datetime.now().date()
+        return _pick(self.expressions(base), base)
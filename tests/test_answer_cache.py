@@ -0,0 +1,82 @@
+from datetime import datetime
+
+import pytest
+
+import src.answers.answer_cache as answer_cache
+from src.answers import answer_budget, mark_stale
+from src.answers.answer_cache import AnswerCache, answer_key, cached_answer
+from src.crawlers.store import LocalStore
+
+MEALS = 3
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = LocalStore(tmp_path / "local.db")
+    monkeypatch.setattr(answer_cache, "get_store", lambda: store)
+    monkeypatch.setattr(answer_cache, "_cache", AnswerCache(max_entries=16, ttl=300))
+    return store
+
+
+def _today(monkeypatch, day: str) -> None:
+    class Today(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.strptime(day, "%Y%m%d")
+
+    monkeypatch.setattr(answer_cache, "datetime", Today)
+
+
+class Handler:
+    def __init__(self, stale: bool = False):
+        self.calls = 0
+        self.stale = stale
+
+    def __call__(self, question: str) -> str:
+        self.calls += 1
+        if self.stale:
+            mark_stale("meals")
+        return f"answer {self.calls}"
+
+
+def test_relative_date_questions_key_per_day(store, monkeypatch):
+    _today(monkeypatch, "20250304")
+    tuesday = answer_key(MEALS, "내일 학식 뭐야?")
+    assert tuesday == answer_key(MEALS, "내일  학식 뭐야")  # spacing and punctuation folded
+    _today(monkeypatch, "20250305")
+    assert answer_key(MEALS, "내일 학식 뭐야?") != tuesday
+
+    handler = Handler()
+    with answer_budget(5):
+        assert cached_answer(MEALS, "내일 학식 뭐야?", handler) == "answer 1"
+    _today(monkeypatch, "20250306")
+    with answer_budget(5):
+        assert cached_answer(MEALS, "내일 학식 뭐야?", handler) == "answer 2"
+
+
+def test_version_bump_invalidates(store, monkeypatch):
+    _today(monkeypatch, "20250304")
+    handler = Handler()
+    with answer_budget(5):
+        assert cached_answer(MEALS, "오늘 학식", handler) == "answer 1"
+        assert cached_answer(MEALS, "오늘 학식", handler) == "answer 1"
+    store.replace_meals("20250304", [{"cafeteria": 2, "meal": "중식", "who": "학생", "menu": "우동"}], "2025-03-04")
+    with answer_budget(5):
+        assert cached_answer(MEALS, "오늘 학식", handler) == "answer 2"
+    assert handler.calls == 2
+
+
+def test_stale_or_unbudgeted_answers_are_not_cached(store, monkeypatch):
+    _today(monkeypatch, "20250304")
+    stale = Handler(stale=True)
+    with answer_budget(5) as budget:
+        cached_answer(MEALS, "오늘 학식", stale)
+        assert not budget.fresh
+    with answer_budget(5):
+        cached_answer(MEALS, "오늘 학식", stale)
+    assert stale.calls == 2
+
+    direct = Handler()
+    cached_answer(MEALS, "오늘 학식", direct)
+    cached_answer(MEALS, "오늘 학식", direct)
+    assert direct.calls == 2
@@ -0,0 +1,49 @@
+from datetime import datetime
+
+import requests
+
+import src.crawlers.archive as archive_module
+from src.crawlers.archive import BASE_SEGMENT, ResponseArchive
+
+
+def _append(monkeypatch, archive: ResponseArchive, day: str, url: str, body: bytes) -> None:
+    """Archive ``body`` for ``url`` as if fetched at noon on ``day``."""
+    fetched = datetime.strptime(day, "%Y%m%d").replace(hour=12)
+
+    class FixedNow(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return fetched
+
+    resp = requests.Response()
+    resp._content = body
+    resp.status_code = 200
+    resp.url = url
+    archive._day = day  # opening the day's segment must not prune here
+    monkeypatch.setattr(archive_module, "datetime", FixedNow)
+    archive.append("Crawler", {}, url, None, resp)
+    monkeypatch.undo()
+
+
+def test_prune_keeps_newest_record_of_each_request(tmp_path, monkeypatch):
+    archive = ResponseArchive(tmp_path, retention_days=30)
+    _append(monkeypatch, archive, "20250101", "http://a", b"old a")
+    _append(monkeypatch, archive, "20250102", "http://a", b"new a")
+    _append(monkeypatch, archive, "20250103", "http://b", b"stable b")
+    _append(monkeypatch, archive, "20250301", "http://c", b"recent c")
+
+    removed = archive.prune(datetime(2025, 3, 10))
+
+    assert len(removed) == 3
+    assert (tmp_path / BASE_SEGMENT).exists()
+    latest = archive.latest()[("Crawler", "{}")]
+    assert sorted(rec["url"] for rec in latest.values()) == ["http://a", "http://b", "http://c"]
+    assert {rec["fetched_at"][:10] for rec in latest.values()} == {"2025-01-02", "2025-01-03", "2025-03-01"}
+    assert sum(1 for _ in archive.iter_records()) == 3  # "old a" was dropped
+
+    # a page unchanged for longer than the window stays re-parseable
+    archive.prune(datetime(2025, 6, 1))
+    assert sorted(rec["url"] for rec in archive.latest()[("Crawler", "{}")].values()) == [
+        "http://a", "http://b", "http://c",
+    ]
+    assert list(tmp_path.glob("*.jsonl.gz")) == [tmp_path / BASE_SEGMENT]
@@ -0,0 +1,47 @@
+import pytest
+import torch
+from tokenizers import Tokenizer, models, pre_tokenizers
+from transformers import BertConfig, BertForSequenceClassification, PreTrainedTokenizerFast
+
+from src.classifier import load_classifier
+
+QUESTIONS = ["졸업 요건 알려줘", "내일 학식 뭐야", "셔틀 버스 시간표", "학사 일정", "공지 있어?"]
+
+
+@pytest.fixture(scope="module")
+def model_dir(tmp_path_factory):
+    """A tiny randomly initialised BERT classifier with a whitespace tokenizer."""
+    path = tmp_path_factory.mktemp("classifier")
+    words = sorted({w for q in QUESTIONS for w in q.split()})
+    vocab = {tok: i for i, tok in enumerate(["[PAD]", "[UNK]", "[CLS]", "[SEP]", *words])}
+    backend = Tokenizer(models.WordLevel(vocab, unk_token="[UNK]"))
+    backend.pre_tokenizer = pre_tokenizers.WhitespaceSplit()
+    tokenizer = PreTrainedTokenizerFast(
+        tokenizer_object=backend, pad_token="[PAD]", unk_token="[UNK]", model_max_length=32
+    )
+    tokenizer.save_pretrained(path)
+
+    torch.manual_seed(0)
+    config = BertConfig(
+        vocab_size=len(vocab), hidden_size=32, num_hidden_layers=2, num_attention_heads=2,
+        intermediate_size=64, max_position_embeddings=32, num_labels=5,
+    )
+    BertForSequenceClassification(config).eval().save_pretrained(path)
+    return path
+
+
+def test_onnx_backend_matches_torch(model_dir):
+    pytest.importorskip("onnxruntime")
+    reference = load_classifier("torch", model_dir)
+    onnx = load_classifier("onnx", model_dir)
+
+    assert (model_dir / "model.onnx").exists()
+    assert onnx.model is None  # torch weights are released after export
+    expected = reference._logits(reference._inputs(QUESTIONS))
+    assert torch.allclose(onnx._logits(onnx._inputs(QUESTIONS)), expected, atol=1e-4)
+    assert onnx.predict_batch(QUESTIONS) == reference.predict_batch(QUESTIONS)
+
+    # the exported graph is reused
+    mtime = (model_dir / "model.onnx").stat().st_mtime
+    assert load_classifier("onnx", model_dir).predict_batch(QUESTIONS) == reference.predict_batch(QUESTIONS)
+    assert (model_dir / "model.onnx").stat().st_mtime == mtime
@@ -0,0 +1,73 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Counts how often each crawler module's code runs, in a fresh interpreter.
+SCRIPT = r"""
+import importlib.machinery
+import json
+import sys
+
+counts = {}
+
+
+class CountingFinder:
+    def find_spec(self, name, path, target=None):
+        if not name.startswith("src.crawlers."):
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(name, path)
+        if spec is not None:
+            exec_module = spec.loader.exec_module
+
+            def counted(module, exec_module=exec_module):
+                counts[name] = counts.get(name, 0) + 1
+                exec_module(module)
+
+            spec.loader.exec_module = counted
+        return spec
+
+
+sys.meta_path.insert(0, CountingFinder())
+
+import src.crawlers
+import src.scheduler
+from src.answers import dept_resolver
+from src.crawlers.registry import CRAWLERS, crawler_attr, get_crawler
+
+steps = {"import": dict(counts)}
+get_crawler("meals")
+get_crawler("meals")
+crawler_attr("meals", "crawl_meals")
+steps["meals"] = dict(counts)
+from src.crawlers import NoticeCrawler
+for name in CRAWLERS:
+    get_crawler(name)
+steps["all"] = dict(counts)
+print(json.dumps(steps))
+"""
+
+CRAWLER_MODULES = {
+    "src.crawlers.meals",
+    "src.crawlers.notices",
+    "src.crawlers.academic_calendar",
+    "src.crawlers.shuttle_bus",
+    "src.crawlers.graduation_req",
+}
+
+
+def _run() -> dict:
+    out = subprocess.run(
+        [sys.executable, "-c", SCRIPT], cwd=ROOT, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def test_crawler_modules_execute_once_and_only_on_request():
+    steps = _run()
+    assert not CRAWLER_MODULES & steps["import"].keys()
+    assert {m for m in CRAWLER_MODULES if m in steps["meals"]} == {"src.crawlers.meals"}
+    assert steps["meals"]["src.crawlers.meals"] == 1
+    assert all(steps["all"].get(m) == 1 for m in CRAWLER_MODULES)
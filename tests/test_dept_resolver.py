@@ -0,0 +1,53 @@
+from types import SimpleNamespace
+
+import src.answers.dept_resolver as dept_resolver
+from src.answers.dept_resolver import DeptResolver, get_resolver
+
+NAMES = ["컴퓨터융합학부", "정치외교학과", "국어국문학과", "물리학과", "공과대학"]
+
+
+def test_alias_resolves_to_official_name():
+    resolver = DeptResolver(NAMES)
+    assert resolver.resolve("컴공") == ["컴퓨터융합학부"]
+    assert resolver.resolve("정외과") == ["정치외교학과"]
+    assert resolver.mention("컴공 공지 알려줘") == "컴공"
+
+
+def test_fuzzy_match_and_threshold():
+    resolver = DeptResolver(NAMES, aliases={})
+    # no alias table: "정외과" shares no bigram with the official name
+    assert resolver.resolve("정외과") == []
+    assert resolver.resolve("정치 외교과") == ["정치외교학과"]
+    assert resolver.resolve("국문학과") == ["국어국문학과"]
+    # only "학과" in common: below MIN_SCORE
+    assert resolver.resolve("학과행사") == []
+    assert resolver.resolve("정치 외교과", among={"물리학과"}) == []
+
+
+def test_get_resolver_rebuilds_after_stamp_interval(monkeypatch, tmp_path):
+    clock = [1000.0]
+    stamp = ["v1"]
+    depts = [["컴퓨터융합학부"]]
+    store = SimpleNamespace(requirement_depts=lambda: depts[0], notice_depts=lambda: [])
+    monkeypatch.setattr(dept_resolver, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+    monkeypatch.setattr(dept_resolver, "_stamp", lambda: stamp[0])
+    monkeypatch.setattr(dept_resolver, "get_store", lambda: store)
+    monkeypatch.setattr(dept_resolver, "LINKS_FILE", tmp_path / "links.txt")
+    monkeypatch.setattr(dept_resolver, "_resolver", None)
+    monkeypatch.setattr(dept_resolver, "_checked_at", 0.0)
+
+    first = get_resolver()
+    assert first.resolve("컴퓨터융합학부") == ["컴퓨터융합학부"]
+
+    depts[0] = ["컴퓨터융합학부", "인공지능학과"]
+    stamp[0] = "v2"
+    clock[0] += dept_resolver.STAMP_INTERVAL / 2
+    assert get_resolver() is first  # sources not checked yet
+
+    clock[0] += dept_resolver.STAMP_INTERVAL
+    second = get_resolver()
+    assert second is not first
+    assert second.resolve("인공지능과") == ["인공지능학과"]
+
+    clock[0] += dept_resolver.STAMP_INTERVAL * 2
+    assert get_resolver() is second  # unchanged stamp keeps the resolver
@@ -0,0 +1,51 @@
+from src.crawlers.graduation_req import _to_frame, clean_requirements
+
+CREDITS_14 = ["8", "9", "6", "13", "36", "12", "27", "39", "78", "16"]
+
+
+def test_layout_14_fills_department_down():
+    rows = [
+        ["학과명", "구분", *[None] * 10, "비고"],
+        ["국어국문\n학과", "단수전공자", *CREDITS_14, None],
+        [None, "복수전공자", *CREDITS_14, None],
+    ]
+    records = clean_requirements(_to_frame(rows, 2021))
+    assert [(r["학과명"], r["구분"]) for r in records] == [
+        ("국어국문학과", "단수전공자"),
+        ("국어국문학과", "복수전공자"),
+    ]
+    assert records[0]["졸업 학점(총계)"] == "130"  # 36 + 78 + 16
+    assert all("대학명" in r and r["대학명"] is None for r in records)
+
+
+def test_layout_16_keeps_merged_college_once():
+    rows = [
+        ["대학명", "학과명", "구분", *[None] * 10, "졸업학점", "비고"],
+        ["공과대학\n공과대학", "기계공학부", "단수전공자", *CREDITS_14[:-1], "16", "130", None],
+        [None, "건축학과", "단수전공자", *CREDITS_14[:-1], "16", "130", None],
+        ["인문대학\n인문대학\n인문대학", "사학과", "단수전공자", *CREDITS_14[:-1], "16", "130", None],
+    ]
+    records = clean_requirements(_to_frame(rows, 2023))
+    assert [(r["대학명"], r["학과명"]) for r in records] == [
+        ("공과대학", "기계공학부"),
+        ("공과대학", "건축학과"),
+        ("인문대학", "사학과"),
+    ]
+    assert records[0]["졸업 학점(총계)"] == "130"
+
+
+def test_layout_19_keeps_merged_college_once():
+    credits = ["3", "3", "3", "3", "6", "6", "6", "30", "12", "27", "39", "78", "22", "130"]
+    rows = [
+        ["대학명", "학과명", "구분", *[None] * 14, "비고"],
+        ["공과대학\n공과대학", "컴퓨터융합\n학부", "단수전공자", *credits, None],
+        [None, None, "복수전공자", *credits, None],
+        ["학위명", None, None, *[None] * 15],
+        ["공과대학", "무시되는 학과", "단수전공자", *credits, None],
+    ]
+    records = clean_requirements(_to_frame(rows, 2025))
+    assert [(r["대학명"], r["학과명"], r["구분"]) for r in records] == [
+        ("공과대학", "컴퓨터융합학부", "단수전공자"),
+        ("공과대학", "컴퓨터융합학부", "복수전공자"),
+    ]
+    assert records[0]["year"] == 2025
@@ -0,0 +1,32 @@
+import threading
+
+from src.utils.micro_batch import MicroBatcher
+
+
+def test_cancelled_caller_does_not_stop_the_worker():
+    release = threading.Event()
+
+    def batch_fn(items):
+        release.wait(5)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(batch_fn, max_batch=1, max_wait=0, workers=1)
+    first = batcher.submit(1)  # occupies the only worker
+    cancelled = batcher.submit(2)
+    assert cancelled.cancel()
+    release.set()
+
+    assert first.result(timeout=5) == 2
+    assert batcher.submit(3).result(timeout=5) == 6
+    assert batcher.stats()["items"] == 2
+
+
+def test_batch_errors_reach_every_caller():
+    def batch_fn(items):
+        raise ValueError("boom")
+
+    batcher = MicroBatcher(batch_fn, max_batch=4, max_wait=0.01)
+    futures = [batcher.submit(i) for i in range(3)]
+    for fut in futures:
+        assert isinstance(fut.exception(timeout=5), ValueError)
+    assert batcher.submit(0).exception(timeout=5) is not None
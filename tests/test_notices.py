@@ -0,0 +1,86 @@
+import csv
+
+import requests
+
+import src.crawlers.notices as notices
+from src.crawlers.http_cache import JsonCache, ValidatorCache
+from src.crawlers.notices import FIELDNAMES, NoticeCrawler
+
+URL = "https://example.ac.kr/notice"
+EMPTY = "<html><body><p>점검 중입니다</p></body></html>"
+BOARD = (
+    "<html><body><table><tbody>"
+    "<tr><td><a href='/view/1'>수강신청 안내</a></td><td>2025.03.02</td></tr>"
+    "</tbody></table></body></html>"
+)
+
+
+def _crawler(tmp_path, monkeypatch, pages, **kwargs):
+    """NoticeCrawler serving ``pages`` in order, with caches under ``tmp_path``."""
+    cache = ValidatorCache(tmp_path / "validators.json")
+    monkeypatch.setattr(NoticeCrawler, "validator_cache", property(lambda self: cache))
+    monkeypatch.setattr(notices, "_profiles", JsonCache(tmp_path / "profiles.json"))
+    monkeypatch.setattr(notices.settings, "archive_responses", False)
+
+    kwargs.setdefault("incremental", False)
+    crawler = NoticeCrawler(tmp_path / "notices", max_workers=1, **kwargs)
+    # the board was crawled before, so its pages are revalidated
+    compact = crawler.out_dir / crawler._compact_name("공대", "컴공")
+    if not compact.exists():
+        compact.write_text("", encoding="utf-8")
+    bodies = iter(pages)
+
+    def get(url, params=None, archive=True, **kwargs):
+        resp = requests.Response()
+        resp._content = next(bodies).encode("utf-8")
+        resp.status_code = 200
+        resp.url = url
+        resp.headers["content-type"] = "text/html; charset=utf-8"
+        return resp
+
+    crawler.get = get
+    return crawler, cache
+
+
+def test_failed_parse_does_not_store_validator(tmp_path, monkeypatch):
+    crawler, cache = _crawler(tmp_path, monkeypatch, [EMPTY, EMPTY, BOARD, BOARD])
+    link = ("공대", "컴공", URL)
+
+    assert crawler._scrape(link) == []
+    crawler.commit_validators()
+    assert crawler.stats.failed == 1
+    assert cache.get(URL) is None
+
+    # the same page is parsed again instead of being reported unchanged
+    assert crawler._scrape(link) == []
+    assert crawler.stats.failed == 2
+    assert crawler.stats.not_modified == 0
+
+    rows = crawler._scrape(link)
+    crawler.commit_validators()
+    assert [r["title"] for r in rows] == ["수강신청 안내"]
+    assert cache.get(URL)["sha256"]
+
+    assert crawler._scrape(link) == []
+    assert crawler.stats.not_modified == 1
+
+
+def test_force_ignores_validators_and_known_notices(tmp_path, monkeypatch):
+    link = ("공대", "컴공", URL)
+    crawler, _ = _crawler(tmp_path, monkeypatch, [BOARD], incremental=True)
+    rows = crawler._scrape(link)
+    crawler.commit_validators()
+    with (crawler.out_dir / crawler._compact_name("공대", "컴공")).open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    # incremental: the unchanged page is skipped
+    crawler, _ = _crawler(tmp_path, monkeypatch, [BOARD], incremental=True)
+    assert crawler._scrape(link) == []
+    assert crawler.stats.not_modified == 1
+
+    # forced: refetched and every notice returned, known ones included
+    crawler, _ = _crawler(tmp_path, monkeypatch, [BOARD], incremental=True, force=True)
+    assert [r["title"] for r in crawler._scrape(link)] == ["수강신청 안내"]
+    assert crawler.stats.not_modified == 0
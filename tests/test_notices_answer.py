@@ -0,0 +1,40 @@
+from src.answers.notices_answer import NoticeIndex
+
+ROWS = [
+    {"title": "2025학년도 1학기 수강신청 안내", "dept": "컴퓨터융합학부", "posted_at": "2025-02-10"},
+    {"title": "수강신청 정정 기간 안내", "dept": "컴퓨터융합학부", "posted_at": "2025-03-04"},
+    {"title": "수강신청 유의사항", "dept": "정치외교학과", "posted_at": "2025-03-05"},
+    {"title": "장학금 신청 안내", "dept": "컴퓨터융합학부", "posted_at": "2025-03-06"},
+    # every bigram of "수강신청", but not the word itself
+    {"title": "강신청 수강 후기", "dept": "컴퓨터융합학부", "posted_at": "2025-03-07"},
+    {"title": "수강신청 문의", "dept": "컴퓨터융합학부", "posted_at": ""},
+]
+
+
+def _titles(rows):
+    return [r["title"] for r in rows]
+
+
+def test_keyword_and_window_hits_newest_first():
+    index = NoticeIndex(ROWS)
+    hits = index.search(["수강신청"], since="2025-03-01", until="2025-03-31")
+    assert _titles(hits) == ["수강신청 유의사항", "수강신청 정정 기간 안내"]
+
+    hits = index.search(["수강신청"], dept="컴퓨터융합학부", since="2025-02-01", until="2025-03-31")
+    assert _titles(hits) == ["수강신청 정정 기간 안내", "2025학년도 1학기 수강신청 안내"]
+    assert _titles(index.search(["수강신청"], k=1)) == ["수강신청 유의사항"]
+
+
+def test_bigram_match_is_confirmed_by_substring():
+    index = NoticeIndex(ROWS)
+    assert "강신청 수강 후기" not in _titles(index.search(["수강신청"]))
+    assert _titles(index.search(["수강 후기"])) == ["강신청 수강 후기"]
+
+
+def test_empty_window_returns_nothing():
+    index = NoticeIndex(ROWS)
+    assert index.search(["수강신청"], since="2025-04-01", until="2025-04-30") == []
+    assert index.search(since="2025-03-08", until="2025-03-31") == []
+    assert index.search(dept="컴퓨터융합학부", since="2024-01-01", until="2024-12-31") == []
+    # undated rows only match an open window
+    assert _titles(index.search(["문의"])) == ["수강신청 문의"]
@@ -0,0 +1,60 @@
+import time
+
+import src.crawlers.store as store_module
+from src.answers import recent_changes
+from src.crawlers.store import LocalStore
+
+
+def _meal(menu, cafeteria=2, meal="중식"):
+    return {"code": "OCL03.02", "cafeteria": cafeteria, "meal": meal, "who": "학생", "menu": menu}
+
+
+def _notice(i, dept="컴퓨터융합학부"):
+    return {"id": f"n{i}", "college": "공과대학", "dept": dept, "title": f"공지 {i}", "posted_at": "2025.03.04"}
+
+
+def test_only_real_changes_are_logged(tmp_path):
+    store = LocalStore(tmp_path / "local.db")
+    day = "20250304"
+
+    # the first snapshot of a scope is the baseline
+    store.replace_meals(day, [_meal("제육볶음"), _meal("된장찌개", cafeteria=3)], "2025-03-04")
+    assert store.changes("meals") == []
+
+    # unchanged save
+    store.replace_meals(day, [_meal("제육볶음"), _meal("된장찌개", cafeteria=3)], "2025-03-05")
+    assert store.changes("meals") == []
+
+    # one cell modified, one inserted
+    store.replace_meals(
+        day, [_meal("제육볶음"), _meal("김치찌개", cafeteria=3), _meal("토스트", meal="조식")], "2025-03-05"
+    )
+    changes = {(c["change"], c["menu"]) for c in store.changes("meals", scope=day)}
+    assert changes == {("removed", "된장찌개"), ("added", "김치찌개"), ("added", "토스트")}
+    assert store.changes("meals", scope="20250305") == []
+
+    # notices: only unseen ids of a known department are added
+    store.upsert_notices([_notice(1), _notice(2)])
+    store.upsert_notices([_notice(1), _notice(2)])
+    assert store.changes("notices") == []
+    store.upsert_notices([_notice(2), _notice(3)])
+    assert [(c["change"], c["title"]) for c in store.changes("notices")] == [("added", "공지 3")]
+
+
+def test_recent_changes_reads_the_window(tmp_path, monkeypatch):
+    store = LocalStore(tmp_path / "local.db")
+    monkeypatch.setattr(store_module, "get_store", lambda: store)
+    store.replace_meals("20250304", [_meal("제육볶음")], "2025-03-04")
+    store.replace_meals("20250304", [_meal("돈까스")], "2025-03-05")
+    store.replace_meals("20250305", [_meal("우동")], "2025-03-05")
+
+    recent = recent_changes("meals")
+    assert sorted((c["change"], c["menu"]) for c in recent) == [("added", "돈까스"), ("removed", "제육볶음")]
+    assert all(c["scope"] == "20250304" for c in recent)
+    assert recent_changes("meals", "20250305") == []
+    assert recent_changes("notices") == []
+
+    # entries older than the change window are not returned
+    with store._connect() as conn:
+        conn.execute("UPDATE changes SET changed_at = ?", (int(time.time()) - 30 * 24 * 3600,))
+    assert recent_changes("meals") == []
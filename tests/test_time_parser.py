@@ -0,0 +1,81 @@
+import json
+import re
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.utils.time_parser import DAY_MAP, TimeParser
+
+DATA = Path(__file__).resolve().parents[1] / "data"
+BASES = [date(2025, 3, 3) + timedelta(days=i) for i in range(7)] + [date(2024, 12, 30)]
+WEEKEND = ["다음 주말 학식 메뉴", "지난 주말 공지 알려줘", "이번 주말 셔틀 운행해?", "지난 주말에 올라온 학과 공지"]
+
+
+def legacy_parse(q: str, base: date) -> tuple[date, str]:
+    """The rule chain ``TimeParser.parse`` replaced, kept as the reference."""
+    q = q.strip()
+    for word, days in (("오늘", 0), ("내일", 1), ("모레", 2), ("어제", -1)):
+        if word in q:
+            return base + timedelta(days=days), "exact"
+    m = re.search(r"(\d+)일\s*후", q)
+    if m:
+        return base + timedelta(days=int(m.group(1))), "exact"
+    m = re.search(r"(\d+)일\s*전", q)
+    if m:
+        return base - timedelta(days=int(m.group(1))), "exact"
+    m = re.search(r"지난\s*([월화수목금토일])요일", q)
+    if m:
+        diff = (base.weekday() - DAY_MAP[m.group(1)] + 7) % 7 or 7
+        return base - timedelta(days=diff), "exact"
+    m = re.search(r"다음\s*주\s*([월화수목금토일])요일", q)
+    if m:
+        diff = (DAY_MAP[m.group(1)] - base.weekday() + 7) % 7
+        return base + timedelta(days=7 + diff), "exact"
+    if "지난 주" in q:
+        return base - timedelta(days=7), "exact"
+    if "다음 주" in q:
+        return base + timedelta(days=7), "exact"
+    m = re.search(r"(20\d{2})년\s*(\d{1,2})월\s*(\d{1,2})일", q)
+    if m:
+        y, mn, d = map(int, m.groups())
+        return date(y, mn, d), "exact"
+    m = re.search(r"(\d{1,2})월\s*(\d{1,2})일", q)
+    if m:
+        year = re.search(r"(20\d{2})년", q)
+        mn, d = map(int, m.groups())
+        return date(int(year.group(1)) if year else base.year, mn, d), "exact"
+    m = re.search(r"(20\d{2})년\s*(\d{1,2})월", q)
+    if m:
+        y, mn = map(int, m.groups())
+        return date(y, mn, 1), "month"
+    m = re.search(r"(\d{1,2})월", q)
+    if m:
+        return date(base.year, int(m.group(1)), 1), "month"
+    m = re.search(r"(20\d{2})년", q)
+    if m:
+        return date(int(m.group(1)), 1, 1), "year"
+    return base, "failed"
+
+
+def _questions() -> list[str]:
+    paths = [DATA / "test_cls.json", DATA / "test_chat.json", DATA / "test_realtime.json"]
+    questions = []
+    for path in [*paths, *sorted((DATA / "question").glob("*.json"))]:
+        for item in json.loads(path.read_text(encoding="utf-8")):
+            questions.append(item.get("question") or item.get("user"))
+    return [q for q in questions if q]
+
+
+@pytest.mark.parametrize("base", BASES, ids=str)
+def test_parse_matches_legacy_rules(base):
+    for q in _questions() + WEEKEND:
+        assert TimeParser(q).parse(base) == legacy_parse(q, base), q
+
+
+def test_weekend_is_not_a_week_range():
+    base = date(2025, 3, 5)  # Wednesday
+    assert TimeParser("다음 주말 학식").parse_week(base) is None
+    assert TimeParser("다음 주 학식").parse_week(base) == (date(2025, 3, 10), date(2025, 3, 16))
+    (weekend,) = TimeParser("지난 주말 공지").expressions(base)
+    assert (weekend.kind, weekend.start, weekend.end) == ("weekend", date(2025, 3, 1), date(2025, 3, 2))
@@ -12,6 +12,9 @@ ROOT_DIR = Path(__file__).resolve().parent.parent
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from src.answers import answer_budget
+from src.answers.answer_cache import cached_answer
+from src.readiness import get_readiness
 from src.answers import (
     academic_calendar_answer,
     shuttle_bus_answer,
@@ -46,11 +49,14 @@ ANSWER_HANDLERS = {
     4: shuttle_bus_answer.generate_answer,
 }
 
-def get_rule_based_response(label: int, question_text: str) -> str:
+def get_rule_based_response(label: int, question_text: str) -> tuple[str, bool]:
+    """Return the answer and whether it was built from fresh data."""
     handler = ANSWER_HANDLERS.get(label)
     if handler:
-        return handler(question_text)
-    return '적절한 답변을 찾지 못했습니다.'
+        with answer_budget() as budget:
+            response = cached_answer(label, question_text, handler)
+        return response, budget.fresh
+    return '적절한 답변을 찾지 못했습니다.', True
 
 
 def append_qa(question: str, answer: str) -> None:
@@ -114,8 +120,9 @@ def check_answer(question_id):
 
         # Generate answer only once and persist it
         if 'response' not in answer_data:
-            response = get_rule_based_response(label, original_question)
+            response, fresh = get_rule_based_response(label, original_question)
             answer_data['response'] = response
+            answer_data['fresh'] = fresh
             answer_data['answered_at'] = datetime.now().isoformat()
             f.seek(0)
             json.dump(answer_data, f, ensure_ascii=False, indent=4)
@@ -123,8 +130,9 @@ def check_answer(question_id):
             append_qa(original_question, response)
         else:
             response = answer_data['response']
+            fresh = answer_data.get('fresh', True)
 
-    return jsonify({'status': 'completed', 'label': label, 'response': response})
+    return jsonify({'status': 'completed', 'label': label, 'response': response, 'fresh': fresh})
 
 # WebSocket handlers
 @socketio.on('ask_question')
@@ -162,8 +170,9 @@ def wait_for_answer(question_id: str, sid: str) -> None:
         original_question = answer_data.get('original_question', '')
 
         if 'response' not in answer_data:
-            response = get_rule_based_response(label, original_question)
+            response, fresh = get_rule_based_response(label, original_question)
             answer_data['response'] = response
+            answer_data['fresh'] = fresh
             answer_data['answered_at'] = datetime.now().isoformat()
             f.seek(0)
             json.dump(answer_data, f, ensure_ascii=False, indent=4)
@@ -171,12 +180,16 @@ def wait_for_answer(question_id: str, sid: str) -> None:
             append_qa(original_question, response)
         else:
             response = answer_data['response']
+            fresh = answer_data.get('fresh', True)
 
     socketio.emit(
         'answer_response',
-        {'label': label, 'response': response, 'question_id': question_id},
+        {'label': label, 'response': response, 'fresh': fresh, 'question_id': question_id},
         to=sid,
     )
 
 if __name__ == '__main__':
+    # read the data manifest once; missing sources are built in the background.
+    # Kept under the main guard: spawned worker processes re-import this module
+    get_readiness().check()
     socketio.run(app, host='0.0.0.0', port=5000, debug=True)